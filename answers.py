@@ -2,14 +2,19 @@ import pygame
 import random
 
 import random
+from fractions import Fraction
 
 def answer_options(correct_answer):
-    options = [correct_answer]
-    
-    while len(options) < 4:
-        wrong_answer = correct_answer + random.randint(0, 105)
-        if wrong_answer not in options and wrong_answer >= 0:
-            options.append(wrong_answer)
+    # Three distinct wrong answers above the correct one: 1 to 105 whole
+    # steps for whole numbers, 1 to 10 steps of 1/denominator for fractions
+    correct_answer = Fraction(correct_answer)
+    if correct_answer.denominator == 1:
+        correct_answer = correct_answer.numerator
+        wrong_answers = [correct_answer + k for k in random.sample(range(1, 106), 3)]
+    else:
+        step = Fraction(1, correct_answer.denominator)
+        wrong_answers = [correct_answer + k * step for k in random.sample(range(1, 11), 3)]
+    options = [correct_answer] + wrong_answers
 
     random.shuffle(options) 
     return options
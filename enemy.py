@@ -12,11 +12,15 @@ Includes animation handling, movement patterns, and collision detection.
 
 import pygame
 import math
-from game.constants import ENEMY_SPEED, SCREEN_WIDTH
+from game.constants import ENEMY_SPEED, SCREEN_WIDTH, SCREEN_HEIGHT
 from game.resource_manager import ResourceManager
+from game.interpolation import Interpolated
 from game.constants import current_background
 
-class Enemy(pygame.sprite.Sprite):
+class Enemy(Interpolated, pygame.sprite.Sprite):
+    # Drawing scale of each enemy type's animation frames
+    SCALES = {'whale': 1.4, 'bird': 0.6, 'fireball': 1.2, 'symbol': 2.0}
+
     def __init__(self, y_pos, current_background):
         """
         Initialize enemy sprite with type-specific properties
@@ -25,49 +29,60 @@ class Enemy(pygame.sprite.Sprite):
             current_background (int): Current game stage (0-3)
         """
         pygame.sprite.Sprite.__init__(self)
+        self.reset(y_pos, current_background)
+
+    def reset(self, y_pos, current_background):
+        """
+        Reset enemy type, position and animation so a pooled sprite can be reused
+        Args:
+            y_pos (int): Initial vertical position
+            current_background (int): Current game stage (0-3)
+        """
+        self.prev_pos = None
         # Set enemy properties based on current game stage
         if current_background == 0:  # Ocean stage
             self.enemy_type = 'whale'
             frames = ResourceManager.whale_frames
-            self.scale = 1.4
+            self.scale = self.SCALES['whale']
             self.speed = ENEMY_SPEED
             self.animation_speed = 0.1
             self.flip_offset = False
         elif current_background == 1:  # Sky stage
             self.enemy_type = 'bird'
             frames = ResourceManager.bird_frames
-            self.scale = 0.6
+            self.scale = self.SCALES['bird']
             self.speed = ENEMY_SPEED * 1.2  # Birds move faster
             self.animation_speed = 0.1
             self.flip_offset = True
         elif current_background == 2:  # Space stage
             self.enemy_type = 'fireball'
             frames = ResourceManager.fireball_frames
-            self.scale = 1.2
+            self.scale = self.SCALES['fireball']
             self.speed = ENEMY_SPEED * 1.3  # Fireballs move fastest
             self.animation_speed = 0.15
             self.flip_offset = False
         elif current_background == 3:  # Math stage
             self.enemy_type = 'symbol'
             frames = ResourceManager.symbol_frames
-            self.scale = 2.0
+            self.scale = self.SCALES['symbol']
             self.speed = ENEMY_SPEED * 1.2
             self.animation_speed = 0.15
             self.flip_offset = False
 
-        # Initialize animation frames with proper scaling
-        self.original_frames = frames.copy()
-        self.original_frames = [pygame.transform.scale(frame, (
-            int(frame.get_width() * self.scale),
-            int(frame.get_height() * self.scale)
-        )) for frame in self.original_frames]
+        # Initialize animation frames with proper scaling; scaled and flipped
+        # frames come from the shared cache so enemies of a type share surfaces
+        sizes = [(int(frame.get_width() * self.scale), int(frame.get_height() * self.scale))
+                 for frame in frames]
+        self.original_frames = [ResourceManager.get_transformed(frame, size)
+                                for frame, size in zip(frames, sizes)]
+        self.flipped_frames = [ResourceManager.get_transformed(frame, size, flip_x=True)
+                               for frame, size in zip(frames, sizes)]
         
         # Set initial frame direction based on enemy type
         if self.flip_offset:
             self.frames = self.original_frames
         else:
-            self.frames = [pygame.transform.flip(frame, True, False) 
-                          for frame in self.original_frames]
+            self.frames = self.flipped_frames
 
         # Setup animation state
         self.current_frame = 0
@@ -97,6 +112,16 @@ class Enemy(pygame.sprite.Sprite):
         self.world_y = y_pos
         self.rect.y = y_pos
 
+    def release_images(self):
+        """
+        Drop frame references while the enemy waits in the sprite pool, so an
+        evicted stage's surfaces can be freed; reset() rebuilds them
+        """
+        self.original_frames = []
+        self.flipped_frames = []
+        self.frames = []
+        self.image = None
+
     def update(self, scroll):
         """
         Update enemy position and animation
@@ -131,8 +156,7 @@ class Enemy(pygame.sprite.Sprite):
             self.direction = -1
             self.rect.x = SCREEN_WIDTH
             if self.flip_offset:
-                self.frames = [pygame.transform.flip(frame, True, False) 
-                              for frame in self.original_frames]
+                self.frames = self.flipped_frames
             else:
                 self.frames = self.original_frames
         elif self.rect.right <= 0:
@@ -141,9 +165,8 @@ class Enemy(pygame.sprite.Sprite):
             if self.flip_offset:
                 self.frames = self.original_frames
             else:
-                self.frames = [pygame.transform.flip(frame, True, False) 
-                              for frame in self.original_frames]
+                self.frames = self.flipped_frames
 
         # Remove if enemy moves too far off screen
-        if self.rect.top > pygame.display.get_surface().get_height() + 100:
+        if self.rect.top > SCREEN_HEIGHT + 100:
             self.kill() 
\ No newline at end of file
@@ -0,0 +1,404 @@
+"""
+Analytics Log
+Records deaths, answers and finished runs in an append-only binary log
+and aggregates any amount of it in constant memory.
+
+Every record is 8 bytes: type, three small fields and a 32-bit value.
+    DEATH     cause (fall/enemy), stage, -, score
+    ANSWER    correct, skill, stage, score
+    RUN_END   stage reached, -, -, final score
+Records are buffered in memory and appended as chunks of up to
+CHUNK_RECORDS, or when a run ends. A chunk is a 16-byte header (record count, CRC32 of the
+records, wall-clock time) followed by the records. A chunk cut short by
+a crash fails its length or CRC check and is skipped when reading.
+A log file is rotated once it passes ANALYTICS_FILE_BYTES. Files are
+named events-000001.jlog, events-000002.jlog and so on, so they sort in
+write order.
+
+The aggregator reads the logs in blocks of about a megabyte and only
+keeps fixed-size counters, so its memory use does not grow with the
+amount of logs. With NumPy installed each block is counted with array
+operations; otherwise records are counted one at a time.
+
+Usage:
+    python -m game.analytics report [FILES OR DIRECTORIES ...]
+    python -m game.analytics bench --records 5000000
+"""
+
+import argparse
+import glob
+import os
+import random
+import struct
+import tempfile
+import time
+import zlib
+from game.constants import ANALYTICS_DIR, ANALYTICS_FILE_BYTES
+from game.question_bank import topic_of
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional; records are then counted one by one
+    numpy = None
+
+RECORD = struct.Struct('<BBBBI')
+CHUNK_HEADER = struct.Struct('<IId')  # record count, CRC32 of the records, wall-clock time
+CHUNK_RECORDS = 512
+RECORD_DTYPE = [('kind', 'u1'), ('a', 'u1'), ('b', 'u1'), ('c', 'u1'), ('value', '<u4')]
+FILE_PATTERN = 'events-{:06d}.jlog'
+
+# Record types
+DEATH = 1
+ANSWER = 2
+RUN_END = 3
+
+# Death causes
+DEATH_FALL = 0
+DEATH_ENEMY = 1
+CAUSES = ('fall', 'enemy')
+
+# Skill ids stored in ANSWER records; new skills must be appended
+SKILLS = ('other', 'addition', 'subtraction', 'multiplication', 'division',
+          # Skills of the grade question generator (GRADE_SKILLS)
+          'multi_digit_add_sub', 'multiplication_facts', 'two_step_whole',
+          'order_of_operations', 'exact_division', 'like_fractions',
+          'integer_operations', 'unlike_fractions', 'parentheses',
+          'fraction_multiply_divide', 'mixed_negatives_fractions', 'multi_step')
+SKILL_IDS = {skill: i for i, skill in enumerate(SKILLS)}
+
+STAGES = ('ground', 'ocean', 'sky', 'space')
+SCORE_BUCKET = 100   # Heatmap rows are this many points apart
+SCORE_BUCKETS = 30   # Scores past the last row are counted in it
+READ_BLOCK = 1024 * 1024  # Bytes of records the aggregator counts at once
+
+
+class AnalyticsLog:
+    def __init__(self, directory=ANALYTICS_DIR, max_file_bytes=ANALYTICS_FILE_BYTES):
+        """
+        Open the log directory and continue after its newest file
+        Args:
+            directory (str): Directory holding the log files
+            max_file_bytes (int): Size after which a new file is started
+        Raises:
+            OSError: If the directory can't be created
+        """
+        self.directory = directory
+        self.max_file_bytes = max_file_bytes
+        os.makedirs(directory, exist_ok=True)
+        existing = sorted(glob.glob(os.path.join(directory, 'events-*.jlog')))
+        self.file_number = int(os.path.basename(existing[-1])[7:13]) if existing else 0
+        self.file = None
+        self.buffer = bytearray()
+        self.count = 0
+
+    @classmethod
+    def open(cls, directory=ANALYTICS_DIR):
+        """
+        Open the log, or return None if the directory is unusable
+        Args:
+            directory (str): Directory holding the log files
+        Returns:
+            AnalyticsLog: The log, or None
+        """
+        try:
+            return cls(directory)
+        except OSError as e:
+            print(f"Error opening analytics log: {e}")
+            return None
+
+    def append(self, kind, a=0, b=0, c=0, value=0):
+        self.buffer += RECORD.pack(kind, a, b, c, value)
+        self.count += 1
+        if self.count >= CHUNK_RECORDS:
+            self.flush()
+
+    def death(self, cause, stage, score):
+        """
+        Record a death
+        Args:
+            cause (int): DEATH_FALL or DEATH_ENEMY
+            stage (int): Background stage (0-3)
+            score (int): Score at the time of death
+        """
+        self.append(DEATH, cause, stage, 0, max(0, score))
+
+    def answer(self, question, correct, stage, score, skill=None):
+        """
+        Record an answered question
+        Args:
+            question (str): Question text; only its skill is stored
+            correct (bool): Whether the answer was right
+            stage (int): Stage the player died in
+            score (int): Score at the time of death
+            skill (str): Skill the question was made for; guessed from the
+                text when None or not in SKILLS
+        """
+        skill_id = SKILL_IDS.get(skill, SKILL_IDS.get(topic_of(question), 0))
+        self.append(ANSWER, int(correct), skill_id, stage, max(0, score))
+
+    def run_end(self, stage, score):
+        """
+        Record the end of a run and write out the buffered records, so a
+        crash loses at most the run in progress
+        Args:
+            stage (int): Highest stage reached
+            score (int): Final score
+        """
+        self.append(RUN_END, stage, 0, 0, max(0, score))
+        self.flush()
+
+    def flush(self):
+        """Append the buffered records as one chunk, rotating the file if it is full"""
+        if not self.count:
+            return
+        try:
+            if self.file is None or self.file.tell() >= self.max_file_bytes:
+                if self.file is not None:
+                    self.file.close()
+                self.file_number += 1
+                self.file = open(os.path.join(self.directory, FILE_PATTERN.format(self.file_number)), 'ab')
+            self.file.write(CHUNK_HEADER.pack(self.count, zlib.crc32(self.buffer), time.time()))
+            self.file.write(self.buffer)
+            self.file.flush()
+        except OSError as e:
+            print(f"Error writing analytics log: {e}")
+        self.buffer.clear()
+        self.count = 0
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def log_files(paths):
+    """
+    Expand files and directories into log files in write order
+    Args:
+        paths (list): Log files or directories of log files
+    Returns:
+        list: Log file paths
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, 'events-*.jlog'))))
+        else:
+            files.append(path)
+    return files
+
+
+def read_chunks(path):
+    """
+    Stream the records of a log file, one chunk in memory at a time
+    Args:
+        path (str): Log file
+    Yields:
+        bytes: The records of one chunk
+    """
+    with open(path, 'rb') as file:
+        while True:
+            header = file.read(CHUNK_HEADER.size)
+            if len(header) < CHUNK_HEADER.size:
+                return
+            count, crc, _ = CHUNK_HEADER.unpack(header)
+            data = file.read(count * RECORD.size)
+            if len(data) < count * RECORD.size or zlib.crc32(data) != crc:
+                print(f"Skipping damaged chunk at the end of {path}")
+                return
+            yield data
+
+
+class Aggregator:
+    def __init__(self):
+        """Initialize empty counters; their size depends only on stages, skills and score buckets"""
+        # [cause][stage][score bucket] -> deaths
+        self.deaths = [[[0] * SCORE_BUCKETS for _ in STAGES] for _ in CAUSES]
+        self.run_stages = [0] * len(STAGES)  # Runs whose highest stage was each stage
+        self.answers = [[0, 0] for _ in SKILLS]  # Per skill: [answered, right]
+        self.stage_answers = [[0, 0] for _ in STAGES]
+        self.records = 0
+
+    def add(self, kind, a, b, c, value):
+        self.records += 1
+        if kind == DEATH:
+            if a < len(CAUSES) and b < len(STAGES):
+                self.deaths[a][b][min(value // SCORE_BUCKET, SCORE_BUCKETS - 1)] += 1
+        elif kind == ANSWER:
+            if b < len(SKILLS) and c < len(STAGES):
+                self.answers[b][0] += 1
+                self.answers[b][1] += a
+                self.stage_answers[c][0] += 1
+                self.stage_answers[c][1] += a
+        elif kind == RUN_END:
+            if a < len(STAGES):
+                self.run_stages[a] += 1
+
+    def add_records(self, data):
+        """
+        Count a block of packed records
+        Args:
+            data (bytes): Whole records, as stored in chunks
+        """
+        if numpy is None:
+            add = self.add
+            for record in RECORD.iter_unpack(data):
+                add(*record)
+            return
+
+        records = numpy.frombuffer(data, RECORD_DTYPE)
+        kind, a, b, c = records['kind'], records['a'], records['b'], records['c']
+        self.records += len(records)
+
+        death = (kind == DEATH) & (a < len(CAUSES)) & (b < len(STAGES))
+        bucket = numpy.minimum(records['value'][death] // SCORE_BUCKET, SCORE_BUCKETS - 1)
+        cell = (a[death].astype(numpy.int64) * len(STAGES) + b[death]) * SCORE_BUCKETS + bucket
+        counts = numpy.bincount(cell, minlength=len(CAUSES) * len(STAGES) * SCORE_BUCKETS)
+        for cause, stages in enumerate(counts.reshape(len(CAUSES), len(STAGES), SCORE_BUCKETS).tolist()):
+            for stage, buckets in enumerate(stages):
+                row = self.deaths[cause][stage]
+                for i, count in enumerate(buckets):
+                    row[i] += count
+
+        answer = (kind == ANSWER) & (b < len(SKILLS)) & (c < len(STAGES))
+        right = a[answer].astype(numpy.int64)
+        for totals, index, size in ((self.answers, b[answer], len(SKILLS)),
+                                    (self.stage_answers, c[answer], len(STAGES))):
+            answered = numpy.bincount(index, minlength=size).tolist()
+            correct = numpy.bincount(index, weights=right, minlength=size).astype(numpy.int64).tolist()
+            for i in range(size):
+                totals[i][0] += answered[i]
+                totals[i][1] += correct[i]
+
+        run_end = (kind == RUN_END) & (a < len(STAGES))
+        for stage, count in enumerate(numpy.bincount(a[run_end], minlength=len(STAGES)).tolist()):
+            self.run_stages[stage] += count
+
+    def add_file(self, path):
+        # Chunks are small, so they are joined into READ_BLOCK-sized blocks first
+        block = []
+        size = 0
+        for data in read_chunks(path):
+            block.append(data)
+            size += len(data)
+            if size >= READ_BLOCK:
+                self.add_records(b''.join(block))
+                block.clear()
+                size = 0
+        if block:
+            self.add_records(b''.join(block))
+
+    def survival(self):
+        """
+        Returns:
+            list: Fraction of finished runs that reached each stage
+        """
+        runs = sum(self.run_stages)
+        reached = runs
+        curve = []
+        for count in self.run_stages:
+            curve.append(reached / runs if runs else 0.0)
+            reached -= count
+        return curve
+
+    def report(self):
+        """
+        Returns:
+            str: Heatmap, survival curve and accuracy tables
+        """
+        lines = [f"{self.records} records", "", "Deaths by score (rows) and stage/cause (columns)"]
+        columns = [(cause, stage) for stage in range(len(STAGES)) for cause in range(len(CAUSES))]
+        lines.append("score   " + "".join(f"{STAGES[s][:6] + '/' + CAUSES[c][:1]:>9}" for c, s in columns))
+        last_row = max([bucket for cause in self.deaths for stage in cause
+                        for bucket, count in enumerate(stage) if count] or [0])
+        for bucket in range(last_row + 1):
+            label = f"{bucket * SCORE_BUCKET}+" if bucket == SCORE_BUCKETS - 1 else f"{bucket * SCORE_BUCKET}"
+            lines.append(f"{label:<8}" + "".join(f"{self.deaths[c][s][bucket]:>9}" for c, s in columns))
+
+        lines += ["", f"Stage survival over {sum(self.run_stages)} finished runs"]
+        for stage, fraction in zip(STAGES, self.survival()):
+            lines.append(f"{stage:<16}{fraction:7.1%}  {'#' * round(fraction * 40)}")
+
+        lines += ["", "Answer accuracy"]
+        for name, (answered, right) in list(zip(SKILLS, self.answers)) + list(zip(STAGES, self.stage_answers)):
+            if answered:
+                lines.append(f"{name:<26}{right / answered:7.1%} of {answered}")
+        return "\n".join(lines)
+
+
+def aggregate(paths):
+    """
+    Aggregate log files and directories
+    Args:
+        paths (list): Log files or directories of log files
+    Returns:
+        Aggregator: The filled counters
+    """
+    aggregator = Aggregator()
+    for path in log_files(paths):
+        aggregator.add_file(path)
+    return aggregator
+
+
+def bench(records=5000000):
+    """
+    Write random records through AnalyticsLog and aggregate them
+    Args:
+        records (int): Number of records to write
+    Returns:
+        dict: Write and aggregate rates, bytes written and file count
+    """
+    import tracemalloc
+    rng = random.Random(1)
+    questions = ["3 + 4 = ?", "9 - 2 = ?", "6 * 7 = ?", "8 ÷ 2 = ?"]
+    with tempfile.TemporaryDirectory() as directory:
+        log = AnalyticsLog(directory)
+        start = time.perf_counter()
+        for _ in range(records):
+            roll = rng.random()
+            stage = rng.randrange(len(STAGES))
+            score = rng.randrange(3000)
+            # A run ends (and its records are written out) about every hundred records
+            if roll < 0.495:
+                log.death(rng.randrange(len(CAUSES)), stage, score)
+            elif roll < 0.99:
+                log.answer(rng.choice(questions), rng.random() < 0.7, stage, score)
+            else:
+                log.run_end(stage, score)
+        log.close()
+        write_seconds = time.perf_counter() - start
+        files = log_files([directory])
+        size = sum(os.path.getsize(path) for path in files)
+
+        start = time.perf_counter()
+        aggregate([directory])
+        read_seconds = time.perf_counter() - start
+
+        # Separate pass: tracing allocations slows the aggregator down a lot
+        tracemalloc.start()
+        aggregate([directory])
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {'write_rate': records / write_seconds, 'read_mb_s': size / read_seconds / 1024 / 1024,
+            'bytes': size, 'files': len(files), 'peak_kb': peak / 1024}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate gameplay analytics logs")
+    parser.add_argument('command', choices=['report', 'bench'])
+    parser.add_argument('paths', nargs='*', help="log files or directories (default: the game's log directory)")
+    parser.add_argument('--records', type=int, default=5000000, help="records to write for bench")
+    args = parser.parse_args()
+
+    if args.command == 'report':
+        print(aggregate(args.paths or [ANALYTICS_DIR]).report())
+    else:
+        results = bench(args.records)
+        print(f"Wrote {results['bytes'] / 1024 / 1024:.1f} MB in {results['files']} files "
+              f"at {results['write_rate']:,.0f} records/s")
+        print(f"Aggregated at {results['read_mb_s']:.1f} MB/s with a {results['peak_kb']:.0f} KB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Asset Pack
+Bakes the game's images into one indexed pack file and loads them back
+without PNG decoding.
+
+The bake step decodes every PNG once, pre-scales the backgrounds to the
+screen size, and pre-renders the scaled and flipped variants the game
+asks ResourceManager.get_transformed() for (enemy frames, player,
+platform widths). Everything is stored as raw pixel buffers after a
+JSON index. At runtime the pack is memory-mapped and each entry becomes
+a surface with pygame.image.frombuffer().
+
+Pack layout:
+    8 bytes   magic b'JMPACK01'
+    4 bytes   little-endian index length
+    n bytes   JSON index: assets {name: offset/size/format} and variants
+    ...       pixel data, each entry aligned to 16 bytes
+
+Usage:
+    python -m game.asset_pack bake    # writes ASSET_PACK_FILE
+    python -m game.asset_pack bench   # compares startup against the PNG loaders
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import time
+import pygame
+from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT, ASSET_PACK_FILE
+
+MAGIC = b'JMPACK01'
+ALIGNMENT = 16
+
+# Platform widths chosen by GameManager (random.randint(50, 100))
+PLATFORM_WIDTHS = range(50, 101)
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class AssetPack:
+    def __init__(self, path):
+        """
+        Memory-map a baked pack and read its index
+        Args:
+            path (str): Pack file path
+        Raises:
+            OSError: If the file can't be opened
+            ValueError: If the file is not a valid pack
+        """
+        self.file = open(path, 'rb')
+        try:
+            # ACCESS_COPY keeps the file untouched if a surface is ever drawn on
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            self.file.close()
+            raise
+        try:
+            if self.map[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not an asset pack")
+            (index_length,) = struct.unpack_from('<I', self.map, len(MAGIC))
+            index_start = len(MAGIC) + 4
+            index = json.loads(self.map[index_start:index_start + index_length].decode('utf-8'))
+            self.assets = index['assets']
+            self.variants = index['variants']
+        except ValueError:
+            self.close()
+            raise
+        except (KeyError, TypeError, struct.error) as e:
+            self.close()
+            raise ValueError(f"{path} has an unreadable index: {e}")
+        self.data_start = _align(index_start + index_length)
+
+    def __contains__(self, name):
+        return name in self.assets
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def surface(self, name):
+        """
+        Create a surface backed directly by the pack's pixel data
+        Args:
+            name (str): Asset name
+        Returns:
+            Surface: Surface sharing memory with the mapped file
+        """
+        entry = self.assets[name]
+        width, height = entry['size']
+        start = self.data_start + entry['offset']
+        view = memoryview(self.map)[start:start + entry['length']]
+        return pygame.image.frombuffer(view, (width, height), entry['format'])
+
+
+def _source_images():
+    """
+    List the PNG files the game loads, keyed by asset name
+    Returns:
+        dict: Asset name -> (file path, whether it has alpha)
+    """
+    from game.resource_manager import ResourceManager
+    sources = {}
+    for prefix, count in ResourceManager.ENEMY_FRAME_COUNTS.items():
+        for i in range(1, count + 1):
+            sources[f'{prefix}_frame_{i}'] = (f'assets/images/{prefix}_frame_{i}.png', True)
+    sources['player'] = ('assets/images/player.png', True)
+    sources['wood'] = ('assets/images/wood.png', True)
+    for i in range(1, 5):
+        sources[f'bk{i}'] = (f'assets/images/bk{i}.png', False)
+    return sources
+
+
+def _variant_requests(images):
+    """
+    List the scaled/flipped variants the game requests at runtime
+    Args:
+        images (dict): Asset name -> decoded source surface
+    Returns:
+        list: (source name, (width, height), flip_x) tuples
+    """
+    from components.enemy import Enemy
+    from game.resource_manager import ResourceManager
+    requests = []
+    for prefix, count in ResourceManager.ENEMY_FRAME_COUNTS.items():
+        scale = Enemy.SCALES[prefix]
+        for i in range(1, count + 1):
+            name = f'{prefix}_frame_{i}'
+            width, height = images[name].get_size()
+            size = (int(width * scale), int(height * scale))
+            requests.append((name, size, False))
+            requests.append((name, size, True))
+    requests.append(('player', (80, 80), False))
+    requests.append(('player', (80, 80), True))
+    for width in PLATFORM_WIDTHS:
+        requests.append(('wood', (width, 12), False))
+    return requests
+
+
+def bake(output=ASSET_PACK_FILE):
+    """
+    Decode, pre-scale and pre-flip all images and write them to one pack
+    Args:
+        output (str): Pack file path to write
+    Returns:
+        int: Size of the written pack in bytes
+    """
+    images = {}
+    formats = {}
+    for name, (path, has_alpha) in _source_images().items():
+        image = pygame.image.load(path)
+        if name.startswith('bk'):
+            image = pygame.transform.scale(image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        images[name] = image
+        formats[name] = 'RGBA' if has_alpha else 'RGB'
+
+    variants = []
+    for source, size, flip_x in _variant_requests(images):
+        surface = images[source]
+        if size != surface.get_size():
+            surface = pygame.transform.scale(surface, size)
+        if flip_x:
+            surface = pygame.transform.flip(surface, True, False)
+        name = f'{source}@{size[0]}x{size[1]}' + (':flip' if flip_x else '')
+        images[name] = surface
+        formats[name] = formats[source]
+        variants.append({'source': source, 'size': list(size), 'flip': flip_x, 'asset': name})
+
+    assets = {}
+    blobs = []
+    offset = 0
+    for name, surface in images.items():
+        data = pygame.image.tobytes(surface, formats[name])
+        assets[name] = {'offset': offset, 'length': len(data),
+                        'size': list(surface.get_size()), 'format': formats[name]}
+        padding = _align(len(data)) - len(data)
+        blobs.append(data + b'\0' * padding)
+        offset += len(data) + padding
+
+    index = json.dumps({'assets': assets, 'variants': variants}).encode('utf-8')
+    header = MAGIC + struct.pack('<I', len(index)) + index
+    header += b'\0' * (_align(len(header)) - len(header))
+
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'wb') as file:
+        file.write(header)
+        for blob in blobs:
+            file.write(blob)
+    return len(header) + offset
+
+
+def bench(repeats=5):
+    """
+    Compare ResourceManager.initialize() with the serial PNG loader,
+    the thread pool PNG loader, and the asset pack
+    Args:
+        repeats (int): Number of timed loads per loader
+    Returns:
+        dict: Best load time in milliseconds for each loader
+    """
+    from game.resource_manager import ResourceManager
+    workers = ResourceManager.loader_workers
+    results = {}
+    for label, use_pack, loader_workers in (('png_serial', False, 1),
+                                            ('png_parallel', False, workers),
+                                            ('pack', True, workers)):
+        ResourceManager.loader_workers = loader_workers
+        best = float('inf')
+        for _ in range(repeats):
+            ResourceManager.transform_cache.clear()
+            start = time.perf_counter()
+            ResourceManager.initialize(use_pack=use_pack, stages=range(len(ResourceManager.STAGES)))
+            best = min(best, time.perf_counter() - start)
+        results[label] = best * 1000
+    ResourceManager.loader_workers = workers
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake or benchmark the game's asset pack")
+    parser.add_argument('command', choices=['bake', 'bench'])
+    parser.add_argument('--output', default=ASSET_PACK_FILE, help="pack file path")
+    parser.add_argument('--report', action='store_true', help="print per-asset PNG decode times")
+    args = parser.parse_args()
+
+    if args.command == 'bake':
+        size = bake(args.output)
+        print(f"Wrote {args.output} ({size / 1024:.0f} KB)")
+        return
+
+    if not os.path.exists(ASSET_PACK_FILE):
+        bake()
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    results = bench()
+    print(f"PNG loader (serial):   {results['png_serial']:.1f} ms")
+    print(f"PNG loader (parallel): {results['png_parallel']:.1f} ms "
+          f"({results['png_serial'] / results['png_parallel']:.1f}x faster)")
+    print(f"Asset pack:            {results['pack']:.1f} ms "
+          f"({results['png_serial'] / results['pack']:.1f}x faster)")
+    if args.report:
+        from game.resource_manager import ResourceManager
+        ResourceManager.initialize(use_pack=False, stages=range(len(ResourceManager.STAGES)))
+        ResourceManager.print_load_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Asset Streamer
+Loads stage assets in the background as the player approaches them.
+
+ResourceManager only loads the starting stage at startup. As the score
+nears the threshold of the next stage, that stage's enemy frames and
+background are decoded on a worker thread and installed on the main
+thread once ready. Stages the player has already passed are evicted
+when the loaded stages exceed the memory budget, and pooled sprites
+drop their frame references so the evicted surfaces are really freed.
+The starting stage stays loaded because every new game begins there.
+
+The game only switches to a stage once it is ready, so a transition
+waits a few frames for a late prefetch instead of stalling on disk.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from game.constants import (
+    OCEAN_SCORE, SKY_SCORE, SPACE_SCORE,
+    PREFETCH_MARGIN, ASSET_MEMORY_BUDGET
+)
+from game.resource_manager import ResourceManager
+
+# Score at which each stage hands over to the next one
+STAGE_SCORES = [OCEAN_SCORE, SKY_SCORE, SPACE_SCORE]
+
+
+class AssetStreamer:
+    def __init__(self, budget=ASSET_MEMORY_BUDGET, margin=PREFETCH_MARGIN, pools=()):
+        """
+        Initialize the streamer
+        Args:
+            budget (int): Bytes of stage images to keep before evicting passed stages
+            margin (int): Points before a stage threshold at which prefetching starts
+            pools (iterable): SpritePools whose free sprites may hold stage frames
+        """
+        self.budget = budget
+        self.margin = margin
+        self.pools = list(pools)
+        self.pinned = {0}
+        self.pending = {}  # Stage -> Future from the worker thread
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='asset-prefetch')
+        self.stats = {'prefetched': 0, 'sync_loads': 0, 'evicted': 0}
+
+    def update(self, stage, score):
+        """
+        Install finished loads, prefetch the next stage and evict passed ones.
+        Called once per simulation step on the main thread.
+        Args:
+            stage (int): Current stage (background index)
+            score (int): Current score
+        """
+        self.poll()
+        if stage < len(STAGE_SCORES) and score >= STAGE_SCORES[stage] - self.margin:
+            self.prefetch(stage + 1)
+        self.evict(stage)
+
+    def prefetch(self, stage):
+        """Start decoding a stage on the worker thread if it isn't loaded or loading"""
+        if ResourceManager.stage_ready(stage) or stage in self.pending:
+            return
+        self.pending[stage] = self.executor.submit(ResourceManager.decode_stage, stage)
+
+    def poll(self):
+        """Install stages whose background decode has finished"""
+        for stage, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[stage]
+                ResourceManager.install_stage(stage, future.result())
+                self.stats['prefetched'] += 1
+
+    def require(self, stage):
+        """
+        Make sure a stage is loaded, waiting for it as a last resort.
+        Used when restoring a saved game into a stage that was not prefetched.
+        Args:
+            stage (int): Stage index
+        """
+        if ResourceManager.stage_ready(stage):
+            return
+        future = self.pending.pop(stage, None)
+        decoded = future.result() if future is not None else ResourceManager.decode_stage(stage)
+        ResourceManager.install_stage(stage, decoded)
+        self.stats['sync_loads'] += 1
+
+    def resident_bytes(self):
+        """Get the memory held by all loaded stages"""
+        return sum(ResourceManager.stage_bytes(stage) for stage in ResourceManager.loaded_stages)
+
+    def evict(self, stage):
+        """
+        Unload passed, unpinned stages while over the memory budget
+        Args:
+            stage (int): Current stage; only earlier stages are evicted
+        """
+        if self.resident_bytes() <= self.budget:
+            return
+        evicted = False
+        for passed in sorted(ResourceManager.loaded_stages):
+            if passed >= stage:
+                break
+            if passed in self.pinned:
+                continue
+            ResourceManager.unload_stage(passed)
+            self.stats['evicted'] += 1
+            evicted = True
+            if self.resident_bytes() <= self.budget:
+                break
+        if evicted:
+            for pool in self.pools:
+                pool.release_images()
@@ -0,0 +1,220 @@
+"""
+Audio Pipeline
+Converts sound effects to the mixer's native format ahead of time and
+streams long clips from disk.
+
+pygame.mixer.Sound() decodes a file and resamples it to the mixer's
+rate, sample format and channel count every time it is loaded. The bake
+step does that once and writes each effect as raw PCM in the mixer's
+format next to an index, so loading is a plain read. Clips longer than
+STREAM_MIN_SECONDS are never held in memory whole: ClipStream reads them
+from a memory-mapped file a chunk at a time, and SoundManager queues the
+next chunk on the clip's channel as the previous one finishes.
+
+The baked files are only used when they were made for the current
+mixer format; otherwise SoundManager decodes the original files.
+
+Usage:
+    python -m game.audio_pipeline bake     # writes AUDIO_CACHE_DIR
+    python -m game.audio_pipeline report   # audio memory with and without the baked files
+"""
+
+import argparse
+import json
+import mmap
+import os
+import pygame
+from game.constants import AUDIO_CACHE_DIR, STREAM_MIN_SECONDS, STREAM_CHUNK_SECONDS
+
+INDEX_FILE = 'index.json'
+
+
+def mixer_format():
+    """
+    Get the mixer's output format
+    Returns:
+        list: [frequency, sample format, channels], or None if the mixer is not initialized
+    """
+    init = pygame.mixer.get_init()
+    return list(init) if init else None
+
+
+def bytes_per_second(audio_format):
+    """
+    Get the PCM data rate of a mixer format
+    Args:
+        audio_format (list): [frequency, sample format, channels] as returned by mixer_format()
+    Returns:
+        int: Bytes of audio per second
+    """
+    frequency, sample_format, channels = audio_format
+    return frequency * channels * (abs(sample_format) // 8)
+
+
+class ClipStream:
+    def __init__(self, path, chunk_bytes):
+        """
+        Open a baked clip for chunked playback
+        Args:
+            path (str): Raw PCM file in the mixer's format
+            chunk_bytes (int): Bytes per chunk (a whole number of sample frames)
+        """
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.chunk_bytes = chunk_bytes
+        self.offset = 0
+
+    def next_chunk(self):
+        """
+        Read the next part of the clip
+        Returns:
+            Sound: Chunk ready to play or queue, or None at the end of the clip
+        """
+        if self.offset >= len(self.map):
+            return None
+        data = self.map[self.offset:self.offset + self.chunk_bytes]
+        self.offset += len(data)
+        return pygame.mixer.Sound(buffer=data)
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+
+class AudioCache:
+    def __init__(self, directory=AUDIO_CACHE_DIR):
+        """
+        Read the index of baked sounds
+        Args:
+            directory (str): Directory written by bake()
+        Raises:
+            OSError: If the index can't be read
+            ValueError: If the index is not valid JSON
+        """
+        self.directory = directory
+        with open(os.path.join(directory, INDEX_FILE), 'r') as file:
+            index = json.load(file)
+        self.format = index['format']
+        self.sounds = index['sounds']
+
+    @classmethod
+    def open(cls, directory=AUDIO_CACHE_DIR):
+        """
+        Open the baked sounds if they exist and match the current mixer format
+        Args:
+            directory (str): Directory written by bake()
+        Returns:
+            AudioCache: The cache, or None if it can't be used
+        """
+        if not os.path.exists(os.path.join(directory, INDEX_FILE)):
+            return None
+        try:
+            cache = cls(directory)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error reading audio cache: {e}")
+            return None
+        return cache if cache.format == mixer_format() else None
+
+    def __contains__(self, name):
+        return name in self.sounds
+
+    def path(self, name):
+        return os.path.join(self.directory, self.sounds[name]['file'])
+
+    def is_streamed(self, name):
+        """Check whether a sound is long enough to be streamed instead of loaded"""
+        return self.sounds[name]['stream']
+
+    def load(self, name):
+        """
+        Load a baked sound without decoding or resampling
+        Args:
+            name (str): Sound name
+        Returns:
+            Sound: Sound holding the whole clip
+        """
+        with open(self.path(name), 'rb') as file:
+            return pygame.mixer.Sound(buffer=file.read())
+
+    def chunk_bytes(self):
+        """Get the size of one streaming chunk, rounded to whole sample frames"""
+        frequency, sample_format, channels = self.format
+        frame_bytes = channels * (abs(sample_format) // 8)
+        return int(frequency * STREAM_CHUNK_SECONDS) * frame_bytes
+
+    def open_stream(self, name):
+        """
+        Open a streamed sound for chunked playback
+        Args:
+            name (str): Sound name
+        Returns:
+            ClipStream: Stream positioned at the start of the clip
+        """
+        return ClipStream(self.path(name), self.chunk_bytes())
+
+
+def bake(output=AUDIO_CACHE_DIR):
+    """
+    Decode every sound effect, convert it to the current mixer format and
+    write it as raw PCM
+    Args:
+        output (str): Directory to write the baked sounds to
+    Returns:
+        dict: Sound name -> baked size in bytes
+    """
+    from game.sound_manager import SoundManager
+    audio_format = mixer_format()
+    rate = bytes_per_second(audio_format)
+    os.makedirs(output, exist_ok=True)
+    sounds = {}
+    sizes = {}
+    for name, path in SoundManager.SOUND_FILES.items():
+        data = pygame.mixer.Sound(path).get_raw()
+        filename = f'{name}.pcm'
+        with open(os.path.join(output, filename), 'wb') as file:
+            file.write(data)
+        sounds[name] = {'file': filename, 'bytes': len(data),
+                        'stream': len(data) / rate > STREAM_MIN_SECONDS}
+        sizes[name] = len(data)
+    with open(os.path.join(output, INDEX_FILE), 'w') as file:
+        json.dump({'format': audio_format, 'sounds': sounds}, file, indent=1)
+    return sizes
+
+
+def print_memory_report(report):
+    """
+    Print the output of SoundManager.memory_report()
+    Args:
+        report (dict): Memory report
+    """
+    for name, size in sorted(report['resident'].items()):
+        print(f"  {name:<12}{size / 1024:9.0f} KB")
+    for name, size in sorted(report['streamed'].items()):
+        print(f"  {name:<12}{size / 1024:9.0f} KB  (streamed, while playing)")
+    print(f"  {'total':<12}{report['total'] / 1024:9.0f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake sound effects or report audio memory use")
+    parser.add_argument('command', choices=['bake', 'report'])
+    parser.add_argument('--output', default=AUDIO_CACHE_DIR, help="baked sounds directory")
+    args = parser.parse_args()
+
+    pygame.mixer.init()
+    if args.command == 'bake':
+        sizes = bake(args.output)
+        print(f"Wrote {len(sizes)} sounds to {args.output} ({sum(sizes.values()) / 1024:.0f} KB)")
+        return
+
+    from game.sound_manager import SoundManager
+    print("Decoded from the original files:")
+    print_memory_report(SoundManager(use_cache=False).memory_report())
+    if AudioCache.open() is None:
+        print(f"No baked sounds for this mixer format; run 'bake' to write {AUDIO_CACHE_DIR}")
+        return
+    print("Baked, with long clips streamed:")
+    print_memory_report(SoundManager().memory_report())
+
+
+if __name__ == "__main__":
+    main()
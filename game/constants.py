@@ -9,6 +9,7 @@ to maintain consistent behavior across the game.
 """
 
 import pygame
+from game.spatial_hash import IndexedGroup
 
 # Game states - Different screens/modes in the game
 MENU = "menu"          # Main menu screen
@@ -25,6 +26,7 @@ SCROLL_THRESH = 200    # Screen scrolling threshold
 GRAVITY = 1           # Gravity force applied to player
 MAX_PLATFORMS = 10    # Maximum number of platforms on screen
 PLATFORM_GAP = 100    # Vertical gap between platforms
+SPATIAL_CELL_HEIGHT = 100  # Row height of the sprite groups' spatial index
 
 # Speed settings for game entities
 ENEMY_SPEED = 2.0     # Base enemy movement speed
@@ -35,12 +37,25 @@ ENEMY_VERTICAL_DISTANCE = 600  # Vertical distance between enemies
 # Background transition settings
 FADE_SPEED = 5  # Speed of background fade transitions
 
+# Death sequence
+DEATH_DELAY = 0.5  # Game seconds between dying and the math question
+
 # Score thresholds for background changes
 OCEAN_SCORE = 200   # Score needed for ocean to sky transition
 SKY_SCORE = 400    # Score needed for sky to space transition
 SPACE_SCORE = 600  # Score needed for space to math transition
 MATH_SCORE = 800   # Final background threshold
 
+# Asset streaming settings
+PREFETCH_MARGIN = 100  # Start loading the next stage this many points before its threshold
+ASSET_MEMORY_BUDGET = 4 * 1024 * 1024  # Bytes of stage images kept before evicting passed stages (a stage is ~1.8 MB)
+
+# Audio settings
+SOUND_CHANNELS = 8  # Mixer channels shared by all sound effects
+STREAM_MIN_SECONDS = 5.0    # Baked clips longer than this are streamed instead of loaded
+STREAM_CHUNK_SECONDS = 1.0  # Length of each streamed chunk
+AUDIO_STREAM_EVENT = pygame.USEREVENT + 1  # Posted when a streamed chunk finishes
+
 # Button dimensions for menu interface
 BUTTON_WIDTH = 200
 BUTTON_HEIGHT = 50
@@ -53,12 +68,31 @@ YELLOW = (255, 255, 0)
 # Frame rate setting
 FPS = 60
 
+# Fixed-timestep loop settings
+SIM_DT = 1.0 / FPS     # Seconds of game time advanced per simulation step
+MAX_FRAME_TIME = 0.25  # Longest frame fed to the simulation (prevents spiral of death)
+RENDER_FPS = 144       # Upper limit for rendered frames per second
+DIRTY_RECT_RENDERING = True  # Push only changed screen areas during gameplay
+IDLE_WAIT_MS = 500     # Longest event wait on static screens before checking again
+
+# Student whose progress is tracked until profiles can be chosen
+DEFAULT_STUDENT = 'player'
+DEFAULT_GRADE = '5th'  # Grade of the questions until a profile says otherwise
+
 # File paths
 HIGH_SCORE_FILE = 'high_score.txt'
+ASSET_PACK_FILE = 'assets/assets.pack'  # Baked images (python -m game.asset_pack bake)
+FONT_CACHE_FILE = 'font_cache.json'     # Font file paths resolved on a previous launch
+AUDIO_CACHE_DIR = 'assets/audio'        # Baked sounds (python -m game.audio_pipeline bake)
+QUESTION_STORE_FILE = 'assets/questions.store'  # Imported banks (python -m game.question_store import)
+REVIEW_FILE = 'review_progress.json'   # Per-student spaced-repetition state
+PROFILE_DB_FILE = 'profiles.db'        # Student profiles, sessions and answers (SQLite)
+ANALYTICS_DIR = 'analytics'            # Gameplay event logs (python -m game.analytics report)
+ANALYTICS_FILE_BYTES = 16 * 1024 * 1024  # Log files are rotated past this size
 
 # Sprite groups shared across the game
-platform_group = pygame.sprite.Group()  # Group for all platforms
-enemy_group = pygame.sprite.Group()     # Group for all enemies
+platform_group = IndexedGroup(SPATIAL_CELL_HEIGHT)  # Group for all platforms
+enemy_group = IndexedGroup(SPATIAL_CELL_HEIGHT)     # Group for all enemies
 
 # Current background tracker
 current_background = 0  # Tracks current background stage (0-3)
\ No newline at end of file
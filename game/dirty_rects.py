@@ -0,0 +1,73 @@
+"""
+Dirty Rectangle Tracker
+Pushes only the changed parts of the screen to the display.
+
+Drawing code marks the rect of everything it blits that can move or
+change (player, platforms, enemies, HUD). When the frame is presented,
+the display is updated with this frame's rects plus last frame's rects,
+which covers both the new positions and the areas that were uncovered.
+Anything that changes the whole screen, such as a scrolling background,
+forces a full update for that frame instead.
+"""
+
+import pygame
+
+
+class DirtyRectTracker:
+    def __init__(self, width, height):
+        """
+        Initialize the tracker
+        Args:
+            width (int): Screen width in pixels
+            height (int): Screen height in pixels
+        """
+        self.screen_rect = pygame.Rect(0, 0, width, height)
+        self.previous = []
+        self.current = []
+        self.full_update = True
+
+    def mark(self, rect):
+        """Mark a screen area drawn this frame"""
+        self.current.append(pygame.Rect(rect))
+
+    def force_full(self):
+        """Update the whole screen when this frame is presented"""
+        self.full_update = True
+
+    def merged_rects(self):
+        """
+        Combine this frame's and last frame's rects, merging overlaps
+        Returns:
+            list: Rects clipped to the screen
+        """
+        merged = []
+        for rect in self.previous + self.current:
+            rect = rect.clip(self.screen_rect)
+            if not rect.width or not rect.height:
+                continue
+            for i, other in enumerate(merged):
+                if other.colliderect(rect):
+                    merged[i] = other.union(rect)
+                    break
+            else:
+                merged.append(rect)
+        return merged
+
+    def present(self):
+        """
+        Update the display for this frame
+        Returns:
+            int: Number of pixels pushed to the display
+        """
+        if self.full_update:
+            pygame.display.update()
+            pixels = self.screen_rect.width * self.screen_rect.height
+        else:
+            rects = self.merged_rects()
+            pygame.display.update(rects)
+            pixels = sum(rect.width * rect.height for rect in rects)
+
+        self.previous = self.current
+        self.current = []
+        self.full_update = False
+        return pixels
@@ -0,0 +1,206 @@
+"""
+Font Registry
+Resolves font families to files once and shares Font objects.
+
+pygame.font.SysFont() scans every installed font the first time it is
+called in a process (on Linux this runs fc-list), and each call creates
+a new Font. The registry asks SysFont to resolve each (family, bold)
+pair only once, saves the resulting file paths to FONT_CACHE_FILE so
+later launches skip the scan entirely, and hands out one shared Font
+per (family, size, bold), loaded on first request.
+
+Usage:
+    python -m game.font_registry   # compares font setup time with plain SysFont calls
+"""
+
+import json
+import os
+import time
+import pygame
+from game.constants import FONT_CACHE_FILE
+
+CACHE_VERSION = 1
+
+
+class FontRegistry:
+    # (family, bold) -> (font file path or None for the default font, apply synthetic bold)
+    resolved = {}
+    cache_loaded = False
+    cache_dirty = False
+    cache_path = FONT_CACHE_FILE
+
+    # (family, size, bold) -> shared Font
+    fonts = {}
+
+    stats = {'scans': 0, 'cache_hits': 0, 'fonts_loaded': 0, 'resolve_ms': 0.0, 'load_ms': 0.0}
+
+    @staticmethod
+    def _key(family, bold):
+        return f"{family}|{'bold' if bold else 'regular'}"
+
+    @classmethod
+    def load_cache(cls):
+        """
+        Read resolved font paths saved by a previous run.
+        Entries whose font file no longer exists are dropped and resolved again.
+        """
+        cls.cache_loaded = True
+        if not os.path.exists(cls.cache_path):
+            return
+        try:
+            with open(cls.cache_path, 'r') as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            print(f"Error reading font cache: {e}")
+            return
+        if data.get('version') != CACHE_VERSION:
+            return
+        for key, entry in data.get('fonts', {}).items():
+            family, _, style = key.rpartition('|')
+            font_path = entry.get('path')
+            if font_path is not None and not os.path.exists(font_path):
+                continue
+            cls.resolved[(family, style == 'bold')] = (font_path, entry.get('synthetic_bold', False))
+
+    @classmethod
+    def save_cache(cls):
+        """Write resolved font paths so the next launch can skip the font scan"""
+        if not cls.cache_dirty:
+            return
+        fonts = {cls._key(family, bold): {'path': font_path, 'synthetic_bold': synthetic_bold}
+                 for (family, bold), (font_path, synthetic_bold) in cls.resolved.items()}
+        try:
+            with open(cls.cache_path, 'w') as file:
+                json.dump({'version': CACHE_VERSION, 'fonts': fonts}, file, indent=1)
+            cls.cache_dirty = False
+        except OSError as e:
+            print(f"Error saving font cache: {e}")
+
+    @classmethod
+    def resolve(cls, family, bold=False):
+        """
+        Find the font file for a family, scanning system fonts only on a cache miss.
+        Uses SysFont's own matching so the result is the font SysFont would pick.
+        Args:
+            family (str): Font family name (or comma-separated fallbacks)
+            bold (bool): Whether a bold face is wanted
+        Returns:
+            tuple: (font file path or None, whether bold must be synthesized)
+        """
+        if not cls.cache_loaded:
+            cls.load_cache()
+        key = (family, bold)
+        if key in cls.resolved:
+            cls.stats['cache_hits'] += 1
+            return cls.resolved[key]
+
+        start = time.perf_counter()
+        # SysFont calls the constructor with the matched file and the styles it
+        # could not find a dedicated face for, without opening the font
+        cls.resolved[key] = pygame.font.SysFont(
+            family, 1, bold=bold,
+            constructor=lambda path, size, set_bold, set_italic: (path, set_bold))
+        cls.stats['scans'] += 1
+        cls.stats['resolve_ms'] += (time.perf_counter() - start) * 1000
+        cls.cache_dirty = True
+        cls.save_cache()
+        return cls.resolved[key]
+
+    @classmethod
+    def get(cls, family, size, bold=False):
+        """
+        Get the shared Font for a family, size and weight, loading it on first use.
+        Callers share the returned Font, so they must not change its style.
+        Args:
+            family (str): Font family name
+            size (int): Point size
+            bold (bool): Whether the font is bold
+        Returns:
+            Font: Shared font object
+        Raises:
+            pygame.error: If the font file can't be loaded
+        """
+        key = (family, size, bold)
+        font = cls.fonts.get(key)
+        if font is None:
+            path, synthetic_bold = cls.resolve(family, bold)
+            start = time.perf_counter()
+            font = pygame.font.Font(path, size)
+            if synthetic_bold:
+                font.set_bold(True)
+            cls.fonts[key] = font
+            cls.stats['fonts_loaded'] += 1
+            cls.stats['load_ms'] += (time.perf_counter() - start) * 1000
+        return font
+
+    @classmethod
+    def clear(cls):
+        """Forget all fonts and resolved paths (the cache file is kept)"""
+        cls.fonts.clear()
+        cls.resolved.clear()
+        cls.cache_loaded = False
+        cls.cache_dirty = False
+        for name in cls.stats:
+            cls.stats[name] = 0.0 if name.endswith('_ms') else 0
+
+
+# Fonts requested by GameManager.setup_fonts() and ResourceManager.create_symbol_frames()
+STARTUP_FONTS = [('Lucida Sans', 60, False), ('Lucida Sans', 24, False),
+                 ('Lucida Sans', 20, False), ('Lucida Sans', 24, False)] + \
+                [('Arial', 40, True)] * 5
+
+
+def _reset_system_fonts():
+    # Make the next SysFont() call rescan installed fonts, as on a fresh launch
+    pygame.sysfont.Sysfonts.clear()
+    pygame.sysfont.Sysalias.clear()
+    pygame.sysfont.is_init = False
+
+
+def bench(repeats=5):
+    """
+    Time startup font setup with plain SysFont calls and with the registry
+    Args:
+        repeats (int): Number of timed runs per method
+    Returns:
+        dict: Best time in milliseconds for 'sysfont', 'registry_cold' (no cache file)
+              and 'registry_warm' (cache file from a previous run)
+    """
+    cache_path = FontRegistry.cache_path
+    FontRegistry.cache_path = cache_path + '.bench'
+    results = {'sysfont': float('inf'), 'registry_cold': float('inf'), 'registry_warm': float('inf')}
+    for _ in range(repeats):
+        _reset_system_fonts()
+        start = time.perf_counter()
+        for family, size, bold in STARTUP_FONTS:
+            pygame.font.SysFont(family, size, bold=bold)
+        results['sysfont'] = min(results['sysfont'], time.perf_counter() - start)
+
+        for label in ('registry_cold', 'registry_warm'):
+            if label == 'registry_cold' and os.path.exists(FontRegistry.cache_path):
+                os.remove(FontRegistry.cache_path)
+            _reset_system_fonts()
+            FontRegistry.clear()
+            start = time.perf_counter()
+            for family, size, bold in STARTUP_FONTS:
+                FontRegistry.get(family, size, bold)
+            results[label] = min(results[label], time.perf_counter() - start)
+
+    if os.path.exists(FontRegistry.cache_path):
+        os.remove(FontRegistry.cache_path)
+    FontRegistry.cache_path = cache_path
+    FontRegistry.clear()
+    return {label: seconds * 1000 for label, seconds in results.items()}
+
+
+def main():
+    pygame.font.init()
+    results = bench()
+    print(f"SysFont calls:          {results['sysfont']:.1f} ms")
+    print(f"Registry (first run):   {results['registry_cold']:.1f} ms")
+    print(f"Registry (cached):      {results['registry_warm']:.1f} ms "
+          f"({results['sysfont'] / results['registry_warm']:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
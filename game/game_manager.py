@@ -9,14 +9,31 @@ import pygame
 import sys
 import random
 import os
+import time
 from components.player import Player
 from components.platform import Platform
 from components.enemy import Enemy
 from components.math_question import MathQuestion
 from game.background import Background
-from game.sound_manager import SoundManager
+from game.sound_manager import SoundManager, NullSoundManager
+from game.input_source import KeyboardInput
+from game.sprite_pool import SpritePool
+from game.text_cache import TextCache, DigitAtlas
+from game.dirty_rects import DirtyRectTracker
+from game.asset_streamer import AssetStreamer
+from game.resource_manager import ResourceManager
+from game.font_registry import FontRegistry
+from game.startup_trace import tracer
+from game.scheduler import Scheduler
+from game.question_batch import QuestionQueue, GradeSource
+from game.question_generator import GRADE_SKILLS
+from questions import get_store
+from game.spaced_repetition import ReviewScheduler
+from game.profile_store import ProfileStore
+from game.analytics import AnalyticsLog, DEATH_FALL, DEATH_ENEMY
 from game.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, SIM_DT, MAX_FRAME_TIME, RENDER_FPS,
+    DIRTY_RECT_RENDERING, IDLE_WAIT_MS, AUDIO_STREAM_EVENT, DEATH_DELAY,
     MENU, PLAYING, MATH_QUESTION, HOW_TO_PLAY,
     SCROLL_THRESH, GRAVITY, MAX_PLATFORMS, PLATFORM_GAP,
     ENEMY_SPEED, PLATFORM_SPEED, ENEMY_DISTANCE, ENEMY_VERTICAL_DISTANCE,
@@ -24,25 +41,57 @@ from game.constants import (
     WHITE, BLACK, YELLOW,
     BUTTON_WIDTH, BUTTON_HEIGHT,
     platform_group, enemy_group,
-    HIGH_SCORE_FILE
+    HIGH_SCORE_FILE, REVIEW_FILE, PROFILE_DB_FILE, ANALYTICS_DIR, DEFAULT_STUDENT, DEFAULT_GRADE
 )
 
 class GameManager:
-    def __init__(self, screen):
+    # Main menu buttons as (label, y position)
+    MENU_BUTTONS = [
+        ("Start Game", 300),
+        ("How to Play", 370),
+        ("Clear High Score", 440),
+        ("Exit", 510)
+    ]
+
+    def __init__(self, screen, headless=False, input_source=None):
         """
         Initialize game manager and all game components
         Args:
             screen: Pygame surface for the game window
+            headless (bool): Run without display output, audio or frame pacing
+            input_source: Source of key state (defaults to the real keyboard)
         """
         # Initialize display screen and game settings
         self.screen = screen
+        self.headless = headless
+        self.input_source = input_source or KeyboardInput()
 
-        # Initialize game clock
+        # Initialize game clock and fixed-timestep accumulator
         self.clock = pygame.time.Clock()
+        self.accumulator = 0.0
+
+        # Timers for the death sequence and background fades, run on game time
+        self.scheduler = Scheduler()
+        self.fade_timer = None
+        self.frame_stats = {'steps': 0, 'update_ms': 0.0, 'render_ms': 0.0,
+                            'background_ms': 0.0, 'pixels_pushed': 0}
+
+        # Dirty-rectangle rendering: only changed areas are pushed during gameplay
+        self.dirty_rects = DirtyRectTracker(SCREEN_WIDTH, SCREEN_HEIGHT) if DIRTY_RECT_RENDERING else None
+        self.presented_state = None
+        self.drawn_bg_scroll = None
+
+        # Retained-mode UI: static screens are composed into cached layers
+        # and only redrawn when their screen key changes
+        self.ui_layers = {}
+        self.drawn_ui_key = None
+        self.ui_dirty = True
+        self.hovered_button = None
 
         # Game state variables
         self.scroll = 0
         self.bg_scroll = 0
+        self.prev_bg_scroll = 0
         self.game_over = False
         self.score = 0
         self.score_threshold = OCEAN_SCORE
@@ -59,35 +108,109 @@ class GameManager:
         self.transition_active = False
         self.next_background = 0
 
-        # Initialize components
-        self.setup_fonts()
-        self.background = Background(self.screen)
-        self.sound_manager = SoundManager()
-        self.setup_sprites()
+        # Initialize components; work the menu doesn't need runs after its first frame
+        with tracer.phase('fonts'):
+            self.setup_fonts()
+        with tracer.phase('background'):
+            self.background = Background(self.screen)
+        with tracer.phase('menu sounds'):
+            self.sound_manager = NullSoundManager() if headless else SoundManager(SoundManager.MENU_SOUNDS)
+        self.deferred_startup = [self.sound_manager.load_sounds]
+        with tracer.phase('sprites'):
+            self.setup_sprites()
+        self.asset_streamer = AssetStreamer(pools=[self.enemy_pool])
         self.load_high_score()
 
     def setup_fonts(self):
         """Initialize all game fonts with error handling"""
         try:
-            self.title_font = pygame.font.SysFont('Lucida Sans', 60)
-            self.button_font = pygame.font.SysFont('Lucida Sans', 24)
-            self.font_small = pygame.font.SysFont('Lucida Sans', 20)
-            self.font_big = pygame.font.SysFont('Lucida Sans', 24)
+            self.title_font = FontRegistry.get('Lucida Sans', 60)
+            self.button_font = FontRegistry.get('Lucida Sans', 24)
+            self.font_small = FontRegistry.get('Lucida Sans', 20)
+            self.font_big = FontRegistry.get('Lucida Sans', 24)
         except pygame.error as e:
             print(f"Error loading fonts: {e}")
             sys.exit(1)
 
+        # Rendered text is cached; HUD numbers are drawn from a digit atlas
+        self.text_cache = TextCache()
+        self.hud_digits = DigitAtlas(self.font_big, WHITE)
+
     def setup_sprites(self):
         """Initialize all game sprites and sprite groups"""
         self.platform_group = platform_group
         self.enemy_group = enemy_group
-        self.create_initial_platforms()
+
+        # Killed platforms and enemies return to these pools for reuse
+        self.platform_pool = SpritePool(Platform)
+        self.enemy_pool = SpritePool(Enemy)
+        self.platform_group.pool = self.platform_pool
+        self.enemy_group.pool = self.enemy_pool
         self.jumpy = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150)
-        self.math_question = MathQuestion(self.screen, self.font_big)
+
+        # Platforms are created by reset_game() and the question by handle_death(),
+        # which takes it ready-made from the queue of questions for the student's grade
+        self.student = DEFAULT_STUDENT
+        self.grade = DEFAULT_GRADE
+        self.math_question = None
+        self.question_queue = QuestionQueue(source=self.question_source(self.grade))
+
+        # Missed questions come back sooner; headless runs keep progress in memory only.
+        # Saved progress is read on an idle menu frame, not before the first one.
+        self.review = ReviewScheduler(None if self.headless else REVIEW_FILE)
+        self.deferred_startup.append(self.review.load)
+
+        # Profile, session and answer history, written on a background thread;
+        # the database is opened on an idle menu frame
+        self.profiles = None
+        self.session = None
+        self.session_deaths = 0
+        self.session_best = 0
+        if not self.headless:
+            self.deferred_startup.append(self.open_profiles)
+
+        # Deaths, answers and run endings for python -m game.analytics; the log
+        # directory is opened on an idle menu frame
+        self.analytics = None
+        if not self.headless:
+            self.deferred_startup.append(self.open_analytics)
+
+    def open_profiles(self):
+        """Open the profile store, start the session and ask questions for the student's grade"""
+        self.profiles = ProfileStore.open(PROFILE_DB_FILE)
+        if self.profiles is None:
+            return
+        self.profiles.add_student(self.student)
+        self.session = self.profiles.start_session(self.student)
+        profile = self.profiles.student(self.student)
+        if profile is not None:
+            self.set_grade(profile['grade'])
+
+    def open_analytics(self):
+        self.analytics = AnalyticsLog.open(ANALYTICS_DIR)
+
+    def end_run(self):
+        """Log the end of the run in progress; does nothing outside a run, so no run is logged twice"""
+        if self.analytics is not None and self.game_state in (PLAYING, MATH_QUESTION):
+            self.analytics.run_end(self.current_background, self.score)
+
+    def set_grade(self, grade):
+        """
+        Ask questions for another grade from the next death on
+        Args:
+            grade (str): Grade name; ignored if no questions exist for it
+        """
+        if grade in GRADE_SKILLS and grade != self.grade:
+            self.grade = grade
+            self.question_queue.set_source(self.question_source(grade))
+
+    def question_source(self, grade):
+        # An imported question store is opened by the queue's worker, never by a frame
+        return GradeSource(grade, open_store=None if self.headless else get_store)
 
     def create_initial_platforms(self):
         """Create the initial set of platforms for game start"""
-        platform = Platform(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT - 50, 100, False)
+        platform = self.platform_pool.acquire(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT - 50, 100, False)
         self.platform_group.add(platform)
         
         last_platform = platform
@@ -96,10 +219,26 @@ class GameManager:
             p_x = random.randint(0, SCREEN_WIDTH - p_w)
             p_y = last_platform.rect.y - random.randint(80, 120)
             p_moving = random.random() < 0.3
-            platform = Platform(p_x, p_y, p_w, p_moving)
+            platform = self.platform_pool.acquire(p_x, p_y, p_w, p_moving)
             self.platform_group.add(platform)
             last_platform = platform
 
+    def finish_deferred_startup(self):
+        """Run any startup work still waiting for an idle menu frame"""
+        while self.deferred_startup:
+            self.deferred_startup.pop(0)()
+
+    def shutdown(self):
+        """Save review progress, end the session and write out queued profile and analytics records"""
+        self.review.save()
+        self.end_run()
+        if self.analytics is not None:
+            self.analytics.close()
+        if self.profiles is not None:
+            self.profiles.end_session(self.session, max(self.session_best, self.score), self.session_deaths)
+            self.profiles.close()
+            self.profiles = None
+
     def load_high_score(self):
         if os.path.exists(HIGH_SCORE_FILE):
             try:
@@ -115,17 +254,89 @@ class GameManager:
         Main game loop function
         Handles background transitions, event processing,
         state updates, and rendering.
+        The simulation advances in fixed SIM_DT steps driven by an
+        accumulator, independent of how fast frames are rendered.
         Returns:
             bool: False if game should exit, True otherwise
         """
-        # Check score and background transitions
+        if self.headless:
+            if not self.handle_events():
+                return False
+            self.step()
+            return True
+
+        # Static screens with nothing to redraw finish deferred startup work,
+        # then sleep until an event arrives; that event is handled first
+        waited = None
+        if self.ui_screen_key() is not None and not self.needs_ui_redraw():
+            if self.deferred_startup:
+                self.deferred_startup.pop(0)()
+            else:
+                event = pygame.event.wait(IDLE_WAIT_MS)
+                if event.type != pygame.NOEVENT:
+                    waited = event
+
+        frame_time = self.clock.tick(RENDER_FPS) / 1000.0
+        self.accumulator += min(frame_time, MAX_FRAME_TIME)
+
+        if not self.handle_events(waited):
+            return False
+
+        # Run as many fixed simulation steps as the elapsed time allows
+        update_start = time.perf_counter()
+        steps = 0
+        while self.accumulator >= SIM_DT:
+            self.step()
+            self.accumulator -= SIM_DT
+            steps += 1
+        render_start = time.perf_counter()
+
+        # Render between the last two steps; unchanged static screens are skipped
+        ui_key = self.ui_screen_key()
+        if ui_key is None or self.needs_ui_redraw():
+            self.draw(self.accumulator / SIM_DT)
+            self.frame_stats['background_ms'] = self.background.stats['blit_ms']
+            self.frame_stats['pixels_pushed'] = self.present()
+            tracer.first_frame()
+            self.drawn_ui_key = ui_key
+            self.ui_dirty = False
+        else:
+            self.frame_stats['pixels_pushed'] = 0
+        render_end = time.perf_counter()
+
+        self.frame_stats['steps'] = steps
+        self.frame_stats['update_ms'] = (render_start - update_start) * 1000
+        self.frame_stats['render_ms'] = (render_end - render_start) * 1000
+        return True
+
+    def step(self):
+        """
+        Advance the simulation by one tick without rendering.
+        Used by run() and by headless runs that drive the game directly.
+        """
+        self.snapshot_positions()
+        self.asset_streamer.update(self.current_background, self.score)
+        self.update_stage()
+        self.input_source.tick()
+        if self.input_source.consume_jump() and self.game_state == PLAYING:
+            self.jump()
+        self.update_game_state()
+        self.scheduler.update(SIM_DT)
+        self.question_queue.update()
+
+    def update_stage(self):
+        """
+        Check score thresholds and advance the enemy stage.
+        The stage only advances once its assets have been streamed in.
+        """
         if self.score >= self.score_threshold:
-            if self.current_background < len(self.background.background_images) - 1:
+            next_stage = self.current_background + 1
+            if next_stage < len(self.background.background_images) and ResourceManager.stage_ready(next_stage):
                 self.current_background += 1
                 # Sync global current_background to update enemy types
                 from game.constants import current_background as global_current_background
                 global_current_background = self.current_background
-                self.enemy_group.empty()
+                self.enemy_group.recycle()
                 self.next_enemy_y = -200
                 if self.current_background == 1:
                     self.score_threshold = SKY_SCORE
@@ -134,14 +345,33 @@ class GameManager:
                 elif self.current_background == 3:
                     self.score_threshold = MATH_SCORE
 
-        # Process game events
-        for event in pygame.event.get():
+    def handle_events(self, waited=None):
+        """
+        Process pending pygame events
+        Args:
+            waited: Event already taken off the queue by pygame.event.wait(),
+                handled before the queued ones so input keeps its order
+        Returns:
+            bool: False if the game should exit, True otherwise
+        """
+        events = pygame.event.get()
+        if waited is not None:
+            events.insert(0, waited)
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                self.ui_dirty = True
+            elif event.type == AUDIO_STREAM_EVENT:
+                self.sound_manager.update_streams()
+            elif event.type == pygame.MOUSEMOTION:
+                if self.game_state == MENU:
+                    self.hovered_button = self.menu_button_at(event.pos)
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     if self.game_state == PLAYING:
                         self.sound_manager.stop_background_music()
+                        self.end_run()
                         self.game_state = MENU
                     elif self.game_state == HOW_TO_PLAY:
                         self.game_state = MENU
@@ -150,8 +380,7 @@ class GameManager:
                 else:
                     if self.game_state == PLAYING:
                         if event.key in [pygame.K_SPACE, pygame.K_UP]:
-                            self.jumpy.jump()
-                            self.sound_manager.play_sound('jump')
+                            self.jump()
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if self.game_state == MENU:
                     self.handle_menu_click(event.pos)
@@ -160,16 +389,24 @@ class GameManager:
                     self.game_state = MENU
                 elif self.game_state == MATH_QUESTION:
                     self.handle_math_question_click(event.pos)
-
-        # Update game state and render
-        self.update_game_state()
-        self.draw()
-        
-        pygame.display.update()
-        self.clock.tick(FPS)
-        
         return True
 
+    def snapshot_positions(self):
+        """Record positions before a step so drawing can interpolate from them"""
+        self.prev_bg_scroll = self.bg_scroll
+        self.jumpy.snapshot()
+        for platform in self.platform_group:
+            platform.snapshot()
+        for enemy in self.enemy_group:
+            enemy.snapshot()
+
+    def jump(self):
+        """Make the player jump and play the jump sound"""
+        if self.game_over:
+            return
+        self.jumpy.jump()
+        self.sound_manager.play_sound('jump')
+
     def handle_menu_click(self, pos):
         """
         Handle clicks on menu buttons
@@ -213,9 +450,11 @@ class GameManager:
                     self.handle_math_question_result(result)
             else:
                 print("Math question object is not properly initialized")
+                self.end_run()
                 self.game_state = MENU
         except Exception as e:
             print(f"Error handling math question: {e}")
+            self.end_run()
             self.cleanup_game_state()
             self.game_state = MENU
 
@@ -226,6 +465,15 @@ class GameManager:
             result (bool): True if answer correct, False if wrong
         """
         try:
+            if self.math_question is not None:
+                question = (self.math_question.question, self.math_question.correct_answer,
+                            self.math_question.options, self.math_question.skill)
+                self.review.record(self.student, question, result)
+                if self.profiles is not None:
+                    self.profiles.record_answer(self.student, self.session, question[0], result, question[3])
+                if self.analytics is not None:
+                    self.analytics.answer(question[0], result, self.current_background, self.score,
+                                          question[3])
             if result is True:
                 if self.restore_game_state():
                     self.game_state = PLAYING
@@ -233,15 +481,18 @@ class GameManager:
                     self.sound_manager.play_background_music()
                 else:
                     print("Failed to restore game state")
+                    self.end_run()
                     self.cleanup_game_state()
                     self.reset_game()
                     self.game_state = MENU
             elif result is False:
+                self.end_run()
                 self.cleanup_game_state()
                 self.reset_game()
                 self.game_state = MENU
         except Exception as e:
             print(f"Error in handle_math_question_result: {e}")
+            self.end_run()
             self.cleanup_game_state()
             self.reset_game()
             self.game_state = MENU
@@ -254,7 +505,7 @@ class GameManager:
         """
         if self.game_state == PLAYING and not self.game_over:
             # Update player position and scrolling
-            self.scroll = self.jumpy.move()
+            self.scroll = self.jumpy.move(self.input_source)
             self.bg_scroll = (self.bg_scroll + self.scroll) % SCREEN_HEIGHT
             self.total_scroll += self.scroll
             self.score += self.scroll // 10
@@ -266,47 +517,72 @@ class GameManager:
                 p_x = random.randint(0, SCREEN_WIDTH - p_w)
                 p_y = self.platform_group.sprites()[-1].rect.y - PLATFORM_GAP
                 p_moving = random.random() < 0.3
-                platform = Platform(p_x, p_y, p_w, p_moving)
+                platform = self.platform_pool.acquire(p_x, p_y, p_w, p_moving)
                 self.platform_group.add(platform)
 
-            # Check background transitions
+            # Check background transitions (only into stages that are loaded)
             if not self.transition_active:
-                if self.score >= SPACE_SCORE and self.current_background < 3:
-                    self.transition_active = True
-                    self.next_background = 3
-                elif self.score >= SKY_SCORE and self.current_background < 2:
-                    self.transition_active = True
-                    self.next_background = 2
-                elif self.score >= OCEAN_SCORE and self.current_background < 1:
-                    self.transition_active = True
-                    self.next_background = 1
-
-            # Update background transition
-            if self.transition_active:
-                self.background_alpha = max(0, self.background_alpha - self.FADE_SPEED)
-                if self.background_alpha <= 0:
-                    self.current_background = self.next_background
-                    self.transition_active = False
-                    self.background_alpha = 255
-                    # Sync global current_background
-                    from game.constants import current_background as global_current_background
-                    global_current_background = self.current_background
+                if self.score >= SPACE_SCORE and self.current_background < 3 and ResourceManager.stage_ready(3):
+                    self.start_transition(3)
+                elif self.score >= SKY_SCORE and self.current_background < 2 and ResourceManager.stage_ready(2):
+                    self.start_transition(2)
+                elif self.score >= OCEAN_SCORE and self.current_background < 1 and ResourceManager.stage_ready(1):
+                    self.start_transition(1)
 
             # Update enemies
             self.check_spawn_enemy()
             self.enemy_group.update(self.scroll)
 
             # Check death conditions
-            if self.jumpy.rect.top > SCREEN_HEIGHT or any(self.jumpy.rect.colliderect(enemy.rect) for enemy in self.enemy_group):
+            fell = self.jumpy.rect.top > SCREEN_HEIGHT
+            if fell or self.enemy_group.collide_any(self.jumpy.rect):
                 if not self.game_over:
-                    self.handle_death()
+                    self.handle_death(DEATH_FALL if fell else DEATH_ENEMY)
+
+    def start_transition(self, next_background):
+        """
+        Start fading into another background
+        Args:
+            next_background (int): Index of the background to fade in
+        """
+        self.transition_active = True
+        self.next_background = next_background
+        self.start_fade_timer()
+
+    def start_fade_timer(self):
+        """Advance the active background fade once per simulation step"""
+        if self.fade_timer is not None:
+            self.fade_timer.cancel()
+        self.fade_timer = self.scheduler.every(SIM_DT, self.update_fade)
+
+    def update_fade(self):
+        """
+        Fade timer callback: step the background transition
+        The fade holds while the game is not being played (death, math question).
+        Returns:
+            bool: False once the transition has finished
+        """
+        if self.game_state != PLAYING or self.game_over:
+            return True
+        self.background_alpha = max(0, self.background_alpha - self.FADE_SPEED)
+        if self.background_alpha > 0:
+            return True
+        self.current_background = self.next_background
+        self.transition_active = False
+        self.background_alpha = 255
+        # Sync global current_background
+        from game.constants import current_background as global_current_background
+        global_current_background = self.current_background
+        self.fade_timer = None
+        return False
 
     def check_spawn_enemy(self):
         """
         Check if new enemies should be spawned
         Spawns enemies based on current background and score
         """
-        if len(self.enemy_group) == 0 or min(enemy.rect.y for enemy in self.enemy_group) > 0:
+        topmost_enemy = self.enemy_group.topmost()
+        if topmost_enemy is None or topmost_enemy.rect.y > 0:
             spawn_enemy = False
             if self.current_background == 0 and self.score < OCEAN_SCORE:
                 spawn_enemy = True
@@ -318,39 +594,125 @@ class GameManager:
                 spawn_enemy = True
 
             if spawn_enemy:
-                enemy = Enemy(self.next_enemy_y, self.current_background)
+                enemy = self.enemy_pool.acquire(self.next_enemy_y, self.current_background)
                 self.enemy_group.add(enemy)
                 if self.current_background == 0:
                     self.next_enemy_y -= ENEMY_VERTICAL_DISTANCE
                 else:
                     self.next_enemy_y -= ENEMY_VERTICAL_DISTANCE * 0.8
 
-    def handle_death(self):
+    def handle_death(self, cause=DEATH_FALL):
         """
         Handle player death
-        Saves game state, updates high score, and shows math question
+        Saves game state, updates high score, and schedules the math question.
+        The game keeps running (frozen, but drawing and handling events) until it appears.
+        Args:
+            cause (int): DEATH_FALL or DEATH_ENEMY, for the analytics log
         """
         self.game_over = True
+        if self.analytics is not None:
+            self.analytics.death(cause, self.current_background, self.score)
+        self.session_deaths += 1
+        self.session_best = max(self.session_best, self.score)
         self.sound_manager.stop_background_music()
         self.save_game_state()
         if self.score > self.high_score:
             self.high_score = self.score
-            with open(HIGH_SCORE_FILE, 'w') as file:
-                file.write(str(self.high_score))
+            if not self.headless:
+                with open(HIGH_SCORE_FILE, 'w') as file:
+                    file.write(str(self.high_score))
         self.sound_manager.play_sound('game_over')
-        pygame.time.delay(500)
+        self.scheduler.after(DEATH_DELAY, self.show_math_question)
+
+    def show_math_question(self):
+        """Death timer callback: switch to the math question screen"""
+        # The player may have left for the menu while the death sequence played
+        if self.game_state != PLAYING or not self.game_over:
+            return
         self.game_state = MATH_QUESTION
-        self.math_question = MathQuestion(self.screen, self.font_big)
-        self.math_question.generate_question()
-        self.math_question.active = True
+        self.math_question = MathQuestion(self.screen, self.font_big, self.sound_manager)
+        self.math_question.load(self.review.next_question(self.student, self.question_queue.take))
+
+    def ui_screen_key(self):
+        """
+        Describe everything a static screen's image depends on
+        Returns:
+            tuple: Key that changes whenever the screen must be redrawn,
+                   or None during gameplay (which redraws every frame)
+        """
+        if self.game_state == MENU:
+            return (MENU, self.high_score, self.hovered_button)
+        if self.game_state == HOW_TO_PLAY:
+            return (HOW_TO_PLAY,)
+        if self.game_state == MATH_QUESTION:
+            return (MATH_QUESTION, id(self.math_question), self.math_question.selected_option,
+                    self.score, self.high_score, self.current_background, self.bg_scroll,
+                    self.transition_active, self.background_alpha)
+        return None
+
+    def needs_ui_redraw(self):
+        """Check if the current static screen differs from what is displayed"""
+        return self.ui_dirty or self.ui_screen_key() != self.drawn_ui_key
+
+    def get_ui_layer(self, name, key, compose):
+        """
+        Get a cached full-screen layer, composing it again only if its key changed
+        Args:
+            name (str): Layer name (one cached surface per name)
+            key: Data the layer depends on
+            compose: Function that draws the layer onto a given surface
+        Returns:
+            Surface: Composed layer
+        """
+        cached = self.ui_layers.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        layer = cached[1] if cached is not None else pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        compose(layer)
+        self.ui_layers[name] = (key, layer)
+        return layer
 
-    def draw(self):
+    def menu_button_at(self, pos):
+        """
+        Find the menu button under a position
+        Args:
+            pos: Mouse position (x, y)
+        Returns:
+            int: Index into MENU_BUTTONS, or None
+        """
+        for i, (text, y) in enumerate(self.MENU_BUTTONS):
+            if self.check_button_click(pos, y):
+                return i
+        return None
+
+    def present(self):
+        """
+        Push the drawn frame to the display.
+        During gameplay only dirty rects are updated; other screens, state
+        changes and a scrolling background update the full screen.
+        Returns:
+            int: Number of pixels pushed to the display
+        """
+        if self.dirty_rects is None:
+            pygame.display.update()
+            return SCREEN_WIDTH * SCREEN_HEIGHT
+        if self.game_state != PLAYING or self.game_state != self.presented_state:
+            self.dirty_rects.force_full()
+        self.presented_state = self.game_state
+        return self.dirty_rects.present()
+
+    def mark_dirty(self, rect):
+        """Record a drawn screen area for dirty-rectangle rendering"""
+        if self.dirty_rects is not None:
+            self.dirty_rects.mark(rect)
+
+    def draw(self, alpha=1.0):
         """
         Main drawing function
         Handles rendering of all game states (menu, game, etc.)
+        Args:
+            alpha (float): Fraction of a simulation step elapsed since the last update
         """
-        self.screen.fill(BLACK)
-
         if self.game_state == MENU:
             self.draw_menu()
         elif self.game_state == HOW_TO_PLAY:
@@ -360,28 +722,45 @@ class GameManager:
             self.math_question.draw()
             self.draw_scores()
         elif self.game_state == PLAYING:
-            self.draw_game()
+            self.draw_game(alpha)
 
     def draw_menu(self):
-        """Draw the main menu screen with title and buttons"""
-        title_text = self.title_font.render("Jump and Math!", True, WHITE)
-        self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 150))
-
-        high_score_text = self.font_big.render(f"High Score: {self.high_score}", True, WHITE)
-        self.screen.blit(high_score_text, 
-                        (SCREEN_WIDTH // 2 - high_score_text.get_width() // 2, 220))
-
-        buttons = [
-            ("Start Game", 300),
-            ("How to Play", 370),
-            ("Clear High Score", 440),
-            ("Exit", 510)
-        ]
+        """Draw the main menu from its cached layer plus the hovered button"""
+        layer = self.get_ui_layer(MENU, self.high_score, self.compose_menu)
+        self.screen.blit(layer, (0, 0))
+        if self.hovered_button is not None:
+            text, y = self.MENU_BUTTONS[self.hovered_button]
+            self.draw_button(text, y, hover=True)
+
+    def compose_menu(self, surface):
+        """
+        Compose the main menu screen with title and buttons
+        Args:
+            surface: Layer surface to draw on
+        """
+        surface.fill(BLACK)
+        title_text = self.text_cache.render(self.title_font, "Jump and Math!", WHITE)
+        surface.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 150))
 
-        for text, y in buttons:
-            self.draw_button(text, y)
+        high_score_text = self.text_cache.render(self.font_big, f"High Score: {self.high_score}", WHITE)
+        surface.blit(high_score_text, 
+                     (SCREEN_WIDTH // 2 - high_score_text.get_width() // 2, 220))
+
+        for text, y in self.MENU_BUTTONS:
+            self.draw_button(text, y, surface=surface)
 
     def draw_how_to_play(self):
+        """Draw the instructions screen from its cached layer"""
+        layer = self.get_ui_layer(HOW_TO_PLAY, None, self.compose_how_to_play)
+        self.screen.blit(layer, (0, 0))
+
+    def compose_how_to_play(self, surface):
+        """
+        Compose the instructions screen
+        Args:
+            surface: Layer surface to draw on
+        """
+        surface.fill(BLACK)
         instructions = [
             "How to Play",
             "- Use LEFT and RIGHT arrows to move",
@@ -396,29 +775,68 @@ class GameManager:
         for i, line in enumerate(instructions):
             # Use big font for title, small font for instructions
             font = self.font_big if i == 0 else self.font_small
-            text = font.render(line, True, WHITE)
-            self.screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 150 + i * 35))
-
-    def draw_game(self):
-        """Draw the main gameplay screen"""
-        self.draw_game_background()
-        self.platform_group.draw(self.screen)
-        self.enemy_group.draw(self.screen)
-        self.jumpy.draw(self.screen)
+            text = self.text_cache.render(font, line, WHITE)
+            surface.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 150 + i * 35))
+
+    def draw_game(self, alpha=1.0):
+        """
+        Draw the main gameplay screen
+        Args:
+            alpha (float): Fraction of a simulation step elapsed since the last update
+        """
+        self.draw_game_background(alpha)
+        self.draw_sprites(self.platform_group, alpha)
+        self.draw_sprites(self.enemy_group, alpha)
+        self.mark_dirty(self.jumpy.draw(self.screen, alpha))
         self.draw_scores()
 
-    def draw_game_background(self):
-        """Draw the game background with transition effects if active"""
+    def draw_sprites(self, group, alpha):
+        """
+        Draw a sprite group at interpolated positions
+        Args:
+            group: Sprite group whose sprites use the Interpolated mixin
+            alpha (float): Fraction of a simulation step elapsed since the last update
+        """
+        for sprite in group:
+            self.mark_dirty(self.screen.blit(sprite.image, sprite.render_pos(alpha)))
+
+    def draw_game_background(self, alpha=1.0):
+        """
+        Draw the game background with transition effects if active
+        Args:
+            alpha (float): Fraction of a simulation step elapsed since the last update
+        """
+        # Scroll only moves forward, so the wrapped difference is the distance moved
+        scrolled = (self.bg_scroll - self.prev_bg_scroll) % SCREEN_HEIGHT
+        bg_scroll = round(self.prev_bg_scroll + scrolled * alpha) % SCREEN_HEIGHT
+        # A moving or fading background changes every pixel
+        if self.dirty_rects is not None and (bg_scroll != self.drawn_bg_scroll or self.transition_active):
+            self.dirty_rects.force_full()
+        self.drawn_bg_scroll = bg_scroll
         if self.transition_active:
             self.background.draw_transition(self.current_background, self.next_background, 
-                                         self.background_alpha, self.bg_scroll)
+                                         self.background_alpha, bg_scroll)
         else:
-            self.background.draw(self.current_background, self.bg_scroll)
+            self.background.draw(self.current_background, bg_scroll)
 
     def draw_scores(self):
-        """Draw current score and high score"""
-        self.draw_text(f"Score: {self.score}", self.font_big, WHITE, 10, 10)
-        self.draw_text(f"High Score: {self.high_score}", self.font_big, WHITE, 10, 40)
+        """Draw current score and high score from cached labels and digit glyphs"""
+        self.draw_number("Score: ", self.score, 10, 10)
+        self.draw_number("High Score: ", self.high_score, 10, 40)
+
+    def draw_number(self, label, value, x, y):
+        """
+        Draw a HUD label followed by a number without font rasterization
+        Args:
+            label (str): Static text drawn before the number
+            value (int): Number to draw
+            x (int): X position
+            y (int): Y position
+        """
+        label_surface = self.text_cache.render(self.font_big, label, WHITE)
+        self.screen.blit(label_surface, (x, y))
+        end_x = self.hud_digits.draw(self.screen, value, x + label_surface.get_width(), y)
+        self.mark_dirty((x, y, end_x - x, label_surface.get_height()))
 
     def draw_text(self, text, font, color, x, y):
         """
@@ -430,26 +848,29 @@ class GameManager:
             x (int): X position
             y (int): Y position
         """
-        img = font.render(text, True, color)
+        img = self.text_cache.render(font, text, color)
         self.screen.blit(img, (x, y))
 
-    def draw_button(self, text, y, hover=False):
+    def draw_button(self, text, y, hover=False, surface=None):
         """
         Draw a menu button
         Args:
             text (str): Button text
             y (int): Y position
             hover (bool): Whether mouse is hovering over button
+            surface: Surface to draw on (defaults to the screen)
         """
+        if surface is None:
+            surface = self.screen
         button_x = SCREEN_WIDTH // 2 - BUTTON_WIDTH // 2
         color = (90, 90, 255) if hover else (70, 70, 255)
-        pygame.draw.rect(self.screen, color, (button_x, y, BUTTON_WIDTH, BUTTON_HEIGHT))
-        pygame.draw.rect(self.screen, BLACK, (button_x, y, BUTTON_WIDTH, BUTTON_HEIGHT), 3)
+        pygame.draw.rect(surface, color, (button_x, y, BUTTON_WIDTH, BUTTON_HEIGHT))
+        pygame.draw.rect(surface, BLACK, (button_x, y, BUTTON_WIDTH, BUTTON_HEIGHT), 3)
 
-        text_surface = self.button_font.render(text, True, BLACK)
+        text_surface = self.text_cache.render(self.button_font, text, BLACK)
         text_rect = text_surface.get_rect(center=(button_x + BUTTON_WIDTH // 2, 
                                                  y + BUTTON_HEIGHT // 2))
-        self.screen.blit(text_surface, text_rect)
+        surface.blit(text_surface, text_rect)
 
     def check_button_click(self, pos, button_y):
         mouse_x, mouse_y = pos
@@ -519,28 +940,33 @@ class GameManager:
             # Restore basic state
             self.score = self.saved_game_state['score']
             self.bg_scroll = self.saved_game_state['bg_scroll']
+            self.prev_bg_scroll = self.bg_scroll
             self.current_background = self.saved_game_state['current_background']
             self.total_scroll = self.saved_game_state['total_scroll']
             self.transition_active = self.saved_game_state.get('transition_active', False)
             self.background_alpha = self.saved_game_state.get('background_alpha', 255)
             self.next_background = self.saved_game_state.get('next_background', self.current_background)
+            if self.transition_active:
+                self.start_fade_timer()
+            self.asset_streamer.require(self.current_background)
+            self.asset_streamer.require(self.next_background)
 
             # Rebuild platforms
-            self.platform_group.empty()
+            self.platform_group.recycle()
             platform_positions = self.saved_game_state.get('platform_positions', [])
             if not platform_positions:
-                platform = Platform(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT - 50, 100, False)
+                platform = self.platform_pool.acquire(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT - 50, 100, False)
                 self.platform_group.add(platform)
             else:
                 for x, y, width, moving in platform_positions:
-                    platform = Platform(x, y, width, moving)
+                    platform = self.platform_pool.acquire(x, y, width, moving)
                     self.platform_group.add(platform)
 
             # Rebuild enemies
-            self.enemy_group.empty()
+            self.enemy_group.recycle()
             for x, world_y, enemy_type in self.saved_game_state.get('enemy_positions', []):
                 if 0 <= x <= SCREEN_WIDTH:
-                    enemy = Enemy(world_y, self.current_background)
+                    enemy = self.enemy_pool.acquire(world_y, self.current_background)
                     enemy.rect.x = x
                     enemy.enemy_type = enemy_type
                     self.enemy_group.add(enemy)
@@ -561,37 +987,44 @@ class GameManager:
 
     def cleanup_game_state(self):
         """Clean up game state by resetting all variables and clearing sprite groups"""
-        self.platform_group.empty()
-        self.enemy_group.empty()
+        self.platform_group.recycle()
+        self.enemy_group.recycle()
         self.saved_game_state = None
         self.score = 0
         self.bg_scroll = 0
+        self.prev_bg_scroll = 0
         self.current_background = 0
         self.total_scroll = 0
         self.transition_active = False
         self.background_alpha = 255
         self.next_background = 0
         self.game_over = False
-        self.math_question = MathQuestion(self.screen, self.font_big)
+        self.math_question = None
+        self.scheduler.clear()
+        self.fade_timer = None
 
     def reset_game(self):
         """Reset game to initial state for new game start"""
         self.game_over = False
         self.score = 0
         self.bg_scroll = 0
+        self.prev_bg_scroll = 0
         self.total_scroll = 0
         self.score_threshold = OCEAN_SCORE
         self.next_enemy_y = -200
         self.saved_game_state = None
+        self.finish_deferred_startup()
         
-        self.platform_group.empty()
-        self.enemy_group.empty()
+        self.platform_group.recycle()
+        self.enemy_group.recycle()
         self.create_initial_platforms()
         self.jumpy = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150)
         
         self.current_background = 0
         self.transition_active = False
         self.background_alpha = 255
+        self.scheduler.clear()
+        self.fade_timer = None
         self.sound_manager.play_background_music()
         
         self.game_state = PLAYING
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Headless Simulation
+Runs GameManager without a window, audio device or frame pacing.
+
+The simulation is advanced with GameManager.step() as fast as the CPU
+allows, driven by an injectable input source. Deaths are answered
+automatically so a run can cover thousands of ticks, and the runner
+reports how many simulated frames per second were achieved.
+
+Usage:
+    python -m game.headless --ticks 10000 --seed 1
+"""
+
+import argparse
+import os
+import random
+import time
+import pygame
+from game.constants import PLAYING, MATH_QUESTION, SCREEN_WIDTH, SCREEN_HEIGHT
+from game.input_source import RandomInput
+
+
+class HeadlessRunner:
+    def __init__(self, input_source=None, seed=None):
+        """
+        Set up pygame without a display and create a headless game manager
+        Args:
+            input_source: Input source driving the player (defaults to RandomInput)
+            seed (int): Seed for the game's random module and default input
+        """
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        pygame.display.init()
+        pygame.font.init()
+
+        if seed is not None:
+            random.seed(seed)
+
+        from game.resource_manager import ResourceManager
+        from game.game_manager import GameManager
+        if ResourceManager.platform_image is None:
+            ResourceManager.initialize()
+
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.input_source = input_source or RandomInput(seed)
+        self.game = GameManager(self.screen, headless=True, input_source=self.input_source)
+        self.deaths = 0
+
+    def run(self, ticks, answer_correctly=True):
+        """
+        Advance the simulation for a fixed number of ticks
+        Args:
+            ticks (int): Number of simulation ticks to run
+            answer_correctly (bool): Revive after death instead of starting over
+        Returns:
+            dict: Tick count, elapsed seconds, deaths and simulated FPS
+        """
+        game = self.game
+        if game.game_state != PLAYING:
+            game.reset_game()
+
+        start = time.perf_counter()
+        for _ in range(ticks):
+            game.step()
+            if game.game_state == MATH_QUESTION:
+                self.deaths += 1
+                game.handle_math_question_result(answer_correctly)
+                if game.game_state != PLAYING:
+                    game.reset_game()
+        elapsed = time.perf_counter() - start
+
+        return {
+            'ticks': ticks,
+            'seconds': elapsed,
+            'deaths': self.deaths,
+            'score': game.score,
+            'simulated_fps': ticks / elapsed if elapsed > 0 else float('inf'),
+            'platform_pool': game.platform_pool.stats(),
+            'enemy_pool': game.enemy_pool.stats(),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Jump and Math without a window")
+    parser.add_argument('--ticks', type=int, default=10000, help="simulation ticks to run")
+    parser.add_argument('--seed', type=int, default=None, help="random seed")
+    args = parser.parse_args()
+
+    runner = HeadlessRunner(seed=args.seed)
+    stats = runner.run(args.ticks)
+    print(f"Ran {stats['ticks']} ticks in {stats['seconds']:.3f}s "
+          f"({stats['simulated_fps']:.0f} simulated FPS), "
+          f"{stats['deaths']} deaths, final score {stats['score']}")
+    for name in ('platform_pool', 'enemy_pool'):
+        pool = stats[name]
+        print(f"{name}: {pool['created']} created, {pool['reused']} reused "
+              f"({pool['reuse_rate']:.1%}), {pool['free']} free")
+
+
+if __name__ == "__main__":
+    main()
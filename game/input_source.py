@@ -0,0 +1,91 @@
+"""
+Input Sources
+Provides the keyboard state used by the player each simulation tick.
+
+The game normally reads the real keyboard, but any object with the same
+interface can be injected into GameManager. This lets the simulation
+run without a window, driven by scripted or random input.
+
+Interface:
+- tick(): advance the source by one simulation step
+- get_pressed(): key state indexable by pygame key constants
+- consume_jump(): True if a jump was requested this tick
+"""
+
+import random
+import pygame
+
+
+class KeyboardInput:
+    """Reads the real keyboard. Jumps arrive through KEYDOWN events instead."""
+
+    def tick(self):
+        pass
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def consume_jump(self):
+        return False
+
+
+class ScriptedInput:
+    """
+    Input source controlled from code.
+    Keys stay pressed until released; jump requests are consumed once.
+    """
+
+    def __init__(self):
+        self.pressed = set()
+        self.jump_requested = False
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    def press(self, key):
+        self.pressed.add(key)
+
+    def release(self, key):
+        self.pressed.discard(key)
+
+    def request_jump(self):
+        self.jump_requested = True
+
+    def tick(self):
+        pass
+
+    def get_pressed(self):
+        return self
+
+    def consume_jump(self):
+        jump = self.jump_requested
+        self.jump_requested = False
+        return jump
+
+
+class RandomInput(ScriptedInput):
+    """
+    Scripted input that wanders left and right and jumps at random.
+    Seeded so headless runs are reproducible.
+    """
+
+    def __init__(self, seed=None, jump_chance=0.2, turn_chance=0.05):
+        """
+        Args:
+            seed (int): Seed for the input's own random generator
+            jump_chance (float): Chance of requesting a jump each tick
+            turn_chance (float): Chance of changing direction each tick
+        """
+        super().__init__()
+        self.rng = random.Random(seed)
+        self.jump_chance = jump_chance
+        self.turn_chance = turn_chance
+
+    def tick(self):
+        if self.rng.random() < self.turn_chance:
+            self.pressed.clear()
+            choice = self.rng.choice([pygame.K_LEFT, pygame.K_RIGHT, None])
+            if choice is not None:
+                self.pressed.add(choice)
+        if self.rng.random() < self.jump_chance:
+            self.jump_requested = True
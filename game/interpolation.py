@@ -0,0 +1,49 @@
+"""
+Render Interpolation
+Helpers for drawing sprites between two fixed simulation steps.
+
+The simulation advances in fixed steps while frames are rendered at
+whatever rate the display allows. Each moving object remembers its
+position from the previous step, and drawing blends the previous and
+current positions by the fraction of a step that has elapsed.
+"""
+
+
+def lerp(start, end, alpha):
+    """
+    Linear interpolation between two values
+    Args:
+        start (float): Value at the previous simulation step
+        end (float): Value at the current simulation step
+        alpha (float): Fraction of a step elapsed (0.0 - 1.0)
+    Returns:
+        float: Blended value
+    """
+    return start + (end - start) * alpha
+
+
+class Interpolated:
+    """
+    Mixin for objects with a rect that are drawn between simulation steps.
+    Call snapshot() before each step and render_pos() when drawing.
+    """
+
+    prev_pos = None
+
+    def snapshot(self):
+        """Remember the current position as the previous step's position"""
+        self.prev_pos = self.rect.topleft
+
+    def render_pos(self, alpha=1.0):
+        """
+        Get the interpolated top-left position for drawing
+        Args:
+            alpha (float): Fraction of a step elapsed since the last update
+        Returns:
+            tuple: (x, y) position rounded to whole pixels
+        """
+        if self.prev_pos is None or alpha >= 1.0:
+            return self.rect.topleft
+        prev_x, prev_y = self.prev_pos
+        return (round(lerp(prev_x, self.rect.x, alpha)),
+                round(lerp(prev_y, self.rect.y, alpha)))
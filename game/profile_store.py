@@ -0,0 +1,316 @@
+"""
+Profile Store
+Keeps student profiles, play sessions and every answered question in a
+local SQLite database.
+
+The database runs in WAL mode, so reads never wait on the writer. Writes
+are not run where they are requested: they are put on a queue and a
+background thread commits them in batches of up to WRITE_BATCH
+statements, one transaction per batch. A frame never waits on disk. If
+a batch fails, its statements are retried one by one, so one bad
+statement loses only itself.
+Reads go through their own connection and see everything committed so
+far; call flush() first to wait for queued writes.
+
+Per-skill totals are updated in the same transaction as each outcome, so
+"a student's weakest skills" reads a few rows through the primary key
+instead of scanning the outcome history.
+
+Usage:
+    python -m game.profile_store weakest player
+    python -m game.profile_store bench --students 300
+"""
+
+import argparse
+import os
+import queue
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from game.constants import PROFILE_DB_FILE
+from game.question_bank import topic_of
+
+WRITE_BATCH = 256      # Most statements committed in one transaction
+FLUSH_INTERVAL = 0.25  # Seconds the writer waits for more statements before committing
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    name TEXT PRIMARY KEY,
+    grade TEXT,
+    gender TEXT,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    student TEXT NOT NULL REFERENCES students(name),
+    started REAL NOT NULL,
+    ended REAL,
+    best_score INTEGER NOT NULL DEFAULT 0,
+    deaths INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_by_student ON sessions(student, started);
+CREATE TABLE IF NOT EXISTS outcomes (
+    id INTEGER PRIMARY KEY,
+    student TEXT NOT NULL,
+    session TEXT,
+    question TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    answered REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outcomes_by_student ON outcomes(student, answered);
+CREATE TABLE IF NOT EXISTS skill_stats (
+    student TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    seen INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    PRIMARY KEY (student, skill)
+) WITHOUT ROWID;
+"""
+
+ADD_STUDENT = "INSERT INTO students (name, grade, gender, created) VALUES (?, ?, ?, ?) " \
+              "ON CONFLICT(name) DO UPDATE SET grade = coalesce(excluded.grade, grade), " \
+              "gender = coalesce(excluded.gender, gender)"
+START_SESSION = "INSERT INTO sessions (id, student, started) VALUES (?, ?, ?)"
+END_SESSION = "UPDATE sessions SET ended = ?, best_score = ?, deaths = ? WHERE id = ?"
+ADD_OUTCOME = "INSERT INTO outcomes (student, session, question, skill, correct, answered) " \
+              "VALUES (?, ?, ?, ?, ?, ?)"
+ADD_SKILL_RESULT = "INSERT INTO skill_stats (student, skill, seen, correct) VALUES (?, ?, 1, ?) " \
+                   "ON CONFLICT(student, skill) DO UPDATE SET seen = seen + 1, " \
+                   "correct = correct + excluded.correct"
+
+
+def connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; only the last commits can be lost
+    return connection
+
+
+class ProfileStore:
+    def __init__(self, path=PROFILE_DB_FILE):
+        """
+        Open (or create) the database and start the writer thread
+        Args:
+            path (str): SQLite database file
+        Raises:
+            sqlite3.Error: If the database can't be opened
+        """
+        self.path = path
+        self.reader = connect(path)
+        self.reader.executescript(SCHEMA)
+        self.writes = queue.Queue()
+        self.stats = {'statements': 0, 'batches': 0, 'failed': 0}
+        self.writer = threading.Thread(target=self.write_loop, name='profile-writer', daemon=True)
+        self.writer.start()
+
+    @classmethod
+    def open(cls, path=PROFILE_DB_FILE):
+        """
+        Open the store, or return None if the database is unusable
+        Args:
+            path (str): SQLite database file
+        Returns:
+            ProfileStore: The store, or None
+        """
+        try:
+            return cls(path)
+        except sqlite3.Error as e:
+            print(f"Error opening profile store: {e}")
+            return None
+
+    def write_loop(self):
+        """Writer thread: commit queued statements in batches until close() is called"""
+        connection = connect(self.path)
+        running = True
+        while running:
+            batch = [self.writes.get()]
+            # Gather whatever else arrives shortly, up to a full batch
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(batch) < WRITE_BATCH and batch[-1] is not None:
+                try:
+                    batch.append(self.writes.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            statements = [item for item in batch if item is not None]
+            running = len(statements) == len(batch)
+            if statements:
+                try:
+                    with connection:
+                        for sql, params in statements:
+                            connection.execute(sql, params)
+                    self.stats['statements'] += len(statements)
+                    self.stats['batches'] += 1
+                except sqlite3.Error:
+                    # The batch was rolled back; commit what can be committed one statement at a time
+                    self.write_each(connection, statements)
+            for _ in batch:
+                self.writes.task_done()
+        connection.close()
+
+    def write_each(self, connection, statements):
+        for sql, params in statements:
+            try:
+                with connection:
+                    connection.execute(sql, params)
+                self.stats['statements'] += 1
+            except sqlite3.Error as e:
+                self.stats['failed'] += 1
+                print(f"Error writing profiles: {e}")
+
+    def write(self, sql, params):
+        self.writes.put((sql, params))
+
+    def flush(self):
+        """Wait until every queued write has been committed"""
+        self.writes.join()
+
+    def close(self):
+        """Commit queued writes, stop the writer and close the database"""
+        self.writes.put(None)
+        self.writer.join()
+        self.reader.close()
+
+    def add_student(self, name, grade=None, gender=None):
+        """
+        Create a profile, or update the grade and gender of an existing one
+        Args:
+            name (str): Student name
+            grade (str): Grade such as "5th", or None to keep the saved one
+            gender (str): Gender as chosen in the menu, or None to keep the saved one
+        """
+        self.write(ADD_STUDENT, (name, grade, gender, time.time()))
+
+    def start_session(self, name):
+        """
+        Record the start of a play session
+        Args:
+            name (str): Student name
+        Returns:
+            str: Session id, for end_session() and record_answer()
+        """
+        session = uuid.uuid4().hex
+        self.write(START_SESSION, (session, name, time.time()))
+        return session
+
+    def end_session(self, session, best_score, deaths):
+        self.write(END_SESSION, (time.time(), best_score, deaths, session))
+
+    def record_answer(self, name, session, question, correct, skill=None):
+        """
+        Record one answered question and update the student's skill totals
+        Args:
+            name (str): Student name
+            session (str): Session id, or None
+            question (str): Question text
+            correct (bool): Whether the answer was right
+            skill (str): Skill name (guessed from the question text if not given)
+        """
+        skill = skill or topic_of(question)
+        self.write(ADD_OUTCOME, (name, session, question, skill, int(correct), time.time()))
+        self.write(ADD_SKILL_RESULT, (name, skill, int(correct)))
+
+    def student(self, name):
+        """
+        Returns:
+            dict: The student's profile, or None if there is none
+        """
+        row = self.reader.execute("SELECT name, grade, gender, created FROM students WHERE name = ?",
+                                  (name,)).fetchone()
+        return dict(zip(('name', 'grade', 'gender', 'created'), row)) if row else None
+
+    def sessions(self, name, limit=10):
+        """
+        Returns:
+            list: The student's latest (started, ended, best score, deaths) sessions
+        """
+        return self.reader.execute(
+            "SELECT started, ended, best_score, deaths FROM sessions WHERE student = ? "
+            "ORDER BY started DESC LIMIT ?", (name, limit)).fetchall()
+
+    def weakest_skills(self, name, limit=3, min_seen=3):
+        """
+        Find the skills a student gets wrong most often
+        Args:
+            name (str): Student name
+            limit (int): Number of skills to return
+            min_seen (int): Skip skills answered fewer times than this
+        Returns:
+            list: (skill, accuracy, times answered) tuples, weakest first
+        """
+        return self.reader.execute(
+            "SELECT skill, CAST(correct AS REAL) / seen AS accuracy, seen FROM skill_stats "
+            "WHERE student = ? AND seen >= ? ORDER BY accuracy, seen DESC LIMIT ?",
+            (name, min_seen, limit)).fetchall()
+
+
+def bench(students=300, answers=200):
+    """
+    Fill a temporary database and time queued writes and the weakest-skills query
+    Args:
+        students (int): Number of students
+        answers (int): Answers recorded per student
+    Returns:
+        dict: Enqueue and commit times, batch count and query time
+    """
+    skills = ['addition', 'subtraction', 'multiplication', 'division', 'fractions', 'negatives']
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as directory:
+        store = ProfileStore(os.path.join(directory, 'profiles.db'))
+        start = time.perf_counter()
+        for s in range(students):
+            name = f"student{s}"
+            store.add_student(name, rng.choice(["5th", "6th", "7th", "8th"]))
+            session = store.start_session(name)
+            for _ in range(answers):
+                skill = rng.choice(skills)
+                store.record_answer(name, session, f"{skill} question", rng.random() < 0.7, skill)
+            store.end_session(session, rng.randrange(1000), answers)
+        enqueue_seconds = time.perf_counter() - start
+        store.flush()
+        commit_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for s in range(students):
+            store.weakest_skills(f"student{s}")
+        query_seconds = (time.perf_counter() - start) / students
+        batches = store.stats['batches']
+        store.close()
+    writes = students * (answers * 2 + 3)
+    return {'writes': writes, 'enqueue_us': enqueue_seconds / writes * 1e6,
+            'commit_s': commit_seconds, 'batches': batches, 'query_us': query_seconds * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or benchmark the student profile store")
+    parser.add_argument('command', choices=['weakest', 'sessions', 'bench'])
+    parser.add_argument('student', nargs='?', help="student name")
+    parser.add_argument('--db', default=PROFILE_DB_FILE, help="database file")
+    parser.add_argument('--students', type=int, default=300, help="students to simulate for bench")
+    args = parser.parse_args()
+
+    if args.command == 'bench':
+        results = bench(args.students)
+        print(f"{results['writes']} writes: {results['enqueue_us']:.1f} us each to queue, "
+              f"all committed after {results['commit_s']:.2f}s in {results['batches']} batches")
+        print(f"Weakest skills query: {results['query_us']:.0f} us")
+        return
+    if not args.student:
+        parser.error(f"{args.command} needs a student name")
+    store = ProfileStore(args.db)
+    if args.command == 'weakest':
+        for skill, accuracy, seen in store.weakest_skills(args.student):
+            print(f"{skill:<16}{accuracy:6.0%} of {seen}")
+    else:
+        for started, ended, best_score, deaths in store.sessions(args.student):
+            minutes = (ended - started) / 60 if ended else 0
+            print(f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(started))}  "
+                  f"{minutes:5.1f} min  best {best_score}  deaths {deaths}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
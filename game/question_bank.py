@@ -0,0 +1,159 @@
+"""
+Question Bank
+Stores questions by grade and topic and draws them without replacement.
+
+Every (grade, topic) pair and every grade as a whole has a SamplingPool.
+A pool is an incremental Fisher-Yates shuffle: each draw swaps a random
+not-yet-drawn entry into place, so a draw is O(1) no matter how many
+questions the grade holds, and every question is drawn once per cycle.
+When a cycle is used up the next one starts automatically without
+moving anything. Questions with the same grade and text are stored once.
+"""
+
+import random
+import re
+from collections import namedtuple
+
+Question = namedtuple('Question', ['text', 'answer', 'grade', 'topic'])
+
+# Operator symbol -> topic, checked in order
+TOPICS = [('×', 'multiplication'), ('*', 'multiplication'), ('÷', 'division'), ('/', 'division'),
+          ('+', 'addition'), ('-', 'subtraction')]
+OPERATOR = re.compile(r'\d\s*([×*÷/+\-])\s*-?\d')
+
+
+def topic_of(text):
+    """
+    Guess a question's topic from the first operator between two numbers
+    Args:
+        text (str): Question text, such as "What is 12 × 2?"
+    Returns:
+        str: Topic name, or 'other' if no operator is found
+    """
+    match = OPERATOR.search(text)
+    if match:
+        for symbol, topic in TOPICS:
+            if match.group(1) == symbol:
+                return topic
+    return 'other'
+
+
+class SamplingPool:
+    def __init__(self, rng):
+        """
+        Initialize an empty pool
+        Args:
+            rng (random.Random): Random source shared with the bank
+        """
+        self.rng = rng
+        self.ids = []    # Drawn ids of this cycle come first, then the undrawn ones
+        self.cursor = 0  # Number of ids drawn in the current cycle
+        self.cycles = 0
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, item_id):
+        """Add an id; it can be drawn in the current cycle"""
+        self.ids.append(item_id)
+
+    def draw(self):
+        """
+        Draw an id that hasn't been drawn this cycle
+        Returns:
+            int: Item id, or None if the pool is empty
+        """
+        count = len(self.ids)
+        if not count:
+            return None
+        if self.cursor == count:
+            self.cursor = 0
+            self.cycles += 1
+            # The last id of the finished cycle sits at the end; skip it so
+            # the new cycle never starts with a repeat of the previous draw
+            last = count - 1 if count > 1 else count
+        else:
+            last = count
+        index = self.rng.randrange(self.cursor, last)
+        ids = self.ids
+        ids[self.cursor], ids[index] = ids[index], ids[self.cursor]
+        self.cursor += 1
+        return ids[self.cursor - 1]
+
+
+class QuestionBank:
+    def __init__(self, seed=None):
+        """
+        Initialize an empty bank
+        Args:
+            seed (int): Random seed for reproducible draws
+        """
+        self.rng = random.Random(seed)
+        self.items = []   # Question tuples indexed by item id
+        self.keys = {}    # (grade, text) -> item id, used to skip duplicates
+        self.pools = {}   # (grade, topic) -> SamplingPool; topic None covers the whole grade
+        self.duplicates = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, grade, text, answer, topic=None):
+        """
+        Add a question unless the grade already has one with the same text
+        Args:
+            grade (str): Grade name, such as "5th"
+            text (str): Question text
+            answer: Correct answer
+            topic (str): Topic name (guessed from the text if not given)
+        Returns:
+            int: Item id, or None if the question was a duplicate
+        """
+        key = (grade, text)
+        if key in self.keys:
+            self.duplicates += 1
+            return None
+        topic = topic or topic_of(text)
+        item_id = len(self.items)
+        self.items.append(Question(text, answer, grade, topic))
+        self.keys[key] = item_id
+        for pool_key in ((grade, None), (grade, topic)):
+            pool = self.pools.get(pool_key)
+            if pool is None:
+                pool = self.pools[pool_key] = SamplingPool(self.rng)
+            pool.add(item_id)
+        return item_id
+
+    def add_many(self, grade, questions):
+        """
+        Add (text, answer) pairs to a grade
+        Args:
+            grade (str): Grade name
+            questions (iterable): (text, answer) pairs
+        Returns:
+            int: Number of questions added (duplicates are skipped)
+        """
+        return sum(self.add(grade, text, answer) is not None for text, answer in questions)
+
+    def grades(self):
+        return sorted({grade for grade, _ in self.pools})
+
+    def topics(self, grade):
+        return sorted(topic for pool_grade, topic in self.pools if pool_grade == grade and topic)
+
+    def count(self, grade, topic=None):
+        pool = self.pools.get((grade, topic))
+        return len(pool) if pool else 0
+
+    def draw(self, grade, topic=None):
+        """
+        Draw a question without replacement, starting a new cycle when all have been drawn
+        Args:
+            grade (str): Grade name
+            topic (str): Topic name, or None for any topic in the grade
+        Returns:
+            Question: The drawn question, or None if there are no matching questions
+        """
+        pool = self.pools.get((grade, topic))
+        if pool is None:
+            return None
+        return self.items[pool.draw()]
@@ -0,0 +1,293 @@
+"""
+Question Batches
+Generates arithmetic questions with their answer options in bulk and
+keeps a queue of ready questions so a death never waits for one.
+
+Questions match MathQuestion.generate_question(): two operands from 1
+to 10, an operator from +, - and *, and three distinct wrong answers
+within DISTRACTOR_RANGE of the correct one, shuffled in with it. Wrong
+answers are drawn without a rejection loop. With NumPy installed a
+whole batch is generated with array operations; otherwise a pure
+Python path with the same distribution is used.
+
+QuestionQueue refills itself on a worker thread whenever it runs low,
+so taking a question is a deque pop. By default it uses these 1-10
+operand questions; the game gives it a GradeSource, which serves the
+player's grade from the imported question store if there is one, and
+otherwise makes questions with game.question_generator. A batch whose
+source fails is replaced by 1-10 operand questions, so the game loop
+never sees the error.
+
+Usage:
+    python -m game.question_batch   # questions per second for each generator
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from game.question_generator import QuestionGenerator
+from game.question_store import expression_of, parse_answer
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional; the pure Python generator is used instead
+    numpy = None
+
+OPERATORS = ['+', '-', '*']
+SKILLS = {'+': 'addition', '-': 'subtraction', '*': 'multiplication'}  # Skill of each operator
+OPERAND_MIN = 1
+OPERAND_MAX = 10
+DISTRACTOR_RANGE = 20  # Wrong answers are within this distance of the correct one
+OPTION_COUNT = 4
+
+
+def _options_python(correct, rng):
+    low = max(0, correct - DISTRACTOR_RANGE)
+    wrong = rng.sample([value for value in range(low, correct + DISTRACTOR_RANGE + 1)
+                        if value != correct], OPTION_COUNT - 1)
+    options = [correct] + wrong
+    rng.shuffle(options)
+    return options
+
+
+def generate_batch_python(count, rng=None):
+    """
+    Generate questions one at a time with the random module
+    Args:
+        count (int): Number of questions
+        rng: random.Random instance or the random module (a new Random if not given)
+    Returns:
+        list: (question text, correct answer, options, skill) tuples
+    """
+    rng = rng or random.Random()
+    batch = []
+    for _ in range(count):
+        num1 = rng.randint(OPERAND_MIN, OPERAND_MAX)
+        num2 = rng.randint(OPERAND_MIN, OPERAND_MAX)
+        operator = rng.choice(OPERATORS)
+        if operator == '+':
+            correct = num1 + num2
+        elif operator == '-':
+            correct = num1 - num2
+        else:
+            correct = num1 * num2
+        batch.append((f"{num1} {operator} {num2} = ?", correct, _options_python(correct, rng), SKILLS[operator]))
+    return batch
+
+
+def generate_batch_numpy(count, rng=None):
+    """
+    Generate a batch of questions with NumPy array operations
+    Args:
+        count (int): Number of questions
+        rng (numpy.random.Generator): Random source (a new one if not given)
+    Returns:
+        list: (question text, correct answer, options, skill) tuples
+    """
+    rng = rng or numpy.random.default_rng()
+    num1 = rng.integers(OPERAND_MIN, OPERAND_MAX + 1, count)
+    num2 = rng.integers(OPERAND_MIN, OPERAND_MAX + 1, count)
+    operator = rng.integers(0, len(OPERATORS), count)
+    correct = numpy.select([operator == 0, operator == 1], [num1 + num2, num1 - num2], num1 * num2)
+
+    # Candidate wrong answers are low + 0..width-1. Each row gives its valid
+    # candidates random keys and keeps the three smallest, which is a
+    # uniform sample of distinct values with no retries.
+    width = 2 * DISTRACTOR_RANGE + 1
+    low = numpy.maximum(0, correct - DISTRACTOR_RANGE)
+    candidates = low[:, None] + numpy.arange(width)
+    valid = (candidates <= (correct + DISTRACTOR_RANGE)[:, None]) & (candidates != correct[:, None])
+    keys = numpy.where(valid, rng.random((count, width)), numpy.inf)
+    picks = numpy.argpartition(keys, OPTION_COUNT - 2, axis=1)[:, :OPTION_COUNT - 1]
+    wrong = numpy.take_along_axis(candidates, picks, axis=1)
+
+    # Shuffle the correct answer in with the wrong ones
+    options = numpy.concatenate([correct[:, None], wrong], axis=1)
+    order = numpy.argsort(rng.random((count, OPTION_COUNT)), axis=1)
+    options = numpy.take_along_axis(options, order, axis=1)
+
+    symbols = [OPERATORS[i] for i in operator.tolist()]
+    return [(f"{a} {op} {b} = ?", c, row, SKILLS[op])
+            for a, op, b, c, row in zip(num1.tolist(), symbols, num2.tolist(),
+                                        correct.tolist(), options.tolist())]
+
+
+class GradeSource:
+    def __init__(self, grade, seed=None, open_store=None):
+        """
+        Produce batches of grade-appropriate questions (see game.question_generator)
+        Args:
+            grade (str): Grade name, a key of GRADE_SKILLS
+            seed (int): Random seed for reproducible questions
+            open_store (callable): Returns the imported QuestionStore or None;
+                called on the worker thread with the first batch
+        """
+        self.grade = grade
+        self.generator = QuestionGenerator(grade, seed)
+        self.open_store = open_store
+        self.store = None
+
+    def __call__(self, count):
+        """
+        Generate a batch, drawing from the imported store if it has questions
+        for the grade; generated questions start over once the grade's skills
+        run out of unseen ones
+        Args:
+            count (int): Number of questions
+        Returns:
+            list: (question text, correct answer, options, skill) tuples
+        """
+        if self.open_store is not None:
+            store = self.open_store()
+            self.open_store = None
+            if store is not None and store.count(self.grade):
+                self.store = store
+        if self.store is not None:
+            return [self.stored_question() for _ in range(count)]
+        batch = self.generator.generate_many(count)
+        if len(batch) < count:
+            self.generator.seen.clear()
+            batch += self.generator.generate_many(count - len(batch))
+        return batch
+
+    def stored_question(self):
+        index = self.store.draw_index(self.grade)
+        text, answer = self.store.question(index)
+        options = self.generator.options(expression_of(text) or '', Fraction(answer))
+        return (text, answer, [parse_answer(str(option)) for option in options], self.store.topic_at(index))
+
+
+def generate_batch(count):
+    """
+    Generate a batch of questions with the fastest available generator
+    Args:
+        count (int): Number of questions
+    Returns:
+        list: (question text, correct answer, options, skill) tuples
+    """
+    if numpy is not None:
+        return generate_batch_numpy(count)
+    return generate_batch_python(count)
+
+
+class QuestionQueue:
+    def __init__(self, batch_size=256, low_water=32, source=generate_batch):
+        """
+        Initialize an empty queue; the first update() starts generating
+        Args:
+            batch_size (int): Questions generated per refill
+            low_water (int): Refill when fewer questions than this are ready
+            source (callable): Takes a count and returns that many
+                (question text, correct answer, options, skill) tuples
+        """
+        self.batch_size = batch_size
+        self.low_water = low_water
+        self.source = source
+        self.ready = deque()
+        self.pending = None  # Future of the batch being generated
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='question-batch')
+        self.stats = {'served': 0, 'batches': 0, 'sync_batches': 0, 'failed_batches': 0}
+
+    def __len__(self):
+        return len(self.ready)
+
+    def update(self):
+        """
+        Collect a finished batch and start a new one if the queue is low.
+        Called once per simulation step; never waits for the worker.
+        """
+        if self.pending is not None and self.pending.done():
+            self.ready.extend(self.collect())
+            self.stats['batches'] += 1
+        if self.pending is None and len(self.ready) < self.low_water:
+            self.pending = self.executor.submit(self.source, self.batch_size)
+
+    def collect(self):
+        """
+        Take the pending batch, waiting for it if needed. If the source
+        failed or made nothing, 1-10 operand questions are used instead, so
+        a death always gets a question.
+        Returns:
+            list: (question text, correct answer, options, skill) tuples
+        """
+        future, self.pending = self.pending, None
+        try:
+            batch = future.result()
+        except Exception as e:
+            print(f"Error generating questions: {e}")
+            batch = None
+        if not batch:
+            self.stats['failed_batches'] += 1
+            batch = generate_batch_python(self.batch_size)
+        return batch
+
+    def set_source(self, source):
+        """
+        Switch to another question source, dropping questions made by the old one
+        Args:
+            source (callable): New source, as for __init__()
+        """
+        self.source = source
+        self.ready.clear()
+        self.pending = None  # A batch still being made by the old source is ignored
+        self.update()
+
+    def take(self):
+        """
+        Get the next prepared question
+        Returns:
+            tuple: (question text, correct answer, options, skill)
+        """
+        if not self.ready:
+            # Only happens if questions are taken faster than a batch is generated
+            if self.pending is None:
+                self.pending = self.executor.submit(self.source, 1)
+            self.ready.extend(self.collect())
+            self.stats['sync_batches'] += 1
+        self.stats['served'] += 1
+        question = self.ready.popleft()
+        self.update()
+        return question
+
+
+def bench(count=100000, repeats=3):
+    """
+    Measure generator throughput
+    Args:
+        count (int): Questions per timed batch
+        repeats (int): Number of timed batches per generator
+    Returns:
+        dict: Generator name -> questions per second (best run)
+    """
+    generators = {'python': generate_batch_python}
+    if numpy is not None:
+        generators['numpy'] = generate_batch_numpy
+    results = {}
+    for name, generate in generators.items():
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            generate(count)
+            best = min(best, time.perf_counter() - start)
+        results[name] = count / best
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch question generation")
+    parser.add_argument('--count', type=int, default=100000, help="questions per batch")
+    args = parser.parse_args()
+    results = bench(args.count)
+    for name, rate in results.items():
+        print(f"{name:<8}{rate:12,.0f} questions/s")
+    if 'numpy' in results:
+        print(f"NumPy is {results['numpy'] / results['python']:.1f}x faster")
+    else:
+        print("NumPy is not installed; only the pure Python generator was measured")
+
+
+if __name__ == "__main__":
+    main()
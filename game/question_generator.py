@@ -0,0 +1,454 @@
+"""
+Question Generator
+Builds grade-appropriate arithmetic questions from skill templates and
+checks each one before it is used.
+
+Every grade has a set of skills (multi-step whole numbers, order of
+operations, fractions, negative numbers, ...). A skill builds a small
+expression tree with Fraction leaves, so answers are exact. The tree is
+rendered to text with only the parentheses the precedence rules need.
+
+verify() then reads the text back without looking at the tree. It parses
+the text twice: once with "a/b" as a fraction, and once with "/" as a
+division sign. If the two readings disagree (as in "6 ÷ 1/2"), the
+question is ambiguous and is rejected. Results are memoized by text. A
+generator also rejects questions it has already produced, counting
+"a + b" and "b + a" as the same question.
+
+Wrong answers come from typical mistakes first: evaluating strictly left
+to right, and a flipped sign. Nearby values fill the rest, so there are
+always three.
+
+Usage:
+    python -m game.question_generator --count 2000   # unique questions per second for every grade
+"""
+
+import argparse
+import itertools
+import random
+import re
+import time
+from fractions import Fraction
+from functools import lru_cache
+from math import gcd
+
+ADD, SUB, MUL, DIV = '+', '-', '×', '÷'
+PRECEDENCE = {ADD: 1, SUB: 1, MUL: 2, DIV: 2}
+APPLY = {ADD: lambda a, b: a + b, SUB: lambda a, b: a - b,
+         MUL: lambda a, b: a * b, DIV: lambda a, b: a / b}
+
+OPTION_COUNT = 4
+MAX_ATTEMPTS = 50  # Tries per question before a skill is considered exhausted
+
+
+# Expression trees: a Fraction leaf, or (operator, left, right)
+
+def evaluate(node):
+    if isinstance(node, Fraction):
+        return node
+    operator, left, right = node
+    return APPLY[operator](evaluate(left), evaluate(right))
+
+
+def format_number(value):
+    """Write a Fraction as "7", "-7", "3/4" or "-3/4" """
+    return str(value.numerator) if value.denominator == 1 else f"{value.numerator}/{value.denominator}"
+
+
+def render(node, first=True):
+    """
+    Write an expression with only the parentheses precedence requires
+    Args:
+        node: Expression tree
+        first (bool): Whether the node starts the whole expression
+    Returns:
+        str: Expression text, such as "3 + 4 × (-2)"
+    """
+    if isinstance(node, Fraction):
+        text = format_number(node)
+        return text if first or node >= 0 else f"({text})"
+    operator, left, right = node
+    left_text = render(left, first)
+    right_text = render(right, False)
+    if not isinstance(left, Fraction) and PRECEDENCE[left[0]] < PRECEDENCE[operator]:
+        left_text = f"({render(left)})"
+    if not isinstance(right, Fraction):
+        if (PRECEDENCE[right[0]] < PRECEDENCE[operator] or
+                (PRECEDENCE[right[0]] == PRECEDENCE[operator] and operator in (SUB, DIV))):
+            right_text = f"({render(right)})"
+    elif operator == DIV and right.denominator != 1 and right >= 0:
+        # "6 ÷ 1/2" could be read as (6 ÷ 1) / 2
+        right_text = f"({right_text})"
+    return f"{left_text} {operator} {right_text}"
+
+
+def canonical(node):
+    """Key that is equal for questions differing only in the order of + or × operands"""
+    if isinstance(node, Fraction):
+        return format_number(node)
+    operator, left, right = node
+    parts = [canonical(left), canonical(right)]
+    if operator in (ADD, MUL):
+        parts.sort()
+    return f"({parts[0]}{operator}{parts[1]})"
+
+
+# Reading text back
+
+TOKEN = re.compile(r'\s*(\d+|[-+×÷/()])')
+
+
+def tokenize(text):
+    tokens = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = TOKEN.match(text, position)
+        if not match:
+            raise ValueError(f"Unexpected character in {text!r}")
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+class Parser:
+    def __init__(self, tokens, slash_is_division=False, left_to_right=False):
+        """
+        Parse a tokenized expression
+        Args:
+            tokens (list): Tokens from tokenize()
+            slash_is_division (bool): Read "/" as a division sign instead of a fraction bar
+            left_to_right (bool): Ignore precedence and apply operators in order
+        """
+        self.tokens = tokens
+        self.position = 0
+        self.slash_is_division = slash_is_division
+        self.left_to_right = left_to_right
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self, expected=None):
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise ValueError(f"Expected {expected or 'a token'}, got {token}")
+        self.position += 1
+        return token
+
+    def parse(self):
+        value = self.expression()
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected {self.peek()}")
+        return value
+
+    def operators(self, level):
+        if self.left_to_right:
+            level = None
+        if level == 1:
+            return (ADD, SUB)
+        division = (MUL, DIV, '/') if self.slash_is_division else (MUL, DIV)
+        return division if level == 2 else (ADD, SUB) + division
+
+    def expression(self):
+        if self.left_to_right:
+            return self.binary(self.factor, None)
+        return self.binary(self.term, 1)
+
+    def term(self):
+        return self.binary(self.factor, 2)
+
+    def binary(self, operand, level):
+        value = operand()
+        while self.peek() in self.operators(level):
+            token = self.take()
+            value = APPLY[DIV if token == '/' else token](value, operand())
+        return value
+
+    def factor(self):
+        token = self.peek()
+        if token == '-':
+            self.take()
+            return -self.factor()
+        if token == '(':
+            self.take()
+            value = self.expression()
+            self.take(')')
+            return value
+        value = Fraction(int(self.take()))
+        if not self.slash_is_division and self.peek() == '/':
+            self.take()
+            value /= int(self.take())
+        return value
+
+
+@lru_cache(maxsize=65536)
+def verify(text):
+    """
+    Check that an expression has exactly one reading and compute its value
+    Args:
+        text (str): Expression text, without "= ?"
+    Returns:
+        Fraction: The value, or None if the text is malformed, divides by zero
+                  or means different things depending on how "/" is read
+    """
+    try:
+        tokens = tokenize(text)
+        as_fraction = Parser(tokens).parse()
+        as_division = Parser(tokens, slash_is_division=True).parse()
+    except (ValueError, ZeroDivisionError):
+        return None
+    return as_fraction if as_fraction == as_division else None
+
+
+def left_to_right_value(text):
+    """Value a student gets by ignoring precedence (None if that divides by zero)"""
+    try:
+        return Parser(tokenize(text), left_to_right=True).parse()
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+# Skill templates: each takes a random.Random and returns an expression tree
+
+def _n(value):
+    return Fraction(value)
+
+
+def _fraction(rng, max_denominator):
+    denominator = rng.randint(2, max_denominator)
+    return Fraction(rng.randint(1, denominator - 1), denominator)
+
+
+def _nonzero(rng, low, high):
+    value = 0
+    while value == 0:
+        value = rng.randint(low, high)
+    return value
+
+
+def multi_digit_add_sub(rng):
+    a, b = rng.randint(100, 999), rng.randint(10, 999)
+    if rng.random() < 0.5:
+        return (ADD, _n(a), _n(b))
+    return (SUB, _n(max(a, b)), _n(min(a, b)))
+
+
+def multiplication_facts(rng):
+    return (MUL, _n(rng.randint(2, 12)), _n(rng.randint(2, 12)))
+
+
+def two_step_whole(rng):
+    a, b = rng.randint(10, 99), rng.randint(10, 99)
+    return (SUB, (ADD, _n(a), _n(b)), _n(rng.randint(1, a + b)))
+
+
+def order_of_operations(rng):
+    a, b, c = rng.randint(2, 12), rng.randint(2, 12), rng.randint(2, 12)
+    form = rng.randrange(3)
+    if form == 0:
+        return (ADD, _n(a), (MUL, _n(b), _n(c)))
+    if form == 1:
+        return (SUB, (MUL, _n(a), _n(b)), _n(rng.randint(1, a * b)))
+    return (ADD, _n(c), (DIV, _n(a * b), _n(b)))
+
+
+def exact_division(rng):
+    divisor = rng.randint(2, 12)
+    return (DIV, _n(divisor * rng.randint(2, 15)), _n(divisor))
+
+
+def like_fractions(rng):
+    # Numerators coprime with the denominator keep both fractions in lowest terms
+    denominator = rng.choice([3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
+    numerators = [n for n in range(1, denominator) if gcd(n, denominator) == 1]
+    a, b = rng.choice(numerators), rng.choice(numerators)
+    if rng.random() < 0.5:
+        return (ADD, Fraction(a, denominator), Fraction(b, denominator))
+    return (SUB, Fraction(max(a, b), denominator), Fraction(min(a, b), denominator))
+
+
+def integer_operations(rng):
+    operator = rng.choice([ADD, SUB, MUL, DIV])
+    if operator == DIV:
+        divisor = _nonzero(rng, -12, 12)
+        return (DIV, _n(divisor * rng.randint(-12, 12)), _n(divisor))
+    return (operator, _n(_nonzero(rng, -20, 20)), _n(_nonzero(rng, -20, 20)))
+
+
+def unlike_fractions(rng):
+    left, right = _fraction(rng, 10), _fraction(rng, 10)
+    return (rng.choice([ADD, SUB]), left, right)
+
+
+def parentheses(rng):
+    a, b, c = _nonzero(rng, -12, 12), _nonzero(rng, -12, 12), rng.randint(2, 9)
+    if rng.random() < 0.5:
+        return (MUL, (rng.choice([ADD, SUB]), _n(a), _n(b)), _n(c))
+    return (MUL, _n(c), (SUB, _n(a), _n(b)))
+
+
+def fraction_multiply_divide(rng):
+    return (rng.choice([MUL, DIV]), _fraction(rng, 9), _fraction(rng, 9))
+
+
+def mixed_negatives_fractions(rng):
+    return (ADD, _n(_nonzero(rng, -15, -1)), (MUL, _fraction(rng, 8), _n(rng.randint(2, 12))))
+
+
+def multi_step(rng):
+    divisor = rng.randint(2, 9)
+    product = (MUL, _n(_nonzero(rng, -9, 9)), _n(rng.randint(2, 9)))
+    quotient = (DIV, _n(divisor * rng.randint(1, 9)), _n(divisor))
+    return (rng.choice([ADD, SUB]), product, quotient)
+
+
+SKILLS = {
+    'multi_digit_add_sub': multi_digit_add_sub,
+    'multiplication_facts': multiplication_facts,
+    'two_step_whole': two_step_whole,
+    'order_of_operations': order_of_operations,
+    'exact_division': exact_division,
+    'like_fractions': like_fractions,
+    'integer_operations': integer_operations,
+    'unlike_fractions': unlike_fractions,
+    'parentheses': parentheses,
+    'fraction_multiply_divide': fraction_multiply_divide,
+    'mixed_negatives_fractions': mixed_negatives_fractions,
+    'multi_step': multi_step,
+}
+
+GRADE_SKILLS = {
+    '5th': ['multi_digit_add_sub', 'multiplication_facts', 'two_step_whole'],
+    '6th': ['order_of_operations', 'exact_division', 'like_fractions'],
+    '7th': ['integer_operations', 'unlike_fractions', 'parentheses'],
+    '8th': ['fraction_multiply_divide', 'mixed_negatives_fractions', 'multi_step'],
+}
+
+
+class QuestionGenerator:
+    def __init__(self, grade, seed=None):
+        """
+        Initialize a generator for one grade
+        Args:
+            grade (str): Grade name, a key of GRADE_SKILLS
+            seed (int): Random seed for reproducible questions
+        Raises:
+            KeyError: If the grade has no skills
+        """
+        self.grade = grade
+        self.skills = GRADE_SKILLS[grade]
+        self.rng = random.Random(seed)
+        self.seen = set()  # Canonical forms of questions already produced
+        self.stats = {'generated': 0, 'duplicates': 0, 'rejected': 0}
+
+    def options(self, text, answer):
+        """
+        Pick three distinct wrong answers, preferring common mistakes
+        Args:
+            text (str): Expression text
+            answer (Fraction): Correct answer
+        Returns:
+            list: Four shuffled options including the answer
+        """
+        step = Fraction(1, answer.denominator)
+        candidates = [left_to_right_value(text), -answer, answer + step, answer - step,
+                      answer * 2, answer + 10 * step, answer - 10 * step]
+        # Questions without negative numbers get no negative wrong answers
+        allow_negative = answer < 0 or text.startswith('-') or '(-' in text
+        # Values one, two, three... steps away fill in when mistakes are too few
+        fallback = (answer + sign * k * step for k in itertools.count(1) for sign in (1, -1))
+        options = [answer]
+        for candidate in itertools.chain(candidates, fallback):
+            if candidate is None or candidate in options or (candidate < 0 and not allow_negative):
+                continue
+            options.append(candidate)
+            if len(options) == OPTION_COUNT:
+                break
+        self.rng.shuffle(options)
+        return options
+
+    def generate(self, skill=None):
+        """
+        Generate one verified question that this generator hasn't produced before
+        Args:
+            skill (str): Skill name (a random skill of the grade if not given)
+        Returns:
+            tuple: (question text, correct answer, options, skill), or None if
+                   the skill keeps producing duplicates
+        """
+        for _ in range(MAX_ATTEMPTS):
+            name = skill or self.rng.choice(self.skills)
+            tree = SKILLS[name](self.rng)
+            key = canonical(tree)
+            if key in self.seen:
+                self.stats['duplicates'] += 1
+                continue
+            text = render(tree)
+            answer = verify(text)
+            if answer is None or answer != evaluate(tree):
+                self.stats['rejected'] += 1
+                continue
+            self.seen.add(key)
+            self.stats['generated'] += 1
+            return (f"{text} = ?", answer, self.options(text, answer), name)
+        return None
+
+    def generate_many(self, count):
+        """
+        Generate up to count unique questions
+        Args:
+            count (int): Number of questions wanted
+        Returns:
+            list: Question tuples from generate() (fewer if the skills run out)
+        """
+        questions = []
+        misses = 0
+        while len(questions) < count and misses < MAX_ATTEMPTS:
+            question = self.generate()
+            if question is None:
+                misses += 1
+            else:
+                questions.append(question)
+        return questions
+
+
+def fill_bank(bank, grade, count, seed=None):
+    """
+    Add generated questions for a grade to a QuestionBank, filed by skill
+    Args:
+        bank (QuestionBank): Bank to add to
+        grade (str): Grade name
+        count (int): Number of questions to generate
+        seed (int): Random seed
+    Returns:
+        int: Number of questions added
+    """
+    added = 0
+    for text, answer, _, skill in QuestionGenerator(grade, seed).generate_many(count):
+        added += bank.add(grade, text, answer, topic=skill) is not None
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate and verify questions for every grade")
+    parser.add_argument('--count', type=int, default=2000, help="unique questions per grade")
+    parser.add_argument('--seed', type=int, default=None, help="random seed")
+    parser.add_argument('--show', type=int, default=3, help="example questions to print per grade")
+    args = parser.parse_args()
+
+    for grade in GRADE_SKILLS:
+        generator = QuestionGenerator(grade, args.seed)
+        start = time.perf_counter()
+        questions = generator.generate_many(args.count)
+        elapsed = time.perf_counter() - start
+        stats = generator.stats
+        print(f"{grade}: {len(questions)} unique questions in {elapsed:.2f}s "
+              f"({len(questions) / elapsed:,.0f}/s), {stats['duplicates']} duplicates "
+              f"and {stats['rejected']} ambiguous items rejected")
+        for text, answer, options, skill in questions[:args.show]:
+            print(f"    {text:<28} {format_number(answer):>7}   "
+                  f"[{', '.join(format_number(option) for option in options)}]  {skill}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+"""
+Question Store
+Compiles large CSV/JSON question banks into one file that the game reads
+one question at a time.
+
+Store layout:
+    8 bytes   magic b'JMQSTR01'
+    4 bytes   little-endian header length
+    n bytes   JSON header: record count and, per "grade|topic" group, [first record, count]
+    ...       offsets: count + 1 little-endian uint64 byte offsets into the record data
+    ...       records: UTF-8 "question<TAB>answer", grouped by grade, then topic
+
+Opening a store reads only the header, whose size depends on the number
+of grade/topic groups, not on the number of questions. The rest is
+memory-mapped, and a question is located through two offset lookups.
+Draws walk each group's record range in the order of a small Feistel
+network keyed afresh every cycle, so they repeat nothing within a cycle
+and follow no fixed stride, without keeping a list of drawn questions.
+
+Input files:
+    CSV    columns grade, question, answer and optionally topic
+    JSON   a list of {"grade", "question", "answer", "topic"} objects, or
+           {grade: [[question, answer], ...]} as in questions.py
+
+Usage:
+    python -m game.question_store import bank1.csv bank2.json [--output FILE]
+    python -m game.question_store info [--output FILE]
+    python -m game.question_store check [bank1.csv ...]   # without files: questions.py
+    python -m game.question_store bench --count 200000
+"""
+
+import argparse
+import bisect
+import csv
+import json
+import mmap
+import os
+import random
+import struct
+import tempfile
+import time
+from fractions import Fraction
+from game.constants import QUESTION_STORE_FILE
+from game.question_bank import topic_of
+from game.question_generator import verify
+
+MAGIC = b'JMQSTR01'
+OFFSET = struct.Struct('<Q')
+FEISTEL_ROUNDS = 4  # Rounds of the permutation that orders draws
+
+
+def parse_answer(text):
+    """Turn a stored answer back into an int, or a Fraction if it isn't whole"""
+    value = Fraction(text)
+    return value.numerator if value.denominator == 1 else value
+
+
+def expression_of(question):
+    """
+    Extract the arithmetic from "What is 3 + 4?" or "3 + 4 = ?"
+    Returns:
+        str: Expression text, or None if the question has another form
+    """
+    text = question.strip()
+    if text.startswith("What is ") and text.endswith("?"):
+        return text[len("What is "):-1]
+    if text.endswith("= ?"):
+        return text[:-3]
+    return None
+
+
+def read_rows(path):
+    """
+    Read (grade, topic, question, answer) rows from a CSV or JSON bank
+    Args:
+        path (str): Input file
+    Yields:
+        tuple: (grade, topic or None, question, answer text); question and
+            answer are None where the row has none
+    """
+    if path.lower().endswith('.csv'):
+        with open(path, newline='', encoding='utf-8') as file:
+            for row in csv.DictReader(file):
+                yield row.get('grade'), row.get('topic') or None, row.get('question'), row.get('answer')
+        return
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    if isinstance(data, dict):
+        for grade, items in data.items():
+            for question, answer in items:
+                yield grade, None, question, None if answer is None else str(answer)
+    else:
+        for item in data:
+            answer = item.get('answer')
+            yield item.get('grade'), item.get('topic'), item.get('question'), \
+                None if answer is None else str(answer)
+
+
+def check_row(grade, question, answer, check_answers=True):
+    """
+    Parse and check one row's answer
+    Args:
+        grade (str): Grade name, or None
+        question (str): Question text, or None
+        answer (str): Answer text, or None
+        check_answers (bool): Also compare the answer with the question's arithmetic
+    Returns:
+        tuple: (answer as a Fraction, None), or (None, "unreadable") or
+            (None, "wrong") if the row can't be imported
+    """
+    # Tabs separate a record's fields and "|" a group's grade from its topic
+    if not grade or '|' in grade or not question or '\t' in question or answer is None:
+        return None, "unreadable"
+    try:
+        value = Fraction(answer.strip())
+    except (ValueError, ZeroDivisionError):
+        return None, "unreadable"
+    if check_answers:
+        expression = expression_of(question)
+        if expression is not None and verify(expression) not in (None, value):
+            return None, "wrong"
+    return value, None
+
+
+def compile_banks(paths, output=QUESTION_STORE_FILE, check_answers=True):
+    """
+    Import question banks into a store file
+    Args:
+        paths (list): CSV and JSON input files
+        output (str): Store file to write
+        check_answers (bool): Drop questions whose arithmetic disagrees with their answer
+    Returns:
+        dict: Counts of imported, duplicate, wrong and unreadable questions, and
+            under 'skipped' the (file, question, answer, problem) of each
+            wrong or unreadable one
+    """
+    groups = {}   # (grade, topic) -> list of encoded records
+    seen = set()
+    stats = {'imported': 0, 'duplicates': 0, 'wrong': 0, 'invalid': 0, 'skipped': []}
+    for path in paths:
+        for grade, topic, question, answer in read_rows(path):
+            value, problem = check_row(grade, question, answer, check_answers)
+            if problem is not None:
+                stats['wrong' if problem == "wrong" else 'invalid'] += 1
+                stats['skipped'].append((path, question, answer, problem))
+                continue
+            key = (grade, question)
+            if key in seen:
+                stats['duplicates'] += 1
+                continue
+            seen.add(key)
+            record = f"{question}\t{value}".encode('utf-8')
+            groups.setdefault((grade, topic or topic_of(question)), []).append(record)
+            stats['imported'] += 1
+
+    index = {}
+    records = []
+    for grade, topic in sorted(groups):
+        index[f"{grade}|{topic}"] = [len(records), len(groups[(grade, topic)])]
+        records.extend(groups[(grade, topic)])
+
+    header = json.dumps({'count': len(records), 'groups': index}).encode('utf-8')
+    offsets = bytearray()
+    position = 0
+    for record in records:
+        offsets += OFFSET.pack(position)
+        position += len(record)
+    offsets += OFFSET.pack(position)
+
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'wb') as file:
+        file.write(MAGIC + struct.pack('<I', len(header)) + header)
+        file.write(offsets)
+        for record in records:
+            file.write(record)
+    return stats
+
+
+class GroupSampler:
+    def __init__(self, start, count, rng):
+        """
+        Draw record indices from a range without repeats within a cycle
+        Args:
+            start (int): First record index of the range
+            count (int): Number of records in the range
+            rng (random.Random): Random source
+        """
+        self.start = start
+        self.count = count
+        self.rng = rng
+        # The Feistel network permutes 2 * half bits, the smallest even width covering count
+        self.half = (max(1, (count - 1).bit_length()) + 1) // 2
+        self.mask = (1 << self.half) - 1
+        self.new_cycle()
+
+    def new_cycle(self):
+        # Fresh round keys give an unrelated order every cycle
+        self.keys = [self.rng.getrandbits(32) for _ in range(FEISTEL_ROUNDS)]
+        self.step = 0
+
+    def permute(self, value):
+        # Values outside the range are permuted again ("cycle walking"); the
+        # domain is under 4 * count, so that takes a few rounds at most on average
+        while True:
+            left, right = value >> self.half, value & self.mask
+            for key in self.keys:
+                mixed = ((right ^ key) * 0x45D9F3B) & 0xFFFFFFFF
+                left, right = right, left ^ ((mixed ^ (mixed >> 16)) & self.mask)
+            value = (left << self.half) | right
+            if value < self.count:
+                return value
+
+    def draw(self):
+        if self.step == self.count:
+            self.new_cycle()
+        index = self.permute(self.step)
+        self.step += 1
+        return self.start + index
+
+
+class QuestionStore:
+    def __init__(self, path, seed=None):
+        """
+        Memory-map a compiled store and read its header
+        Args:
+            path (str): Store file
+            seed (int): Random seed for reproducible draws
+        Raises:
+            OSError: If the file can't be opened
+            ValueError: If the file is not a question store
+        """
+        self.file = open(path, 'rb')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self.file.close()
+            raise
+        try:
+            if self.map[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a question store")
+            (header_length,) = struct.unpack_from('<I', self.map, len(MAGIC))
+            header_start = len(MAGIC) + 4
+            header = json.loads(self.map[header_start:header_start + header_length].decode('utf-8'))
+            self.size = header['count']
+            groups = header['groups']
+        except ValueError:
+            self.close()
+            raise
+        except (KeyError, TypeError, struct.error) as e:
+            self.close()
+            raise ValueError(f"{path} has an unreadable header: {e}")
+        self.offsets_start = header_start + header_length
+        self.data_start = self.offsets_start + (self.size + 1) * OFFSET.size
+
+        # (grade, topic) -> (first record, count); topic None spans the grade's groups
+        self.groups = {}
+        self.topic_starts = []  # First record of each group, ascending, for topic_at()
+        self.topic_names = []
+        for key, (start, count) in sorted(groups.items(), key=lambda item: item[1][0]):
+            grade, _, topic = key.partition('|')
+            self.topic_starts.append(start)
+            self.topic_names.append(topic)
+            self.groups[(grade, topic)] = (start, count)
+            first, total = self.groups.get((grade, None), (start, 0))
+            self.groups[(grade, None)] = (min(first, start), total + count)
+        self.rng = random.Random(seed)
+        self.samplers = {}
+
+    @classmethod
+    def open(cls, path=QUESTION_STORE_FILE):
+        """
+        Open a store if it exists
+        Args:
+            path (str): Store file
+        Returns:
+            QuestionStore: The store, or None if it is missing or unreadable
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            print(f"Error opening question store: {e}")
+            return None
+
+    def __len__(self):
+        return self.size
+
+    def count(self, grade, topic=None):
+        return self.groups.get((grade, topic), (0, 0))[1]
+
+    def topics(self, grade):
+        return sorted(topic for group_grade, topic in self.groups if group_grade == grade and topic)
+
+    def question(self, index):
+        """
+        Read one question
+        Args:
+            index (int): Record index
+        Returns:
+            tuple: (question text, answer)
+        """
+        (start,) = OFFSET.unpack_from(self.map, self.offsets_start + index * OFFSET.size)
+        (end,) = OFFSET.unpack_from(self.map, self.offsets_start + (index + 1) * OFFSET.size)
+        text, answer = self.map[self.data_start + start:self.data_start + end].decode('utf-8').rsplit('\t', 1)
+        return text, parse_answer(answer)
+
+    def topic_at(self, index):
+        """Get the topic of the group a record belongs to"""
+        return self.topic_names[bisect.bisect_right(self.topic_starts, index) - 1]
+
+    def draw_index(self, grade, topic=None):
+        """
+        Draw a record index without repeats until the group has been cycled through
+        Args:
+            grade (str): Grade name
+            topic (str): Topic name, or None for any topic in the grade
+        Returns:
+            int: Record index, or None if there are no matching questions
+        """
+        sampler = self.samplers.get((grade, topic))
+        if sampler is None:
+            start, count = self.groups.get((grade, topic), (0, 0))
+            if not count:
+                return None
+            sampler = self.samplers[(grade, topic)] = GroupSampler(start, count, self.rng)
+        return sampler.draw()
+
+    def draw(self, grade, topic=None):
+        """
+        Draw a question (see draw_index())
+        Returns:
+            tuple: (question text, answer), or None if there are no matching questions
+        """
+        index = self.draw_index(grade, topic)
+        return None if index is None else self.question(index)
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+
+def bench(count=200000, draws=100000):
+    """
+    Import a generated CSV bank and time opening the store and drawing from it
+    Args:
+        count (int): Questions in the generated bank
+        draws (int): Timed draws
+    Returns:
+        dict: Import, open and per-draw timings plus the store size
+    """
+    from game.question_generator import GRADE_SKILLS, QuestionGenerator
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'bank.csv')
+        with open(source, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(['grade', 'topic', 'question', 'answer'])
+            for grade in GRADE_SKILLS:
+                for text, answer, _, skill in QuestionGenerator(grade, 1).generate_many(count // len(GRADE_SKILLS)):
+                    writer.writerow([grade, skill, text, answer])
+
+        output = os.path.join(directory, 'bank.store')
+        start = time.perf_counter()
+        stats = compile_banks([source], output)
+        import_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store = QuestionStore(output)
+        open_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(draws):
+            store.draw('7th' if i % 2 else '8th')
+        draw_seconds = time.perf_counter() - start
+        size = os.path.getsize(output)
+        store.close()
+    return {'questions': stats['imported'], 'import_s': import_seconds, 'open_ms': open_seconds * 1000,
+            'draw_us': draw_seconds / draws * 1e6, 'bytes': size}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import question banks into a memory-mapped store")
+    parser.add_argument('command', choices=['import', 'info', 'check', 'bench'])
+    parser.add_argument('inputs', nargs='*', help="CSV or JSON banks to import")
+    parser.add_argument('--output', default=QUESTION_STORE_FILE, help="store file")
+    parser.add_argument('--no-check', action='store_true', help="keep questions whose answer looks wrong")
+    parser.add_argument('--count', type=int, default=200000, help="questions to generate for bench")
+    args = parser.parse_args()
+
+    if args.command == 'import':
+        if not args.inputs:
+            parser.error("import needs at least one input file")
+        stats = compile_banks(args.inputs, args.output, check_answers=not args.no_check)
+        for path, question, answer, problem in stats['skipped']:
+            print(f"Skipped {path}: {question!r} with answer {answer!r} ({problem})")
+        print(f"Imported {stats['imported']} questions into {args.output} "
+              f"({stats['duplicates']} duplicates, {stats['wrong']} wrong answers, "
+              f"{stats['invalid']} unreadable rows skipped)")
+    elif args.command == 'check':
+        if args.inputs:
+            skipped = 0
+            for path in args.inputs:
+                for grade, _, question, answer in read_rows(path):
+                    _, problem = check_row(grade, question, answer)
+                    if problem is not None:
+                        print(f"{path}: {question!r} with answer {answer!r} ({problem})")
+                        skipped += 1
+            print(f"{skipped} questions would be skipped on import")
+            return
+        from questions import wrong_answers
+        wrong = wrong_answers()
+        for grade, question, answer, value in wrong:
+            expected = "unreadable" if value is None else f"should be {value}"
+            print(f"{grade}: {question} has answer {answer}, {expected}")
+        print(f"{len(wrong)} hand-written questions with a wrong answer")
+    elif args.command == 'info':
+        store = QuestionStore(args.output)
+        print(f"{args.output}: {len(store)} questions")
+        for grade in sorted({grade for grade, _ in store.groups}):
+            topics = ", ".join(f"{topic} {store.count(grade, topic)}" for topic in store.topics(grade))
+            print(f"  {grade}: {store.count(grade)} ({topics})")
+        store.close()
+    else:
+        results = bench(args.count)
+        print(f"Imported {results['questions']} questions in {results['import_s']:.2f}s "
+              f"({results['bytes'] / 1024 / 1024:.1f} MB)")
+        print(f"Open: {results['open_ms']:.2f} ms, draw: {results['draw_us']:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,13 @@ This manager ensures resources are loaded only once and shared
 across all game components that need them.
 """
 
+import os
+import threading
+import time
 import pygame
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from game.font_registry import FontRegistry
 
 class ResourceManager:
     # Static resource variables for game assets
@@ -20,25 +26,283 @@ class ResourceManager:
     jumpy_image = None      # Player character sprite
     platform_image = None   # Platform texture
     background_images = []  # List of background images for different stages
+    asset_pack = None       # Memory-mapped AssetPack, kept open while its surfaces are in use
+
+    # Number of animation frames for each enemy image prefix
+    ENEMY_FRAME_COUNTS = {'whale': 6, 'bird': 4, 'fireball': 9}
+
+    # Images each stage needs: (enemy frame prefix or None, background number).
+    # Math stage symbols are drawn from a font and always loaded.
+    STAGES = [('whale', 1), ('bird', 2), ('fireball', 3), (None, 4)]
+    loaded_stages = set()
+
+    # Images decoded ahead of time on the loader thread pool, keyed by (path, size)
+    decoded = {}
+    loader_workers = None   # Thread pool size (None lets the executor choose)
+    load_report = []        # (path, decode ms, thread name) for the last parallel load
+
+    # Shared cache of scaled/flipped surfaces, evicted least recently used first
+    transform_cache = OrderedDict()
+    transform_cache_limit = 256
+    transform_hits = 0
+    transform_misses = 0
+    transform_evictions = 0
 
     @classmethod
-    def initialize(cls):
+    def initialize(cls, use_pack=True, stages=(0,)):
         """
         Initialize and load all game resources.
         Must be called before any game objects are created.
+        Only the given stages' enemy frames and backgrounds are loaded;
+        other stages are streamed in later (see game.asset_streamer).
+        Args:
+            use_pack (bool): Load from the baked asset pack when one exists
+            stages (iterable): Stage indices to load right away
         """
-        # Load enemy animation frames
-        cls.whale_frames = cls.load_enemy_frames('whale', 6)
-        cls.bird_frames = cls.load_enemy_frames('bird', 4)
-        cls.fireball_frames = cls.load_enemy_frames('fireball', 9)
+        from game.constants import ASSET_PACK_FILE
+        cls.background_images = [None] * len(cls.STAGES)
+        cls.loaded_stages = set()
+        cls.asset_pack = None
         cls.symbol_frames = cls.create_symbol_frames()
+        if use_pack and os.path.exists(ASSET_PACK_FILE) and cls.open_pack(ASSET_PACK_FILE):
+            for stage in stages:
+                cls.load_stage(stage)
+            return
+
+        # Decode every needed PNG concurrently; the loaders below only convert them
+        jobs = [('assets/images/player.png', None), ('assets/images/wood.png', None)]
+        for stage in stages:
+            jobs.extend(cls.stage_jobs(stage))
+        cls.predecode(jobs)
         
         # Load player and platform images
         cls.jumpy_image = cls.load_image('assets/images/player.png')
         cls.platform_image = cls.load_image('assets/images/wood.png')
         
-        # Load background images
-        cls.load_backgrounds()
+        # Load enemy animation frames and backgrounds for the starting stages
+        for stage in stages:
+            cls.load_stage(stage)
+        cls.decoded.clear()
+
+    @classmethod
+    def stage_jobs(cls, stage):
+        """
+        List the PNG files a stage needs
+        Args:
+            stage (int): Stage index (0-3)
+        Returns:
+            list: (path, size) pairs, where size is a target scale or None
+        """
+        from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+        prefix, background = cls.STAGES[stage]
+        jobs = []
+        if prefix is not None:
+            jobs.extend((f'assets/images/{prefix}_frame_{i}.png', None)
+                        for i in range(1, cls.ENEMY_FRAME_COUNTS[prefix] + 1))
+        jobs.append((f'assets/images/bk{background}.png', (SCREEN_WIDTH, SCREEN_HEIGHT)))
+        return jobs
+
+    @classmethod
+    def stage_pack_names(cls, stage):
+        """
+        List the asset pack entries a stage needs
+        Args:
+            stage (int): Stage index (0-3)
+        Returns:
+            list: Asset names
+        """
+        prefix, background = cls.STAGES[stage]
+        names = []
+        if prefix is not None:
+            names.extend(f'{prefix}_frame_{i}' for i in range(1, cls.ENEMY_FRAME_COUNTS[prefix] + 1))
+        names.append(f'bk{background}')
+        return names
+
+    @classmethod
+    def decode_stage(cls, stage):
+        """
+        Decode a stage's images without converting them.
+        Safe to call from a worker thread; install_stage() finishes on the main thread.
+        Args:
+            stage (int): Stage index (0-3)
+        Returns:
+            dict: Pack asset name or (path, size) job -> surface or decode error
+        """
+        decoded = {}
+        if cls.asset_pack is not None:
+            pack = cls.asset_pack
+            names = cls.stage_pack_names(stage)
+            names.extend(variant['asset'] for variant in pack.variants if variant['source'] in names)
+            for name in names:
+                decoded[name] = pack.surface(name)
+            return decoded
+
+        for job in cls.stage_jobs(stage):
+            try:
+                decoded[job] = cls.decode(*job)
+            except (pygame.error, OSError) as e:
+                decoded[job] = e
+        return decoded
+
+    @classmethod
+    def install_stage(cls, stage, decoded):
+        """
+        Convert a stage's decoded images and make them available to the game.
+        Must run on the main thread.
+        Args:
+            stage (int): Stage index (0-3)
+            decoded (dict): Result of decode_stage()
+        """
+        prefix, background = cls.STAGES[stage]
+        if cls.asset_pack is not None:
+            pack = cls.asset_pack
+            loaded = {name: cls.convert(surface, pack.assets[name]['format'] == 'RGBA')
+                      for name, surface in decoded.items()}
+            if prefix is not None:
+                setattr(cls, f'{prefix}_frames',
+                        [loaded[f'{prefix}_frame_{i}'] for i in range(1, cls.ENEMY_FRAME_COUNTS[prefix] + 1)])
+            cls.background_images[background - 1] = loaded[f'bk{background}']
+            for variant in pack.variants:
+                if variant['source'] in loaded:
+                    cls.seed_transform(loaded[variant['source']], tuple(variant['size']),
+                                       variant['flip'], loaded[variant['asset']])
+        else:
+            cls.decoded.update(decoded)
+            if prefix is not None:
+                setattr(cls, f'{prefix}_frames',
+                        cls.load_enemy_frames(prefix, cls.ENEMY_FRAME_COUNTS[prefix]))
+            cls.background_images[background - 1] = cls.load_background(background)
+        cls.loaded_stages.add(stage)
+
+    @classmethod
+    def load_stage(cls, stage):
+        """Load a stage's assets synchronously"""
+        cls.install_stage(stage, cls.decode_stage(stage))
+
+    @classmethod
+    def unload_stage(cls, stage):
+        """
+        Release a stage's enemy frames and background
+        Args:
+            stage (int): Stage index (0-3)
+        """
+        prefix, background = cls.STAGES[stage]
+        released = []
+        if prefix is not None and getattr(cls, f'{prefix}_frames') is not None:
+            released.extend(getattr(cls, f'{prefix}_frames'))
+            setattr(cls, f'{prefix}_frames', None)
+        if cls.background_images[background - 1] is not None:
+            released.append(cls.background_images[background - 1])
+            cls.background_images[background - 1] = None
+        cls.purge_transforms(released)
+        cls.loaded_stages.discard(stage)
+
+    @classmethod
+    def stage_ready(cls, stage):
+        """Check if a stage's assets are loaded"""
+        return stage in cls.loaded_stages
+
+    @classmethod
+    def stage_bytes(cls, stage):
+        """
+        Estimate the memory held by a stage's loaded surfaces
+        Args:
+            stage (int): Stage index (0-3)
+        Returns:
+            int: Bytes of pixel data
+        """
+        prefix, background = cls.STAGES[stage]
+        surfaces = []
+        if prefix is not None and getattr(cls, f'{prefix}_frames') is not None:
+            surfaces.extend(getattr(cls, f'{prefix}_frames'))
+        if cls.background_images[background - 1] is not None:
+            surfaces.append(cls.background_images[background - 1])
+        return sum(surface.get_width() * surface.get_height() * surface.get_bytesize()
+                   for surface in surfaces)
+
+    @classmethod
+    def predecode(cls, jobs):
+        """
+        Decode (and scale) images concurrently on a thread pool.
+        Results, including errors, are stored in cls.decoded for decode() to
+        pick up on the main thread, which does the display conversion.
+        Args:
+            jobs (list): (path, size) pairs
+        """
+        def work(job):
+            path, size = job
+            start = time.perf_counter()
+            try:
+                image = pygame.image.load(path)
+                if size is not None:
+                    image = pygame.transform.scale(image, size)
+                result = image
+            except (pygame.error, OSError) as e:
+                result = e
+            elapsed = (time.perf_counter() - start) * 1000
+            return job, result, elapsed, threading.current_thread().name
+
+        cls.load_report = []
+        with ThreadPoolExecutor(max_workers=cls.loader_workers) as executor:
+            for job, result, elapsed, thread in executor.map(work, jobs):
+                cls.decoded[job] = result
+                cls.load_report.append((job[0], elapsed, thread))
+
+    @classmethod
+    def decode(cls, path, size=None):
+        """
+        Get a decoded image, using the thread pool's result when available
+        Args:
+            path (str): Image file path
+            size (tuple): Target (width, height), or None for the original size
+        Returns:
+            Surface: Decoded, unconverted image
+        Raises:
+            pygame.error, OSError: The error raised while decoding the file
+        """
+        result = cls.decoded.pop((path, size), None)
+        if result is None:
+            result = pygame.image.load(path)
+            return pygame.transform.scale(result, size) if size is not None else result
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    @classmethod
+    def print_load_report(cls):
+        """Print per-asset decode times from the last parallel load"""
+        for path, elapsed, thread in sorted(cls.load_report, key=lambda entry: -entry[1]):
+            print(f"{elapsed:8.2f} ms  {thread:<28} {path}")
+        total = sum(entry[1] for entry in cls.load_report)
+        print(f"{total:8.2f} ms  total decode time across {len(cls.load_report)} assets")
+
+    @classmethod
+    def open_pack(cls, path):
+        """
+        Memory-map a baked asset pack and load the images every stage shares.
+        Stage images are loaded from the pack later by load_stage().
+        Pre-scaled and pre-flipped variants are placed in the transform cache.
+        Args:
+            path (str): Pack file path
+        Returns:
+            bool: True if the pack was opened, False to fall back to PNG files
+        """
+        from game.asset_pack import AssetPack
+        try:
+            pack = AssetPack(path)
+            loaded = {name: cls.convert(pack.surface(name)) for name in ('player', 'wood')}
+        except (OSError, ValueError, KeyError, pygame.error) as e:
+            print(f"Error loading asset pack {path}: {e}")
+            return False
+
+        cls.jumpy_image = loaded['player']
+        cls.platform_image = loaded['wood']
+        for variant in pack.variants:
+            if variant['source'] in loaded:
+                cls.seed_transform(loaded[variant['source']], tuple(variant['size']),
+                                   variant['flip'], cls.convert(pack.surface(variant['asset'])))
+        cls.asset_pack = pack
+        return True
 
     @staticmethod
     def load_enemy_frames(prefix, count):
@@ -53,9 +317,9 @@ class ResourceManager:
         frames = []
         for i in range(1, count + 1):
             try:
-                frame = pygame.image.load(f'assets/images/{prefix}_frame_{i}.png').convert_alpha()
+                frame = ResourceManager.convert(ResourceManager.decode(f'assets/images/{prefix}_frame_{i}.png'))
                 frames.append(frame)
-            except pygame.error as e:
+            except (pygame.error, OSError) as e:
                 print(f"Error loading enemy frame {i}: {e}")
                 # Create fallback frame on error
                 fallback = pygame.Surface((50, 50), pygame.SRCALPHA)
@@ -73,15 +337,108 @@ class ResourceManager:
         frames = []
         symbols = ['+', '-', '×', '÷', '=']
         size = 60
+        font = FontRegistry.get('Arial', 40, bold=True)
         for symbol in symbols:
             surface = pygame.Surface((size, size), pygame.SRCALPHA)
-            font = pygame.font.SysFont('Arial', 40, bold=True)
             symbol_text = font.render(symbol, True, (255, 255, 255))
             text_rect = symbol_text.get_rect(center=(size // 2, size // 2))
             surface.blit(symbol_text, text_rect)
             frames.append(surface)
         return frames
 
+    @classmethod
+    def get_transformed(cls, source, size=None, flip_x=False, flip_y=False):
+        """
+        Get a scaled and/or flipped copy of a surface from the shared cache.
+        Identical requests return the same surface, so callers must not draw on it.
+        Args:
+            source (Surface): Original surface (kept alive by ResourceManager)
+            size (tuple): Target (width, height), or None to keep the source size
+            flip_x (bool): Mirror horizontally
+            flip_y (bool): Mirror vertically
+        Returns:
+            Surface: Transformed surface
+        """
+        key = (id(source), size, flip_x, flip_y)
+        entry = cls.transform_cache.get(key)
+        # The source is stored with the entry so a reused id() can't return a stale surface
+        if entry is not None and entry[0] is source:
+            cls.transform_cache.move_to_end(key)
+            cls.transform_hits += 1
+            return entry[1]
+
+        cls.transform_misses += 1
+        surface = source
+        if size is not None and size != source.get_size():
+            surface = pygame.transform.scale(surface, size)
+        if flip_x or flip_y:
+            surface = pygame.transform.flip(surface, flip_x, flip_y)
+
+        cls.transform_cache[key] = (source, surface)
+        cls.transform_cache.move_to_end(key)
+        while len(cls.transform_cache) > cls.transform_cache_limit:
+            cls.transform_cache.popitem(last=False)
+            cls.transform_evictions += 1
+        return surface
+
+    @classmethod
+    def seed_transform(cls, source, size, flip_x, surface):
+        """
+        Store a pre-rendered variant so get_transformed() returns it without work
+        Args:
+            source (Surface): Original surface
+            size (tuple): Variant (width, height)
+            flip_x (bool): Whether the variant is mirrored horizontally
+            surface (Surface): Pre-rendered variant
+        """
+        cls.transform_cache[(id(source), size, flip_x, False)] = (source, surface)
+        while len(cls.transform_cache) > cls.transform_cache_limit:
+            cls.transform_cache.popitem(last=False)
+            cls.transform_evictions += 1
+
+    @classmethod
+    def purge_transforms(cls, sources):
+        """
+        Drop cached variants of surfaces that are being released
+        Args:
+            sources (list): Source surfaces no longer in use
+        """
+        source_ids = {id(source) for source in sources}
+        for key in [key for key in cls.transform_cache if key[0] in source_ids]:
+            del cls.transform_cache[key]
+
+    @classmethod
+    def transform_cache_stats(cls):
+        """
+        Get transform cache counters
+        Returns:
+            dict: Entry count, limit, hits, misses, evictions and hit rate
+        """
+        lookups = cls.transform_hits + cls.transform_misses
+        return {
+            'entries': len(cls.transform_cache),
+            'limit': cls.transform_cache_limit,
+            'hits': cls.transform_hits,
+            'misses': cls.transform_misses,
+            'evictions': cls.transform_evictions,
+            'hit_rate': cls.transform_hits / lookups if lookups else 0.0,
+        }
+
+    @staticmethod
+    def convert(surface, alpha=True):
+        """
+        Convert a surface to the display pixel format when a display exists.
+        Headless runs have no video mode, so surfaces are returned unchanged.
+        Args:
+            surface (Surface): Freshly loaded surface
+            alpha (bool): Whether to keep per-pixel alpha
+        Returns:
+            Surface: Converted surface, or the original one without a display
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
     @staticmethod
     def load_image(filename, convert_alpha=True):
         """
@@ -93,30 +450,31 @@ class ResourceManager:
             Surface: Loaded image surface or red square fallback
         """
         try:
-            if convert_alpha:
-                return pygame.image.load(filename).convert_alpha()
-            return pygame.image.load(filename).convert()
-        except pygame.error as e:
+            return ResourceManager.convert(ResourceManager.decode(filename), convert_alpha)
+        except (pygame.error, OSError) as e:
             print(f"Error loading image {filename}: {e}")
             surface = pygame.Surface((50, 50))
             surface.fill((255, 0, 0))
             return surface
 
     @classmethod
-    def load_backgrounds(cls):
+    def load_background(cls, number):
         """
-        Load and scale background images for all game stages.
-        Backgrounds are loaded in sequence and scaled to screen size.
+        Load and scale one stage background.
+        Backgrounds are scaled to screen size and converted to the
+        display format once so blits need no conversion.
+        Args:
+            number (int): Background file number (bk1-bk4)
+        Returns:
+            Surface: Background image or colored fallback on error
         """
         from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
-        for i in range(1, 5):
-            try:
-                img = pygame.image.load(f'assets/images/bk{i}.png')
-                img = pygame.transform.scale(img, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                cls.background_images.append(img)
-            except pygame.error as e:
-                print(f"Error loading background {i}: {e}")
-                # Create colored fallback background
-                fallback = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                fallback.fill((i * 50, i * 50, i * 50))
-                cls.background_images.append(fallback) 
\ No newline at end of file
+        try:
+            img = cls.decode(f'assets/images/bk{number}.png', (SCREEN_WIDTH, SCREEN_HEIGHT))
+            return cls.convert(img, alpha=False)
+        except (pygame.error, OSError) as e:
+            print(f"Error loading background {number}: {e}")
+            # Create colored fallback background
+            fallback = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            fallback.fill((number * 50, number * 50, number * 50))
+            return cls.convert(fallback, alpha=False)
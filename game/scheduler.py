@@ -0,0 +1,90 @@
+"""
+Scheduler
+Runs callbacks after a delay or at an interval, measured in game time.
+
+Game time only advances when the simulation steps, so timers behave the
+same at any frame rate, never block the loop, and take no wall-clock
+time in headless runs. Pending timers are kept in a heap ordered by due
+time, so each step only looks at the timers that are actually due.
+"""
+
+import heapq
+import itertools
+
+# Tolerance for comparing due times built from repeatedly added float intervals
+EPSILON = 1e-9
+
+
+class Timer:
+    def __init__(self, due, interval, callback):
+        """
+        Initialize a timer (created by Scheduler.after() and Scheduler.every())
+        Args:
+            due (float): Game time at which the callback runs next
+            interval (float): Seconds between repeated runs, or None for a one-shot timer
+            callback (callable): Function to run
+        """
+        self.due = due
+        self.interval = interval
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        """Stop the timer from running again"""
+        self.cancelled = True
+
+
+class Scheduler:
+    def __init__(self):
+        """Initialize an empty scheduler at game time zero"""
+        self.time = 0.0
+        self.heap = []  # (due time, insertion order, Timer)
+        self.order = itertools.count()
+
+    def push(self, timer):
+        heapq.heappush(self.heap, (timer.due, next(self.order), timer))
+        return timer
+
+    def after(self, delay, callback):
+        """
+        Run a callback once after a delay
+        Args:
+            delay (float): Game seconds to wait
+            callback (callable): Function called with no arguments
+        Returns:
+            Timer: Handle that can cancel the callback
+        """
+        return self.push(Timer(self.time + delay, None, callback))
+
+    def every(self, interval, callback):
+        """
+        Run a callback repeatedly until it returns False or is cancelled
+        Args:
+            interval (float): Game seconds between runs (the first run is one interval away)
+            callback (callable): Function called with no arguments
+        Returns:
+            Timer: Handle that can cancel the callback
+        """
+        return self.push(Timer(self.time + interval, interval, callback))
+
+    def update(self, dt):
+        """
+        Advance game time and run every callback that has become due
+        Args:
+            dt (float): Game seconds elapsed
+        """
+        self.time += dt
+        while self.heap and self.heap[0][0] <= self.time + EPSILON:
+            _, _, timer = heapq.heappop(self.heap)
+            if timer.cancelled:
+                continue
+            keep = timer.callback()
+            if timer.interval is not None and keep is not False and not timer.cancelled:
+                timer.due += timer.interval
+                self.push(timer)
+
+    def clear(self):
+        """Cancel every pending timer"""
+        for _, _, timer in self.heap:
+            timer.cancel()
+        self.heap.clear()
@@ -7,34 +7,85 @@ Provides centralized control over game audio, including:
 - Sound effect loading and playback
 - Background music control
 - Volume management for different sound types
+- A fixed pool of mixer channels with per-sound voice limits and priorities
+- Effects baked to the mixer's native format, with long clips streamed
+  (see game/audio_pipeline.py)
+
+Every effect plays through the pool. A sound already playing on as many
+channels as its voice limit allows restarts its oldest voice. When all
+channels are busy, a new sound takes the channel of the lowest-priority
+voice if that voice's priority is no higher than its own, and is dropped
+otherwise.
 """
 
 import pygame
+from game.audio_pipeline import AudioCache, bytes_per_second, mixer_format
+from game.constants import SOUND_CHANNELS, AUDIO_STREAM_EVENT
 
 class SoundManager:
-    def __init__(self):
+    # Sound effect files by name
+    SOUND_FILES = {
+        'jump': 'assets/sounds/jump.wav',
+        'collision': 'assets/sounds/collision.wav',
+        'game_over': 'assets/sounds/game_over.wav',
+        'correct': 'assets/sounds/correct.wav',
+        'wrong': 'assets/sounds/wrong.wav',
+        'click': 'assets/sounds/click.wav'
+    }
+
+    # Background music is streamed by pygame.mixer.music, never loaded as a Sound
+    MUSIC_FILE = 'assets/sounds/background_music.wav'
+    MUSIC_VOLUME = 0.3
+
+    # Sounds the main menu plays; the rest can be loaded after it is shown
+    MENU_SOUNDS = ('click',)
+
+    # Voice limit and priority (higher wins a channel) for each sound
+    VOICES = {
+        'jump': (2, 1),
+        'click': (1, 2),
+        'collision': (2, 2),
+        'correct': (1, 3),
+        'wrong': (1, 3),
+        'game_over': (1, 4)
+    }
+
+    def __init__(self, names=None, use_cache=True):
         """
-        Initialize sound manager and load all audio resources.
+        Initialize sound manager and load audio resources.
         Sets up sound effects and their respective volumes.
+        Args:
+            names (iterable): Sounds to load now (defaults to all of them).
+                Any other sound is loaded by load_sounds() or on first play.
+            use_cache (bool): Use baked sounds when they match the mixer format
         """
         self.background_music_playing = False
-        self.load_sounds()
-        self.setup_volumes()
+        self.music_loaded = False
+        self.sounds = {}
+        self.streamed = set()  # Sounds played from disk in chunks instead of loaded
+        self.streams = {}      # Channel index -> (sound name, ClipStream) for playing streams
+        self.audio_cache = AudioCache.open() if use_cache and pygame.mixer.get_init() else None
+        self.load_sounds(names)
+        self.setup_channels()
 
-    def load_sounds(self):
+    def load_sounds(self, names=None):
         """
-        Load all game sound effects into a dictionary.
+        Load game sound effects into the sounds dictionary.
         Each sound is loaded with error handling to prevent crashes.
+        Args:
+            names (iterable): Sounds to load (defaults to every sound not loaded yet)
         """
-        self.sounds = {
-            'background': self.load_sound('assets/sounds/background_music.wav'),
-            'jump': self.load_sound('assets/sounds/jump.wav'),
-            'collision': self.load_sound('assets/sounds/collision.wav'),
-            'game_over': self.load_sound('assets/sounds/game_over.wav'),
-            'correct': self.load_sound('assets/sounds/correct.wav'),
-            'wrong': self.load_sound('assets/sounds/wrong.wav'),
-            'click': self.load_sound('assets/sounds/click.wav')
-        }
+        for name in names if names is not None else self.SOUND_FILES:
+            if name in self.sounds or name in self.streamed:
+                continue
+            if self.audio_cache is not None and name in self.audio_cache:
+                if self.audio_cache.is_streamed(name):
+                    self.streamed.add(name)
+                else:
+                    self.sounds[name] = self.audio_cache.load(name)
+            else:
+                self.sounds[name] = self.load_sound(self.SOUND_FILES[name])
+        self.setup_volumes()
 
     def load_sound(self, filename):
         """
@@ -51,52 +102,205 @@ class SoundManager:
             print(f"Error loading sound {filename}: {e}")
             return None
 
+    # Volume levels for each sound effect
+    VOLUMES = {
+        'jump': 0.4,       # Jump sound effect volume
+        'collision': 0.8,  # Collision sound volume
+        'game_over': 0.5,  # Game over sound volume
+        'correct': 0.4,    # Correct answer sound volume
+        'wrong': 0.4,      # Wrong answer sound volume
+        'click': 0.3       # Button click sound volume
+    }
+
     def setup_volumes(self):
         """
         Set up volume levels for different sound effects.
         Each sound type has a predefined volume level for balance.
         """
-        volumes = {
-            'background': 0.3,  # Background music volume
-            'jump': 0.4,       # Jump sound effect volume
-            'collision': 0.8,  # Collision sound volume
-            'game_over': 0.5,  # Game over sound volume
-            'correct': 0.4,    # Correct answer sound volume
-            'wrong': 0.4,      # Wrong answer sound volume
-            'click': 0.3       # Button click sound volume
-        }
-        
-        for sound_name, volume in volumes.items():
+        for sound_name, volume in self.VOLUMES.items():
             if sound := self.sounds.get(sound_name):
                 sound.set_volume(volume)
 
+    def setup_channels(self):
+        """Reserve the fixed channel pool that all sound effects play on"""
+        self.channels = []
+        self.voices = []  # (sound name, priority, start order) per channel, or None
+        self.play_count = 0
+        self.stats = {'played': 0, 'dropped': 0, 'stolen': 0}
+        if not pygame.mixer.get_init():
+            return
+        pygame.mixer.set_num_channels(SOUND_CHANNELS)
+        self.channels = [pygame.mixer.Channel(i) for i in range(SOUND_CHANNELS)]
+        self.voices = [None] * SOUND_CHANNELS
+
+    def pick_channel(self, sound_name, limit, priority):
+        """
+        Choose the channel a new voice of a sound should play on
+        Args:
+            sound_name (str): Sound to play
+            limit (int): Most voices of this sound allowed at once
+            priority (int): Priority of the sound
+        Returns:
+            int: Channel index, or None if the sound should be dropped
+        """
+        free = None
+        same = []
+        lowest = None
+        for i, channel in enumerate(self.channels):
+            voice = self.voices[i]
+            if voice is None or not channel.get_busy():
+                self.voices[i] = None
+                if free is None:
+                    free = i
+                continue
+            if voice[0] == sound_name:
+                same.append(i)
+            if lowest is None or voice[1:] < self.voices[lowest][1:]:
+                lowest = i
+
+        # At the voice limit the oldest voice of the same sound restarts
+        if len(same) >= limit:
+            self.stats['stolen'] += 1
+            return min(same, key=lambda i: self.voices[i][2])
+        if free is not None:
+            return free
+        if lowest is not None and self.voices[lowest][1] <= priority:
+            self.stats['stolen'] += 1
+            return lowest
+        self.stats['dropped'] += 1
+        return None
+
     def play_sound(self, sound_name):
         """
-        Play a sound effect by name
+        Play a sound effect by name on the channel pool
         Args:
             sound_name (str): Name of the sound to play from the sounds dictionary
         """
-        if sound := self.sounds.get(sound_name):
-            sound.play()
+        if sound_name not in self.sounds and sound_name not in self.streamed:
+            self.load_sounds((sound_name,))
+        sound = self.sounds.get(sound_name)
+        if (sound is None and sound_name not in self.streamed) or not self.channels:
+            return
+        limit, priority = self.VOICES.get(sound_name, (1, 0))
+        index = self.pick_channel(sound_name, limit, priority)
+        if index is None:
+            return
+        self.end_stream(index)
+        if sound is not None:
+            self.channels[index].play(sound)
+        else:
+            self.start_stream(sound_name, index)
+        self.play_count += 1
+        self.voices[index] = (sound_name, priority, self.play_count)
+        self.stats['played'] += 1
+
+    def start_stream(self, sound_name, index):
+        """
+        Start a streamed sound on a channel: play the first chunk and queue the second
+        Args:
+            sound_name (str): Streamed sound to play
+            index (int): Channel index chosen by pick_channel()
+        """
+        stream = self.audio_cache.open_stream(sound_name)
+        channel = self.channels[index]
+        volume = self.VOLUMES.get(sound_name, 1.0)
+        first = stream.next_chunk()
+        if first is None:
+            stream.close()
+            return
+        first.set_volume(volume)
+        channel.play(first)
+        # The channel posts AUDIO_STREAM_EVENT as each chunk ends, which calls update_streams()
+        channel.set_endevent(AUDIO_STREAM_EVENT)
+        self.streams[index] = (sound_name, stream)
+        self.update_streams()
+
+    def update_streams(self):
+        """Queue the next chunk of every playing stream and close finished ones"""
+        for index, (sound_name, stream) in list(self.streams.items()):
+            channel = self.channels[index]
+            if not channel.get_busy():
+                self.end_stream(index)
+            elif channel.get_queue() is None:
+                chunk = stream.next_chunk()
+                if chunk is not None:
+                    chunk.set_volume(self.VOLUMES.get(sound_name, 1.0))
+                    channel.queue(chunk)
+
+    def end_stream(self, index):
+        """Close the stream playing on a channel, if any"""
+        if index in self.streams:
+            _, stream = self.streams.pop(index)
+            self.channels[index].set_endevent()
+            stream.close()
+
+    def memory_report(self):
+        """
+        Estimate the memory held by audio data
+        Returns:
+            dict: 'resident' (sound name -> bytes of loaded sounds),
+                  'streamed' (sound name -> bytes buffered while it plays) and 'total'
+        """
+        audio_format = mixer_format()
+        if audio_format is None:
+            return {'resident': {}, 'streamed': {}, 'total': 0}
+        rate = bytes_per_second(audio_format)
+        resident = {name: int(sound.get_length() * rate)
+                    for name, sound in self.sounds.items() if sound is not None}
+        # A playing stream holds the current and the queued chunk
+        streamed = {name: 2 * self.audio_cache.chunk_bytes() for name in self.streamed}
+        return {'resident': resident, 'streamed': streamed,
+                'total': sum(resident.values()) + sum(streamed.values())}
 
     def play_background_music(self):
         """
-        Start playing background music in a loop.
+        Start playing background music in a loop, or resume it where it was paused.
         Stops any currently playing sounds before starting.
         """
         if not self.background_music_playing:
             pygame.mixer.stop()  # Stop all playing sounds
-            pygame.mixer.music.load('assets/sounds/background_music.wav')
-            pygame.mixer.music.play(-1)  # -1 means loop indefinitely
-            pygame.mixer.music.set_volume(0.3)
+            for index in list(self.streams):
+                self.end_stream(index)
+            if self.music_loaded:
+                pygame.mixer.music.unpause()
+            else:
+                pygame.mixer.music.load(self.MUSIC_FILE)
+                pygame.mixer.music.play(-1)  # -1 means loop indefinitely
+                pygame.mixer.music.set_volume(self.MUSIC_VOLUME)
+                self.music_loaded = True
             self.background_music_playing = True
 
     def stop_background_music(self):
         """
-        Stop the currently playing background music.
-        Also unloads the music to free up resources.
+        Pause the background music.
+        It stays loaded so play_background_music() resumes it without reading the file again.
         """
         if self.background_music_playing:
-            pygame.mixer.music.stop()
-            pygame.mixer.music.unload()
-            self.background_music_playing = False 
\ No newline at end of file
+            pygame.mixer.music.pause()
+            self.background_music_playing = False
+
+class NullSoundManager:
+    """
+    Silent stand-in for SoundManager used by headless runs.
+    Exposes the same methods but never touches the mixer.
+    """
+
+    def __init__(self):
+        self.background_music_playing = False
+        self.sounds = {}
+        self.stats = {'played': 0, 'dropped': 0, 'stolen': 0}
+
+    def load_sounds(self, names=None):
+        pass
+
+    def play_sound(self, sound_name):
+        pass
+
+    def update_streams(self):
+        pass
+
+    def play_background_music(self):
+        self.background_music_playing = True
+
+    def stop_background_music(self):
+        self.background_music_playing = False
@@ -0,0 +1,226 @@
+"""
+Spaced Repetition
+Chooses the question shown after a death from what each student keeps
+getting wrong.
+
+Every question a student has answered is an item with a mastery state:
+a review interval, an ease factor and a due time. Time is counted in
+questions asked, so "due in 3" means three questions from now, and runs
+behave the same no matter how long a student plays. A wrong answer
+makes the item due again after RELEARN_GAP questions. A right answer
+multiplies its interval by the ease, which grows with every right answer
+and shrinks with every wrong one.
+
+Each student's items sit in a min-heap of (due, version, key). An answer
+pushes one new entry for that item and bumps its version, so older
+entries for it are skipped when they reach the top. Picking the next
+question is an O(log n) pop. When nothing is due, a fresh question is
+taken from the game's normal source instead.
+"""
+
+import heapq
+import json
+import os
+import random
+from game.constants import REVIEW_FILE
+from game.question_bank import topic_of
+from game.question_store import parse_answer
+
+RELEARN_GAP = 2       # Questions before a missed item comes back
+FIRST_INTERVAL = 4    # Questions before the first review of a right answer
+START_EASE = 2.5
+MIN_EASE = 1.3
+EASE_STEP = 0.15      # Ease gained by a right answer
+EASE_PENALTY = 0.2    # Ease lost by a wrong answer
+
+
+def question_to_json(question):
+    # Answers and options are saved as text, since fractions have no JSON form
+    text, answer, options, skill = question
+    return [text, str(answer), [str(option) for option in options], skill]
+
+
+def question_from_json(data):
+    # Also reads files saved before answers were text (all ints) and skills were kept
+    text, answer, options = data[:3]
+    skill = data[3] if len(data) > 3 else topic_of(text)
+    return (text, parse_answer(str(answer)), [parse_answer(str(option)) for option in options], skill)
+
+
+class ItemState:
+    __slots__ = ('question', 'due', 'interval', 'ease', 'seen', 'correct', 'version')
+
+    def __init__(self, question, due=0, interval=0, ease=START_EASE, seen=0, correct=0):
+        """
+        Initialize an item's mastery state
+        Args:
+            question (tuple): (question text, correct answer, options, skill)
+            due (int): Question count at which the item is due
+            interval (float): Questions between reviews, 0 until first answered right
+            ease (float): Interval growth factor for a right answer
+            seen (int): Times the item was answered
+            correct (int): Times it was answered right
+        """
+        self.question = question
+        self.due = due
+        self.interval = interval
+        self.ease = ease
+        self.seen = seen
+        self.correct = correct
+        self.version = 0
+
+
+class StudentSchedule:
+    def __init__(self, rng=None):
+        """
+        Initialize an empty schedule for one student
+        Args:
+            rng (random.Random): Random source for reshuffling options of reviewed questions
+        """
+        self.rng = rng or random.Random()
+        self.items = {}  # Question text -> ItemState
+        self.heap = []   # (due, version, question text); stale versions are skipped
+        self.now = 0     # Questions asked so far
+
+    def __len__(self):
+        return len(self.items)
+
+    def schedule(self, key, item):
+        item.version += 1
+        heapq.heappush(self.heap, (item.due, item.version, key))
+        # Drop stale entries once they outnumber live ones, so the heap stays O(items)
+        if len(self.heap) > 2 * len(self.items) + 16:
+            self.heap = [(state.due, state.version, text) for text, state in self.items.items()]
+            heapq.heapify(self.heap)
+
+    def next_question(self, new_question):
+        """
+        Pick the next question: the most overdue item, or a new one if none is due
+        Args:
+            new_question (callable): Returns a fresh (text, answer, options, skill) question
+        Returns:
+            tuple: (question text, correct answer, options, skill)
+        """
+        self.now += 1
+        heap = self.heap
+        while heap:
+            due, version, key = heap[0]
+            item = self.items[key]
+            if version != item.version:
+                heapq.heappop(heap)
+                continue
+            if due > self.now:
+                break
+            # Stays in the heap until answered; asking it again reshuffles the options
+            text, answer, options, skill = item.question
+            options = list(options)
+            self.rng.shuffle(options)
+            return (text, answer, options, skill)
+        return new_question()
+
+    def record(self, question, correct):
+        """
+        Update one item after an answer
+        Args:
+            question (tuple): (question text, correct answer, options, skill) that was asked
+            correct (bool): Whether the student answered right
+        """
+        key = question[0]
+        item = self.items.get(key)
+        if item is None:
+            item = self.items[key] = ItemState(question)
+        item.seen += 1
+        if correct:
+            item.correct += 1
+            item.interval = FIRST_INTERVAL if item.interval == 0 else item.interval * item.ease
+            item.ease += EASE_STEP
+        else:
+            item.interval = 0
+            item.ease = max(MIN_EASE, item.ease - EASE_PENALTY)
+        item.due = self.now + (round(item.interval) if correct else RELEARN_GAP)
+        self.schedule(key, item)
+
+    def due_count(self):
+        return sum(1 for item in self.items.values() if item.due <= self.now)
+
+    def to_dict(self):
+        return {'now': self.now,
+                'items': {key: [question_to_json(item.question), item.due, item.interval, item.ease,
+                                item.seen, item.correct]
+                          for key, item in self.items.items()}}
+
+    @classmethod
+    def from_dict(cls, data, rng=None):
+        schedule = cls(rng)
+        schedule.now = data.get('now', 0)
+        for key, (question, due, interval, ease, seen, correct) in data.get('items', {}).items():
+            item = schedule.items[key] = ItemState(question_from_json(question), due, interval, ease,
+                                                   seen, correct)
+            schedule.heap.append((item.due, item.version, key))
+        heapq.heapify(schedule.heap)
+        return schedule
+
+
+class ReviewScheduler:
+    def __init__(self, path=REVIEW_FILE, seed=None):
+        """
+        Initialize empty schedules; load() reads saved progress
+        Args:
+            path (str): JSON file with saved progress, or None to keep nothing on disk
+            seed (int): Random seed for option shuffling
+        """
+        self.path = path
+        self.rng = random.Random(seed)
+        self.students = {}  # Student name -> StudentSchedule
+        self.loaded = False  # save() does nothing until then, so saved progress is never overwritten unread
+
+    def student(self, name):
+        schedule = self.students.get(name)
+        if schedule is None:
+            schedule = self.students[name] = StudentSchedule(self.rng)
+        return schedule
+
+    def next_question(self, name, new_question):
+        """
+        Pick a student's next question (see StudentSchedule.next_question)
+        Args:
+            name (str): Student name
+            new_question (callable): Returns a fresh (text, answer, options, skill) question
+        Returns:
+            tuple: (question text, correct answer, options, skill)
+        """
+        return self.student(name).next_question(new_question)
+
+    def record(self, name, question, correct):
+        """
+        Record a student's answer to a question
+        Args:
+            name (str): Student name
+            question (tuple): (question text, correct answer, options, skill) that was asked
+            correct (bool): Whether the answer was right
+        """
+        self.student(name).record(question, correct)
+
+    def load(self):
+        """Read saved progress if present; schedules already in memory are kept"""
+        self.loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as file:
+                data = json.load(file)
+            students = {name: StudentSchedule.from_dict(schedule, self.rng)
+                        for name, schedule in data.items()}
+            students.update(self.students)
+            self.students = students
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Error loading review progress: {e}")
+
+    def save(self):
+        if not self.path or not self.loaded:
+            return
+        try:
+            with open(self.path, 'w') as file:
+                json.dump({name: schedule.to_dict() for name, schedule in self.students.items()}, file)
+        except (OSError, TypeError) as e:
+            print(f"Error saving review progress: {e}")
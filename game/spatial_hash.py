@@ -0,0 +1,201 @@
+"""
+Spatial Hash
+Vertical-bucket index for the platform and enemy sprite groups.
+
+Sprites are bucketed by their world y position in rows of a fixed
+height. Screen scrolling moves every sprite by the same amount, so it is
+tracked as a single offset instead of re-bucketing everything. A sprite
+only changes buckets when it moves relative to the world, and kills are
+removed through the sprite group, so the index stays current without
+ever being rebuilt.
+
+Collision and "topmost sprite" queries then only look at the buckets a
+rect overlaps instead of every sprite in the group.
+"""
+
+import heapq
+import pygame
+
+
+class SpatialHash:
+    def __init__(self, cell_height):
+        """
+        Initialize an empty index
+        Args:
+            cell_height (int): Height of each bucket row in pixels
+        """
+        self.cell_height = cell_height
+        self.offset = 0        # Total scroll applied since the index was created
+        self.buckets = {}      # Bucket row -> ordered set (dict) of sprites
+        self.sprite_rows = {}  # Sprite -> (first row, last row) it occupies
+        self.row_heap = []     # Candidate rows for topmost(), lazily cleaned
+
+    def rows_for(self, top, bottom):
+        """
+        Get the bucket rows covered by a vertical span in screen coordinates
+        Args:
+            top (int): Top of the span
+            bottom (int): Bottom of the span (exclusive)
+        Returns:
+            tuple: (first row, last row)
+        """
+        first = (top - self.offset) // self.cell_height
+        last = (max(top, bottom - 1) - self.offset) // self.cell_height
+        return first, last
+
+    def insert(self, sprite):
+        """Add a sprite to every bucket its rect overlaps"""
+        first, last = self.rows_for(sprite.rect.top, sprite.rect.bottom)
+        self.sprite_rows[sprite] = (first, last)
+        for row in range(first, last + 1):
+            bucket = self.buckets.get(row)
+            if bucket is None:
+                bucket = self.buckets[row] = {}
+                heapq.heappush(self.row_heap, row)
+            bucket[sprite] = None
+
+    def remove(self, sprite):
+        """Remove a sprite using the rows recorded when it was inserted"""
+        rows = self.sprite_rows.pop(sprite, None)
+        if rows is None:
+            return
+        first, last = rows
+        for row in range(first, last + 1):
+            bucket = self.buckets.get(row)
+            if bucket is not None:
+                bucket.pop(sprite, None)
+                if not bucket:
+                    del self.buckets[row]
+        # Drop stale rows once they outnumber live ones (amortized O(1))
+        if len(self.row_heap) > 2 * len(self.buckets) + 16:
+            self.row_heap = list(self.buckets)
+            heapq.heapify(self.row_heap)
+
+    def update(self, sprite):
+        """Re-bucket a sprite only if it moved into different rows"""
+        rows = self.sprite_rows.get(sprite)
+        if rows is None:
+            return
+        if rows != self.rows_for(sprite.rect.top, sprite.rect.bottom):
+            self.remove(sprite)
+            self.insert(sprite)
+
+    def scroll(self, dy):
+        """Record that every indexed sprite moved down by dy pixels"""
+        self.offset += dy
+
+    def clear(self):
+        """Remove all sprites and reset the scroll offset"""
+        self.buckets.clear()
+        self.sprite_rows.clear()
+        self.row_heap.clear()
+        self.offset = 0
+
+    def query(self, rect):
+        """
+        Get sprites in the buckets a rect overlaps
+        Args:
+            rect (Rect): Area to search in screen coordinates
+        Returns:
+            list: Candidate sprites in a stable order, without duplicates
+        """
+        first, last = self.rows_for(rect.top, rect.bottom)
+        if first == last:
+            return list(self.buckets.get(first, ()))
+        found = {}
+        for row in range(first, last + 1):
+            bucket = self.buckets.get(row)
+            if bucket:
+                found.update(bucket)
+        return list(found)
+
+    def topmost(self):
+        """
+        Get the sprite with the smallest rect.y
+        Returns:
+            Sprite: Topmost sprite, or None if the index is empty
+        """
+        heap = self.row_heap
+        while heap and heap[0] not in self.buckets:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return min(self.buckets[heap[0]], key=lambda sprite: sprite.rect.y)
+
+
+class IndexedGroup(pygame.sprite.Group):
+    """
+    Sprite group that keeps a SpatialHash of its members.
+    Sprites are indexed when added and dropped when removed or killed.
+
+    If a pool is attached (see game.sprite_pool), a sprite goes back to
+    it in two cases only: when it kills itself during update() (off-screen
+    culling), and when recycle() discards the whole group. Both are points
+    where nothing else holds the sprite. remove() and empty() never
+    release, so a sprite taken out of the group by other code is never
+    handed out twice.
+    """
+
+    def __init__(self, cell_height, *sprites):
+        """
+        Args:
+            cell_height (int): Height of each bucket row in pixels
+            *sprites: Initial sprites to add
+        """
+        self.index = SpatialHash(cell_height)
+        self.pool = None
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.index.insert(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.index.remove(sprite)
+
+    def empty(self):
+        super().empty()
+        self.index.clear()
+
+    def recycle(self):
+        """Empty the group and release every member to the pool; only for sprites nothing else holds"""
+        sprites = self.sprites()
+        self.empty()
+        if self.pool is not None:
+            for sprite in sprites:
+                self.pool.release(sprite)
+
+    def update(self, scroll, *args, **kwargs):
+        """
+        Update every sprite, then re-bucket the ones that moved.
+        Args:
+            scroll (int): Screen scroll applied to all sprites this tick
+        """
+        self.index.scroll(scroll)
+        for sprite in self.sprites():
+            sprite.update(scroll, *args, **kwargs)
+            if sprite in self.spritedict:
+                self.index.update(sprite)
+            elif self.pool is not None:
+                # Killed itself during its update (off-screen culling)
+                self.pool.release(sprite)
+
+    def collide(self, rect):
+        """
+        Get members whose rect collides with the given rect
+        Args:
+            rect (Rect): Rect to test in screen coordinates
+        Returns:
+            list: Colliding sprites
+        """
+        return [sprite for sprite in self.index.query(rect)
+                if sprite.rect.colliderect(rect)]
+
+    def collide_any(self, rect):
+        """Check if any member's rect collides with the given rect"""
+        return any(sprite.rect.colliderect(rect) for sprite in self.index.query(rect))
+
+    def topmost(self):
+        """Get the member with the smallest rect.y, or None if empty"""
+        return self.index.topmost()
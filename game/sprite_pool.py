@@ -0,0 +1,65 @@
+"""
+Sprite Pool
+Recycles killed platform and enemy sprites instead of allocating new ones.
+
+A pool is attached to a sprite group. Sprites the group culls or
+recycles (see IndexedGroup) go back to the pool, and acquire() hands them
+out again after calling their reset() method with fresh arguments.
+Image work is already shared through ResourceManager's transform cache,
+so a reused sprite only resets its position and state.
+"""
+
+
+class SpritePool:
+    def __init__(self, factory):
+        """
+        Initialize an empty pool
+        Args:
+            factory: Sprite class (or callable) used when the pool is empty.
+                     Its instances must provide reset() taking the same arguments.
+        """
+        self.factory = factory
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        """
+        Get a sprite, reusing a released one when available
+        Args:
+            *args: Arguments for the sprite's constructor / reset()
+        Returns:
+            Sprite: Ready-to-use sprite
+        """
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            self.reused += 1
+            return sprite
+        self.created += 1
+        return self.factory(*args)
+
+    def release(self, sprite):
+        """Return a sprite that is no longer in use"""
+        self.free.append(sprite)
+
+    def release_images(self):
+        """Let free sprites drop their image references (for sprites that support it)"""
+        for sprite in self.free:
+            release = getattr(sprite, 'release_images', None)
+            if release is not None:
+                release()
+
+    def stats(self):
+        """
+        Get pool counters
+        Returns:
+            dict: Free sprites, sprites created and reused, and reuse rate
+        """
+        acquired = self.created + self.reused
+        return {
+            'free': len(self.free),
+            'created': self.created,
+            'reused': self.reused,
+            'reuse_rate': self.reused / acquired if acquired else 0.0,
+        }
@@ -0,0 +1,95 @@
+"""
+Startup Trace
+Records how long each startup phase takes until the first frame is shown.
+
+Enabled with `python main.py --trace-startup` or by setting the
+JUMP_MATH_TRACE_STARTUP environment variable. Phases are timed with
+tracer.phase(name); time spent between phases (imports, glue code) is
+reported as "other". When the first frame is presented the breakdown is
+printed, and written to the file named by JUMP_MATH_TRACE_STARTUP if it
+is set to a path instead of "1".
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+TRACE_ENV = 'JUMP_MATH_TRACE_STARTUP'
+
+
+class StartupTracer:
+    def __init__(self):
+        """Start the clock; the tracer is created when this module is first imported"""
+        self.start = time.perf_counter()
+        setting = os.environ.get(TRACE_ENV, '')
+        self.enabled = setting not in ('', '0')
+        self.output = setting if self.enabled and setting != '1' else None
+        self.phases = []  # (name, milliseconds) in the order they finished
+        self.finished = False
+
+    def enable(self, output=None):
+        """
+        Turn tracing on (used by the --trace-startup flag)
+        Args:
+            output (str): Optional file to write the breakdown to
+        """
+        self.enabled = True
+        self.output = output or self.output
+
+    def since_start(self, name):
+        """
+        Record the time from tracer creation until now as a phase (used for imports)
+        Args:
+            name (str): Phase name shown in the breakdown
+        """
+        if self.enabled and not self.finished:
+            self.phases.append((name, (time.perf_counter() - self.start) * 1000))
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time a named block of startup work
+        Args:
+            name (str): Phase name shown in the breakdown
+        """
+        if not self.enabled or self.finished:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - start) * 1000))
+
+    def first_frame(self):
+        """Record that the first frame reached the display and report the breakdown"""
+        if self.finished:
+            return
+        self.finished = True
+        if self.enabled:
+            self.report((time.perf_counter() - self.start) * 1000)
+
+    def report(self, total_ms):
+        """
+        Print (and optionally save) the time spent in each phase
+        Args:
+            total_ms (float): Time from tracer creation to the first frame
+        """
+        lines = ["Startup trace (time to first frame)"]
+        for name, ms in self.phases:
+            lines.append(f"  {name:<24}{ms:8.1f} ms  {ms / total_ms:6.1%}")
+        other = total_ms - sum(ms for _, ms in self.phases)
+        lines.append(f"  {'other':<24}{other:8.1f} ms  {other / total_ms:6.1%}")
+        lines.append(f"  {'total':<24}{total_ms:8.1f} ms")
+        text = "\n".join(lines)
+        print(text)
+        if self.output:
+            try:
+                with open(self.output, 'w') as file:
+                    file.write(text + "\n")
+            except OSError as e:
+                print(f"Error writing startup trace: {e}")
+
+
+# Shared tracer, started as early as the first import of this module
+tracer = StartupTracer()
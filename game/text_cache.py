@@ -0,0 +1,79 @@
+"""
+Text Cache
+Avoids re-rasterizing text that is drawn every frame.
+
+TextCache keeps rendered string surfaces keyed by (font, text, color),
+so static titles, labels and buttons are rendered once. DigitAtlas
+pre-renders the digits of one font and color, so numbers that change
+often (like the score) are drawn as a few glyph blits instead of a new
+font.render() call.
+"""
+
+from collections import OrderedDict
+
+
+class TextCache:
+    def __init__(self, limit=256):
+        """
+        Initialize an empty cache
+        Args:
+            limit (int): Maximum number of rendered strings kept (LRU eviction)
+        """
+        self.limit = limit
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """
+        Get a rendered text surface, rendering it only on first use
+        Args:
+            font: Pygame font to render with
+            text (str): Text to render
+            color: RGB color tuple
+        Returns:
+            Surface: Antialiased text surface shared between callers
+        """
+        key = (font, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.limit:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+class DigitAtlas:
+    GLYPHS = "0123456789-"
+
+    def __init__(self, font, color):
+        """
+        Pre-render every digit glyph for a font and color
+        Args:
+            font: Pygame font to render with
+            color: RGB color tuple
+        """
+        self.glyphs = {char: font.render(char, True, color) for char in self.GLYPHS}
+
+    def draw(self, surface, value, x, y):
+        """
+        Draw an integer by blitting pre-rendered digit glyphs
+        Args:
+            surface: Pygame surface to draw on
+            value (int): Number to draw
+            x (int): X position of the first digit
+            y (int): Y position
+        Returns:
+            int: X position just after the last digit
+        """
+        for char in str(int(value)):
+            glyph = self.glyphs[char]
+            surface.blit(glyph, (x, y))
+            x += glyph.get_width()
+        return x
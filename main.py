@@ -4,32 +4,46 @@ A platformer game that combines jumping mechanics with math challenges.
 Players must solve math questions to continue after dying.
 """
 
+from game.startup_trace import tracer  # First, so the trace includes the imports below
+import argparse
 import pygame
 import sys
 from game.game_manager import GameManager
 from game.resource_manager import ResourceManager
 
 def main():
+    parser = argparse.ArgumentParser(description="Jump and Math")
+    parser.add_argument('--trace-startup', nargs='?', const='', metavar='FILE',
+                        help="print how long each startup phase takes (optionally save it to FILE)")
+    args = parser.parse_args()
+    if args.trace_startup is not None:
+        tracer.enable(args.trace_startup)
+    tracer.since_start('imports')
+
     # Initialize Pygame engine and mixer with error handling
     try:
-        pygame.init()
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
+        with tracer.phase('pygame init'):
+            pygame.init()
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
     except pygame.error as e:
         print(f"Error initializing Pygame: {e}")
         sys.exit(1)
 
     # Initialize display screen
     try:
-        screen = pygame.display.set_mode((500, 800))
-        pygame.display.set_caption("Jump and Math")
+        with tracer.phase('display'):
+            screen = pygame.display.set_mode((500, 800))
+            pygame.display.set_caption("Jump and Math")
     except pygame.error as e:
         print(f"Error setting up display: {e}")
         sys.exit(1)
 
+    game = None
     try:
         # Initialize resource manager
-        ResourceManager.initialize()
+        with tracer.phase('resources'):
+            ResourceManager.initialize()
         
         # Create game manager instance and run game
         game = GameManager(screen)
@@ -43,6 +57,9 @@ def main():
         print(f"Error in main: {e}")
         sys.exit(1)
     finally:
+        # Progress and queued records are written out even if the game crashed
+        if game is not None:
+            game.shutdown()
         pygame.quit()
         sys.exit()
 
@@ -13,58 +13,65 @@ Features:
 import pygame
 import random
 from game.constants import SCREEN_WIDTH, BLACK, WHITE, YELLOW
+from game.question_batch import generate_batch_python
 
 class MathQuestion:
-    def __init__(self, screen, font):
+    def __init__(self, screen, font, sound_manager=None):
         """
         Initialize math question interface
         Args:
             screen: Pygame surface to draw on
             font: Font to use for text rendering
+            sound_manager: Shared SoundManager that plays the answer sounds
         """
         self.screen = screen
         self.font = font
+        self.sound_manager = sound_manager
         self.question = ""
         self.correct_answer = 0
         self.options = []
+        self.skill = None
         self.active = False
         self.selected_option = None
         self.option_rects = []
 
+        # Cached layer with the question circle and answer buttons
+        self.layer_rect = pygame.Rect(0, 50, SCREEN_WIDTH, 520)
+        self.layer = None
+        self.layer_selection = None
+
     def generate_question(self):
         """
         Generate a random arithmetic question.
         Creates a question using numbers 1-10 and basic operators (+, -, *).
         Generates four answer options, including the correct one.
         """
-        # Generate random numbers and operator
-        num1 = random.randint(1, 10)
-        num2 = random.randint(1, 10)
-        operator = random.choice(["+", "-", "*"])
-
-        # Calculate correct answer based on operator
-        if operator == "+":
-            self.correct_answer = num1 + num2
-        elif operator == "-":
-            self.correct_answer = num1 - num2
-        else:  # multiplication
-            self.correct_answer = num1 * num2
-
-        self.question = f"{num1} {operator} {num2} = ?"
-
-        # Generate answer options including correct answer
-        self.options = [self.correct_answer]
-        while len(self.options) < 4:
-            # Generate wrong answers within reasonable range
-            wrong_answer = random.randint(max(0, self.correct_answer - 20), 
-                                       self.correct_answer + 20)
-            if wrong_answer not in self.options:
-                self.options.append(wrong_answer)
-        random.shuffle(self.options)
+        self.load(generate_batch_python(1, random)[0])
 
+    def load(self, question):
+        """
+        Show a prepared question
+        Args:
+            question (tuple): (question text, correct answer, options, skill) as made by
+                game.question_batch
+        """
+        self.question, self.correct_answer, self.options, self.skill = question
         self.active = True
         self.selected_option = None
-        self.option_rects = []
+        self.layout_options()
+        self.layer = None
+
+    def layout_options(self):
+        """Compute the answer button rects once per question"""
+        self.option_rects = [
+            pygame.Rect(
+                SCREEN_WIDTH // 2 - 100,  # Center horizontally
+                350 + i * 60,             # Stack vertically with spacing
+                200,                      # Button width
+                40                        # Button height
+            )
+            for i in range(len(self.options))
+        ]
 
     def handle_click(self, pos):
         """
@@ -82,25 +89,16 @@ class MathQuestion:
         for i, rect in enumerate(self.option_rects):
             if rect.collidepoint(pos):
                 self.selected_option = i
-                if self.options[i] == self.correct_answer:
-                    if pygame.mixer.get_init():
-                        correct_sound = pygame.mixer.Sound('assets/sounds/correct.wav')
-                        correct_sound.play()
-                    return True
-                else:
-                    if pygame.mixer.get_init():
-                        wrong_sound = pygame.mixer.Sound('assets/sounds/wrong.wav')
-                        wrong_sound.play()
-                    return False
+                correct = self.options[i] == self.correct_answer
+                if self.sound_manager is not None:
+                    self.sound_manager.play_sound('correct' if correct else 'wrong')
+                return correct
         return None
 
     def draw(self):
         """
-        Draw the math question interface.
-        Includes:
-        - Yellow circle with question text
-        - Four answer option buttons
-        - Visual feedback for selected option
+        Draw the math question interface from its cached layer.
+        The layer is composed again only when the question or selection changes.
         
         Returns:
             bool: Always returns False (historical behavior)
@@ -108,34 +106,44 @@ class MathQuestion:
         if not self.active:
             return False
 
+        if self.layer is None or self.layer_selection != self.selected_option:
+            self.compose_layer()
+        self.screen.blit(self.layer, self.layer_rect)
+        return False
+
+    def compose_layer(self):
+        """
+        Compose the math question interface onto a transparent layer.
+        Includes:
+        - Yellow circle with question text
+        - Four answer option buttons
+        - Visual feedback for selected option
+        """
+        if self.layer is None:
+            self.layer = pygame.Surface(self.layer_rect.size, pygame.SRCALPHA)
+        self.layer.fill((0, 0, 0, 0))
+        self.layer_selection = self.selected_option
+        offset_y = self.layer_rect.top
+
         # Draw question circle
-        circle_center = (SCREEN_WIDTH // 2, 200)
+        circle_center = (SCREEN_WIDTH // 2, 200 - offset_y)
         circle_radius = 150
-        pygame.draw.circle(self.screen, YELLOW, circle_center, circle_radius)
+        pygame.draw.circle(self.layer, YELLOW, circle_center, circle_radius)
 
         # Draw question text
         question_text = self.font.render(self.question, True, BLACK)
         text_rect = question_text.get_rect(center=circle_center)
-        self.screen.blit(question_text, text_rect)
+        self.layer.blit(question_text, text_rect)
 
         # Draw answer options as buttons
-        self.option_rects = []
         for i, option in enumerate(self.options):
-            rect = pygame.Rect(
-                SCREEN_WIDTH // 2 - 100,  # Center horizontally
-                350 + i * 60,             # Stack vertically with spacing
-                200,                      # Button width
-                40                        # Button height
-            )
-            self.option_rects.append(rect)
+            rect = self.option_rects[i].move(0, -offset_y)
 
             # Highlight selected option in brighter red
             color = (200, 0, 0) if self.selected_option != i else (255, 0, 0)
-            pygame.draw.rect(self.screen, color, rect)
+            pygame.draw.rect(self.layer, color, rect)
 
             # Draw option text
             option_text = self.font.render(str(option), True, WHITE)
             text_rect = option_text.get_rect(center=rect.center)
-            self.screen.blit(option_text, text_rect)
-
-        return False 
\ No newline at end of file
+            self.layer.blit(option_text, text_rect) 
\ No newline at end of file
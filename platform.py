@@ -12,9 +12,10 @@ Features:
 
 import pygame
 from game.resource_manager import ResourceManager
-from game.constants import PLATFORM_SPEED, SCREEN_WIDTH
+from game.interpolation import Interpolated
+from game.constants import PLATFORM_SPEED, SCREEN_WIDTH, SCREEN_HEIGHT
 
-class Platform(pygame.sprite.Sprite):
+class Platform(Interpolated, pygame.sprite.Sprite):
     def __init__(self, x, y, width, moving):
         """
         Initialize platform sprite
@@ -25,7 +26,19 @@ class Platform(pygame.sprite.Sprite):
             moving (bool): Whether platform moves horizontally
         """
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.transform.scale(ResourceManager.platform_image, (width, 12))
+        self.reset(x, y, width, moving)
+
+    def reset(self, x, y, width, moving):
+        """
+        Reset platform state so a pooled sprite can be reused
+        Args:
+            x (int): Initial x position
+            y (int): Initial y position
+            width (int): Platform width in pixels
+            moving (bool): Whether platform moves horizontally
+        """
+        self.prev_pos = None
+        self.image = ResourceManager.get_transformed(ResourceManager.platform_image, (width, 12))
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
@@ -63,5 +76,5 @@ class Platform(pygame.sprite.Sprite):
         self.rect.y += scroll
 
         # Remove platform if it moves off the top of the screen
-        if self.rect.top > pygame.display.get_surface().get_height():
+        if self.rect.top > SCREEN_HEIGHT:
             self.kill()
\ No newline at end of file
@@ -7,8 +7,10 @@ collision detection with platforms, and sprite rendering.
 import pygame
 from game.constants import GRAVITY, SCREEN_WIDTH, SCROLL_THRESH, platform_group
 from game.resource_manager import ResourceManager
+from game.interpolation import Interpolated
+from game.collision import sweep
 
-class Player:
+class Player(Interpolated):
     def __init__(self, x, y):
         """
         Initialize player sprite
@@ -16,7 +18,7 @@ class Player:
             x (int): Initial x position
             y (int): Initial y position
         """
-        self.image = pygame.transform.scale(ResourceManager.jumpy_image, (80, 80))
+        self.image = ResourceManager.get_transformed(ResourceManager.jumpy_image, (80, 80))
         self.width = 45
         self.height = 50
         self.rect = pygame.Rect(0, 0, self.width, self.height)
@@ -37,10 +39,13 @@ class Player:
             return True
         return False
 
-    def move(self):
+    def move(self, input_source=None):
         """
         Handle player movement, including keyboard input,
         gravity, collisions, and screen scrolling.
+        Args:
+            input_source: Optional input source (see game.input_source);
+                          the real keyboard is polled when omitted
         Returns:
             int: Amount of screen scroll
         """
@@ -49,7 +54,10 @@ class Player:
         scroll = 0
 
         # Handle keyboard input
-        keys = pygame.key.get_pressed()
+        if input_source is not None:
+            keys = input_source.get_pressed()
+        else:
+            keys = pygame.key.get_pressed()
         if keys[pygame.K_LEFT]:
             dx = -10
             self.flip = True
@@ -67,14 +75,25 @@ class Player:
         if self.rect.right + dx > SCREEN_WIDTH:
             dx = SCREEN_WIDTH - self.rect.right
 
-        # Platform collision detection
-        for platform in platform_group:
-            if platform.rect.colliderect(self.rect.x + dx, self.rect.y + dy, self.width, self.height):
-                if self.rect.bottom < platform.rect.centery and self.vel_y > 0:
-                    self.rect.bottom = platform.rect.top
-                    dy = 0
-                    self.vel_y = 0
-                    self.jumping = False
+        # Platform collision detection: sweep the player along (dx, dy) and
+        # land on the platform touched first, so fast falls can't tunnel through
+        if self.vel_y > 0:
+            target = pygame.Rect(self.rect.x + dx, self.rect.y + dy, self.width, self.height)
+            landing = None
+            landing_time = 1.0
+            for platform in platform_group.collide(self.rect.union(target)):
+                hit = sweep(self.rect, dx, dy, platform.rect)
+                if hit is None or hit[0] >= landing_time:
+                    continue
+                # Land only if the player's feet are still above the platform's middle
+                if self.rect.bottom + dy * hit[0] < platform.rect.centery:
+                    landing = platform
+                    landing_time = hit[0]
+            if landing is not None:
+                self.rect.bottom = landing.rect.top
+                dy = 0
+                self.vel_y = 0
+                self.jumping = False
 
         # Screen scrolling
         if self.rect.top <= SCROLL_THRESH and self.vel_y < 0:
@@ -86,11 +105,15 @@ class Player:
 
         return scroll
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Draw the player sprite
         Args:
             screen: Pygame surface to draw on
+            alpha (float): Fraction of a simulation step elapsed since the last update
+        Returns:
+            Rect: Screen area that was drawn
         """
-        screen.blit(pygame.transform.flip(self.image, self.flip, False), 
-                   (self.rect.x - 12, self.rect.y - 5))
\ No newline at end of file
+        x, y = self.render_pos(alpha)
+        image = ResourceManager.get_transformed(ResourceManager.jumpy_image, (80, 80), self.flip)
+        return screen.blit(image, (x - 12, y - 5))
\ No newline at end of file
@@ -2,6 +2,9 @@ import pygame
 
 import random
 from answers import answer_options  
+from game.question_bank import QuestionBank
+from game.question_generator import fill_bank, verify
+from game.question_store import QuestionStore
 
 questions = {
     "5th": [
@@ -13,7 +16,7 @@ questions = {
         ("What is 20 + 20?", 40),
         ("What is 455 + 5?", 460),
         ("What is 3 + 4?", 7),
-        ("What is 5 + 60?", 165),
+        ("What is 5 + 60?", 65),
         ("What is 45 + 50?", 95),
         ("What is 33 + 4?", 37),
         ("What is 6 + 6?", 12),
@@ -62,10 +65,73 @@ questions = {
     ]
 }
 
+# Procedurally generated questions for each grade's skills (see game/question_generator.py)
+GENERATED_PER_GRADE = 100
+
+_bank = None
+_store = None
+_store_opened = False
+
+
+def wrong_answers():
+    """
+    Find hand-written questions whose answer the exact verifier disagrees with
+    (python -m game.question_store check lists them)
+    Returns:
+        list: (grade, question, answer, verified value) tuples
+    """
+    wrong = []
+    for grade, grade_questions in questions.items():
+        for text, answer in grade_questions:
+            value = verify(text.removeprefix("What is ").removesuffix("?"))
+            if value != answer:
+                wrong.append((grade, text, answer, value))
+    return wrong
+
+
+def get_bank():
+    """
+    Build the question bank on first use: an indexed copy of the questions
+    above plus generated ones. Duplicates are stored once, questions with a
+    wrong answer are left out, and questions are drawn without replacement,
+    starting over once all were asked.
+    Returns:
+        QuestionBank: The shared bank
+    """
+    global _bank
+    if _bank is None:
+        wrong = {(grade, text) for grade, text, _, _ in wrong_answers()}
+        bank = QuestionBank()
+        for grade, grade_questions in questions.items():
+            for text, answer in grade_questions:
+                if (grade, text) not in wrong:
+                    bank.add(grade, text, answer)
+            fill_bank(bank, grade, GENERATED_PER_GRADE)
+        _bank = bank
+    return _bank
+
+
+def get_store():
+    """
+    Open the imported question store on first use
+    Returns:
+        QuestionStore: The store, or None if none has been imported
+    """
+    global _store, _store_opened
+    if not _store_opened:
+        _store = QuestionStore.open()
+        _store_opened = True
+    return _store
+
+
 def random_question(grade):
-    if grade in questions:  
-        random.shuffle(questions[grade]) 
-        return questions[grade].pop()
+    # Large imported banks stay on disk and are read one question at a time
+    store = get_store()
+    if store is not None and store.count(grade):
+        return store.draw(grade)
+    question = get_bank().draw(grade)
+    if question is not None:
+        return (question.text, question.answer)
 
 def multiple_choice(correct_answer):
     return answer_options(correct_answer)
@@ -0,0 +1,36 @@
+"""
+Test setup
+Makes the game package importable and keeps pygame away from real
+display and audio devices.
+
+The game imports its sprites from a components package, while this
+tree keeps player.py, platform.py, enemy.py and math_question.py at the
+root. When there is no such package, one is put together from the
+root files so the tests that build a GameManager can run.
+"""
+
+import importlib.util
+import os
+import sys
+import types
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Appended rather than prepended: the repository root has a platform.py
+# that would otherwise shadow the standard library module
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+COMPONENTS = ('player', 'platform', 'enemy', 'math_question')
+if importlib.util.find_spec('components') is None:
+    components = types.ModuleType('components')
+    components.__path__ = []
+    sys.modules['components'] = components
+    for name in COMPONENTS:
+        spec = importlib.util.spec_from_file_location(f'components.{name}', os.path.join(ROOT, f'{name}.py'))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        setattr(components, name, module)
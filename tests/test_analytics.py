@@ -0,0 +1,88 @@
+from game import analytics
+from game.analytics import AnalyticsLog, CHUNK_RECORDS, DEATH_ENEMY, DEATH_FALL, aggregate, log_files, read_chunks
+import os
+import pytest
+import random
+
+
+def fill(log, records, seed=1):
+    rng = random.Random(seed)
+    for _ in range(records):
+        roll = rng.random()
+        if roll < 0.5:
+            log.death(rng.choice([DEATH_FALL, DEATH_ENEMY]), rng.randrange(4), rng.randrange(4000))
+        else:
+            log.answer(rng.choice(["3 + 4 = ?", "6 × 7 = ?", "9 - 2 = ?"]), rng.random() < 0.7,
+                       rng.randrange(4), rng.randrange(4000))
+
+
+def test_run_end_writes_the_buffered_records(tmp_path):
+    log = AnalyticsLog(str(tmp_path))
+    log.death(DEATH_FALL, 0, 50)
+    log.run_end(1, 120)
+    assert log.count == 0
+    assert [len(chunk) for chunk in read_chunks(log_files([str(tmp_path)])[0])] == [16]
+    log.close()
+
+
+def test_torn_and_damaged_chunks_are_skipped(tmp_path):
+    log = AnalyticsLog(str(tmp_path))
+    fill(log, CHUNK_RECORDS * 3)
+    log.close()
+    path = log_files([str(tmp_path)])[0]
+    assert len(list(read_chunks(path))) == 3
+
+    with open(path, 'r+b') as file:
+        file.truncate(os.path.getsize(path) - 5)  # Crash while writing the last chunk
+    assert len(list(read_chunks(path))) == 2
+
+    with open(path, 'r+b') as file:
+        position = 2 * 16 + CHUNK_RECORDS * 8 + 100  # Inside the second chunk's records
+        file.seek(position)
+        byte = file.read(1)
+        file.seek(position)
+        file.write(bytes([byte[0] ^ 0xFF]))
+    assert len(list(read_chunks(path))) == 1
+
+
+def test_files_rotate_and_a_new_log_continues_after_the_newest(tmp_path):
+    log = AnalyticsLog(str(tmp_path), max_file_bytes=8 * CHUNK_RECORDS)
+    fill(log, CHUNK_RECORDS * 3)
+    log.close()
+    assert [os.path.basename(path) for path in log_files([str(tmp_path)])] == \
+        ['events-000001.jlog', 'events-000002.jlog', 'events-000003.jlog']
+
+    log = AnalyticsLog(str(tmp_path))
+    log.run_end(2, 500)
+    log.close()
+    assert os.path.basename(log_files([str(tmp_path)])[-1]) == 'events-000004.jlog'
+    counts = aggregate([str(tmp_path)])
+    assert counts.records == CHUNK_RECORDS * 3 + 1
+    assert counts.run_stages == [0, 0, 1, 0]
+
+
+def test_numpy_and_python_counts_agree(tmp_path, monkeypatch):
+    pytest.importorskip('numpy')
+    log = AnalyticsLog(str(tmp_path))
+    fill(log, 5000, seed=2)
+    for stage in range(4):
+        log.run_end(stage, stage * 700)
+    log.close()
+
+    with_numpy = aggregate([str(tmp_path)])
+    monkeypatch.setattr(analytics, 'numpy', None)
+    without_numpy = aggregate([str(tmp_path)])
+    assert with_numpy.report() == without_numpy.report()
+    assert with_numpy.deaths == without_numpy.deaths
+    assert with_numpy.answers == without_numpy.answers
+
+
+def test_answers_are_counted_under_the_skill_they_were_made_for(tmp_path):
+    log = AnalyticsLog(str(tmp_path))
+    log.answer("1/2 ÷ 1/4 = ?", True, 1, 30, 'fraction_multiply_divide')
+    log.answer("1/2 ÷ 1/4 = ?", False, 1, 40, 'fraction_multiply_divide')
+    log.answer("6 × 7 = ?", True, 0, 10, 'a bank topic')  # Unknown skills fall back to the text
+    log.close()
+    report = aggregate([str(tmp_path)]).report()
+    accuracy = [line.split() for line in report.split("Answer accuracy\n")[1].splitlines()]
+    assert accuracy[:2] == [['multiplication', '100.0%', 'of', '1'], ['fraction_multiply_divide', '50.0%', 'of', '2']]
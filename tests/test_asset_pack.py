@@ -0,0 +1,58 @@
+import pygame
+import pytest
+from game import asset_pack
+from game.asset_pack import AssetPack, bake
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    sprite = pygame.Surface((4, 2), pygame.SRCALPHA)
+    sprite.fill((255, 0, 0, 255))
+    sprite.set_at((0, 0), (0, 255, 0, 128))
+    pygame.image.save(sprite, str(tmp_path / 'sprite.png'))
+    background = pygame.Surface((10, 10))
+    background.fill((0, 0, 255))
+    pygame.image.save(background, str(tmp_path / 'bk1.png'))
+
+    monkeypatch.setattr(asset_pack, '_source_images', lambda: {
+        'sprite': (str(tmp_path / 'sprite.png'), True),
+        'bk1': (str(tmp_path / 'bk1.png'), False),
+    })
+    monkeypatch.setattr(asset_pack, '_variant_requests', lambda images: [('sprite', (8, 4), True)])
+    return tmp_path
+
+
+def test_baked_images_load_back_without_decoding(sources):
+    path = str(sources / 'assets.pack')
+    assert bake(path) > 0
+    pack = AssetPack(path)
+    assert 'sprite' in pack and 'missing' not in pack
+
+    sprite = pack.surface('sprite')
+    assert sprite.get_size() == (4, 2)
+    assert tuple(sprite.get_at((0, 0))) == (0, 255, 0, 128)
+    assert pack.surface('bk1').get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    (variant,) = pack.variants
+    assert variant == {'source': 'sprite', 'size': [8, 4], 'flip': True, 'asset': 'sprite@8x4:flip'}
+    flipped = pack.surface(variant['asset'])
+    assert tuple(flipped.get_at((7, 0))) == (0, 255, 0, 128)
+
+
+def test_other_files_are_rejected_and_closed(tmp_path, monkeypatch):
+    opened = []
+
+    def recording_open(*args, **kwargs):
+        opened.append(open(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(asset_pack, 'open', recording_open, raising=False)
+    path = tmp_path / 'assets.pack'
+    path.write_bytes(b'NOTAPACK' + bytes(8))
+    with pytest.raises(ValueError):
+        AssetPack(str(path))
+    path.write_bytes(asset_pack.MAGIC + (2).to_bytes(4, 'little') + b'{}' + bytes(8))  # No asset index
+    with pytest.raises(ValueError):
+        AssetPack(str(path))
+    assert len(opened) == 2 and all(file.closed for file in opened)
@@ -0,0 +1,60 @@
+import pytest
+from game.asset_streamer import STAGE_SCORES, AssetStreamer
+from game.resource_manager import ResourceManager
+
+STAGE_BYTES = 2 * 1024 * 1024
+
+
+class FakePool:
+    def __init__(self):
+        self.releases = 0
+
+    def release_images(self):
+        self.releases += 1
+
+
+@pytest.fixture
+def stages(monkeypatch):
+    loaded = {0}
+    monkeypatch.setattr(ResourceManager, 'loaded_stages', loaded)
+    monkeypatch.setattr(ResourceManager, 'decode_stage', classmethod(lambda cls, stage: f"stage {stage}"))
+    monkeypatch.setattr(ResourceManager, 'install_stage', classmethod(lambda cls, stage, decoded: loaded.add(stage)))
+    monkeypatch.setattr(ResourceManager, 'unload_stage', classmethod(lambda cls, stage: loaded.discard(stage)))
+    monkeypatch.setattr(ResourceManager, 'stage_bytes', classmethod(lambda cls, stage: STAGE_BYTES))
+    return loaded
+
+
+def settle(streamer):
+    for future in list(streamer.pending.values()):
+        future.result()
+    streamer.poll()
+
+
+def test_next_stage_is_prefetched_near_its_threshold(stages):
+    streamer = AssetStreamer(budget=3 * STAGE_BYTES, margin=100)
+    streamer.update(0, STAGE_SCORES[0] - 101)
+    assert not streamer.pending
+    streamer.update(0, STAGE_SCORES[0] - 100)
+    settle(streamer)
+    assert stages == {0, 1}
+    assert streamer.stats['prefetched'] == 1
+
+
+def test_passed_stages_are_evicted_over_budget_but_not_the_first(stages):
+    pool = FakePool()
+    streamer = AssetStreamer(budget=2 * STAGE_BYTES, margin=0, pools=[pool])
+    stages.update({1, 2})
+    streamer.update(2, 0)
+    assert stages == {0, 2}
+    assert streamer.stats['evicted'] == 1
+    assert pool.releases == 1
+    streamer.update(2, 0)  # Within budget again: nothing to do
+    assert pool.releases == 1
+
+
+def test_require_loads_a_missing_stage_synchronously(stages):
+    streamer = AssetStreamer()
+    streamer.require(3)
+    streamer.require(3)
+    assert 3 in stages
+    assert streamer.stats['sync_loads'] == 1
@@ -0,0 +1,119 @@
+import json
+import os
+import time
+import wave
+import pygame
+import pytest
+from game import audio_pipeline, sound_manager
+from game.audio_pipeline import INDEX_FILE, AudioCache, bake, bytes_per_second
+from game.sound_manager import SoundManager
+
+
+def write_wav(path, seconds, rate=22050):
+    with wave.open(str(path), 'wb') as file:
+        file.setnchannels(1)
+        file.setsampwidth(2)
+        file.setframerate(rate)
+        file.writeframes(bytes(int(rate * seconds) * 2))
+    return str(path)
+
+
+@pytest.fixture
+def baked(tmp_path, monkeypatch):
+    pygame.mixer.init(44100, -16, 2)
+    monkeypatch.setattr(SoundManager, 'SOUND_FILES', {
+        'click': write_wav(tmp_path / 'click.wav', 0.1),
+        'game_over': write_wav(tmp_path / 'game_over.wav', 2.0),
+    })
+    monkeypatch.setattr(audio_pipeline, 'STREAM_MIN_SECONDS', 1.0)
+    output = str(tmp_path / 'audio')
+    sizes = bake(output)
+    yield output, sizes
+    pygame.mixer.quit()
+
+
+def test_bytes_per_second():
+    assert bytes_per_second([44100, -16, 2]) == 176400
+    assert bytes_per_second([22050, 8, 1]) == 22050
+
+
+def test_baked_sounds_are_in_the_mixer_format(baked):
+    output, sizes = baked
+    cache = AudioCache.open(output)
+    assert cache is not None
+    assert sizes['click'] == round(0.1 * 176400)  # Resampled to 44.1 kHz stereo
+    assert not cache.is_streamed('click') and cache.is_streamed('game_over')
+    assert cache.load('click').get_raw() == bytes(sizes['click'])
+
+
+def test_long_clips_stream_in_whole_frame_chunks(baked):
+    output, sizes = baked
+    cache = AudioCache.open(output)
+    assert cache.chunk_bytes() % 4 == 0
+    stream = cache.open_stream('game_over')
+    chunks = []
+    while (chunk := stream.next_chunk()) is not None:
+        chunks.append(len(chunk.get_raw()))
+    stream.close()
+    assert sum(chunks) == sizes['game_over']
+    assert len(chunks) > 1 and max(chunks) == cache.chunk_bytes()
+
+
+def test_sounds_baked_for_another_format_are_not_used(baked):
+    output, _ = baked
+    path = os.path.join(output, INDEX_FILE)
+    with open(path) as file:
+        index = json.load(file)
+    index['format'] = [22050, -16, 1]
+    with open(path, 'w') as file:
+        json.dump(index, file)
+    assert AudioCache.open(output) is None
+
+
+@pytest.fixture
+def streaming(tmp_path, monkeypatch):
+    """Sound manager on a one-channel pool with a baked 0.3 s clip streamed in 0.05 s chunks"""
+    pygame.mixer.init(44100, -16, 2)
+    monkeypatch.setattr(SoundManager, 'SOUND_FILES', {'game_over': write_wav(tmp_path / 'game_over.wav', 0.3)})
+    monkeypatch.setattr(audio_pipeline, 'STREAM_MIN_SECONDS', 0.2)
+    monkeypatch.setattr(audio_pipeline, 'STREAM_CHUNK_SECONDS', 0.05)
+    monkeypatch.setattr(sound_manager, 'SOUND_CHANNELS', 1)
+    output = str(tmp_path / 'audio')
+    bake(output)
+    manager = SoundManager(names=(), use_cache=False)
+    manager.audio_cache = AudioCache.open(output)
+    yield manager
+    pygame.mixer.quit()
+
+
+def test_streamed_sounds_are_queued_advanced_and_closed(streaming):
+    streaming.play_sound('game_over')
+    assert streaming.streamed == {'game_over'}
+    name, stream = streaming.streams[0]
+    chunk_bytes = streaming.audio_cache.chunk_bytes()
+    assert name == 'game_over' and stream.offset == 2 * chunk_bytes  # Playing one chunk, the next queued
+    assert streaming.channels[0].get_queue() is not None
+
+    size = len(stream.map)
+    offsets = [stream.offset]
+    deadline = time.time() + 5
+    while 0 in streaming.streams and time.time() < deadline:
+        time.sleep(0.01)
+        streaming.update_streams()
+        if stream.offset != offsets[-1]:
+            offsets.append(stream.offset)
+    assert 0 not in streaming.streams and stream.map.closed
+    assert offsets == sorted(offsets) and len(offsets) > 2
+    assert offsets[-1] == size  # Every chunk was queued before the stream closed
+
+
+def test_a_stolen_channel_closes_its_stream(streaming):
+    streaming.play_sound('game_over')
+    _, first = streaming.streams[0]
+    streaming.play_sound('game_over')  # At its voice limit the sound restarts on the same channel
+    _, second = streaming.streams[0]
+    assert first is not second
+    assert first.map.closed and not second.map.closed
+    assert streaming.stats['stolen'] == 1
+    streaming.end_stream(0)
+    assert second.map.closed and streaming.streams == {}
@@ -0,0 +1,27 @@
+import pygame
+from game.background import Background
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.resource_manager import ResourceManager
+
+
+def solid(color):
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    surface.fill(color)
+    return surface
+
+
+def test_crossfade_blends_into_one_reused_surface(monkeypatch):
+    monkeypatch.setattr(ResourceManager, 'background_images', [solid((200, 0, 0)), solid((0, 0, 200))])
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    background = Background(screen)
+    blend = background.blend_surface
+
+    background.draw_transition(0, 1, 0, 0)
+    assert screen.get_at((10, 10))[:3] == (200, 0, 0)
+    background.draw_transition(0, 1, 128, 40)
+    red, _, blue = screen.get_at((10, 10))[:3]
+    assert abs(red - 100) <= 2 and abs(blue - 100) <= 2
+    background.draw_transition(0, 1, 255, 80)
+    assert screen.get_at((10, 10))[:3] == (0, 0, 200)
+    assert background.blend_surface is blend
+    assert background.stats['blits'] == 4
@@ -0,0 +1,28 @@
+import pygame
+from game.collision import sweep
+
+
+def test_fast_fall_hits_thin_platform_it_would_tunnel_through():
+    player = pygame.Rect(0, 0, 20, 20)
+    platform = pygame.Rect(0, 50, 100, 12)
+    # The destination rect (y=80) is already past the platform
+    assert not player.move(0, 80).colliderect(platform)
+    time, normal_x, normal_y = sweep(player, 0, 80, platform)
+    assert time == (50 - 20) / 80
+    assert (normal_x, normal_y) == (0, -1)
+
+
+def test_side_hit_reports_horizontal_normal():
+    result = sweep(pygame.Rect(0, 0, 10, 10), 30, 0, pygame.Rect(20, 0, 10, 10))
+    assert result == (10 / 30, -1, 0)
+
+
+def test_misses_return_none():
+    target = pygame.Rect(0, 50, 100, 12)
+    assert sweep(pygame.Rect(200, 0, 20, 20), 0, 80, target) is None   # beside it
+    assert sweep(pygame.Rect(0, 0, 20, 20), 0, 10, target) is None     # stops short
+    assert sweep(pygame.Rect(0, 0, 20, 20), 0, -80, target) is None    # moving away
+
+
+def test_overlap_at_start_is_time_zero():
+    assert sweep(pygame.Rect(0, 45, 20, 20), 0, 5, pygame.Rect(0, 50, 100, 12)) == (0.0, 0, 0)
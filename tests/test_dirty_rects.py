@@ -0,0 +1,32 @@
+import pygame
+import pytest
+from game.dirty_rects import DirtyRectTracker
+
+
+@pytest.fixture(scope='module', autouse=True)
+def display():
+    pygame.display.init()
+    pygame.display.set_mode((100, 100))
+    yield
+    pygame.display.quit()
+
+
+def test_overlapping_rects_are_merged_and_clipped():
+    tracker = DirtyRectTracker(100, 100)
+    tracker.mark((0, 0, 10, 10))
+    tracker.mark((5, 5, 10, 10))
+    tracker.mark((90, 90, 20, 20))
+    tracker.mark((200, 0, 10, 10))  # Off screen
+    assert tracker.merged_rects() == [pygame.Rect(0, 0, 15, 15), pygame.Rect(90, 90, 10, 10)]
+
+
+def test_present_updates_this_and_last_frames_rects():
+    tracker = DirtyRectTracker(100, 100)
+    assert tracker.present() == 100 * 100  # The first frame is always full
+    tracker.mark((0, 0, 10, 10))
+    assert tracker.present() == 100
+    tracker.mark((50, 50, 10, 10))
+    assert tracker.present() == 200  # Also clears where the first rect was drawn
+    assert tracker.present() == 100
+    tracker.force_full()
+    assert tracker.present() == 100 * 100
@@ -0,0 +1,41 @@
+import json
+import pygame
+import pytest
+from game.font_registry import CACHE_VERSION, FontRegistry
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    pygame.font.init()
+    monkeypatch.setattr(FontRegistry, 'cache_path', str(tmp_path / 'font_cache.json'))
+    FontRegistry.clear()
+    yield FontRegistry
+    FontRegistry.clear()
+
+
+def test_fonts_are_shared_and_resolved_once(registry):
+    font = registry.get('Lucida Sans', 24)
+    assert registry.get('Lucida Sans', 24) is font
+    assert registry.get('Lucida Sans', 20) is not font
+    assert registry.stats['scans'] == 1
+    assert registry.stats['fonts_loaded'] == 2
+
+
+def test_resolved_paths_are_reused_by_the_next_launch(registry):
+    registry.resolve('Lucida Sans')
+    with open(registry.cache_path) as file:
+        assert json.load(file)['version'] == CACHE_VERSION
+
+    registry.clear()  # As if the game started again
+    registry.resolve('Lucida Sans')
+    assert registry.stats['scans'] == 0
+    assert registry.stats['cache_hits'] == 1
+
+
+def test_cached_paths_of_removed_fonts_are_resolved_again(registry):
+    with open(registry.cache_path, 'w') as file:
+        json.dump({'version': CACHE_VERSION,
+                   'fonts': {'Lucida Sans|regular': {'path': '/missing/font.ttf', 'synthetic_bold': False}}}, file)
+    registry.get('Lucida Sans', 24)
+    assert registry.stats['scans'] == 1
+    assert registry.resolved[('Lucida Sans', False)][0] != '/missing/font.ttf'
@@ -0,0 +1,20 @@
+from game.headless import HeadlessRunner
+
+
+def test_runs_are_repeatable_with_a_seed():
+    first = HeadlessRunner(seed=5).run(3000)
+    second = HeadlessRunner(seed=5).run(3000)
+    assert first['deaths'] > 0
+    assert (first['deaths'], first['score']) == (second['deaths'], second['score'])
+    # The sprite groups are module-level, so the second game reuses the first game's
+    # sprites; only the total number handed out has to match
+    for pool in ('platform_pool', 'enemy_pool'):
+        assert first[pool]['created'] + first[pool]['reused'] == \
+            second[pool]['created'] + second[pool]['reused']
+
+
+def test_wrong_answers_start_new_runs():
+    runner = HeadlessRunner(seed=6)
+    stats = runner.run(3000, answer_correctly=False)
+    assert stats['deaths'] > 1
+    assert stats['platform_pool']['reused'] > 0
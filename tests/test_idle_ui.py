@@ -0,0 +1,29 @@
+import pygame
+import pytest
+from game.constants import MENU
+from game.headless import HeadlessRunner
+
+
+@pytest.fixture
+def game():
+    game = HeadlessRunner(seed=1).game
+    game.game_state = MENU
+    return game
+
+
+def test_menu_is_redrawn_only_when_its_key_changes(game):
+    game.drawn_ui_key = game.ui_screen_key()
+    game.ui_dirty = False
+    assert not game.needs_ui_redraw()
+    game.hovered_button = 'start'
+    assert game.needs_ui_redraw()
+
+
+def test_waited_event_is_handled_before_queued_ones(game):
+    pygame.event.clear()
+    seen = []
+    game.menu_button_at = lambda pos: seen.append(pos)
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(2, 2), rel=(0, 0), buttons=(0, 0, 0)))
+    waited = pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1), rel=(0, 0), buttons=(0, 0, 0))
+    assert game.handle_events(waited)
+    assert seen == [(1, 1), (2, 2)]
@@ -0,0 +1,23 @@
+import pygame
+from game.interpolation import Interpolated, lerp
+
+
+class Box(Interpolated):
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 10, 10)
+
+
+def test_lerp():
+    assert lerp(10, 20, 0.0) == 10
+    assert lerp(10, 20, 0.25) == 12.5
+    assert lerp(10, 20, 1.0) == 20
+
+
+def test_render_pos_blends_the_last_two_steps():
+    box = Box(0, 100)
+    assert box.render_pos(0.5) == (0, 100)  # No snapshot yet
+    box.snapshot()
+    box.rect.move_ip(10, -40)
+    assert box.render_pos(0.0) == (0, 100)
+    assert box.render_pos(0.5) == (5, 80)
+    assert box.render_pos(1.0) == (10, 60)
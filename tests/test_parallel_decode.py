@@ -0,0 +1,51 @@
+import pygame
+import pytest
+from game.resource_manager import ResourceManager
+
+
+@pytest.fixture
+def images(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResourceManager, 'decoded', {})
+    paths = []
+    for i in range(6):
+        surface = pygame.Surface((8, 8))
+        surface.fill((i * 40, 0, 0))
+        path = str(tmp_path / f'image{i}.png')
+        pygame.image.save(surface, path)
+        paths.append(path)
+    return paths
+
+
+def test_predecoded_images_match_serial_decoding(images):
+    jobs = [(path, None) for path in images] + [(images[0], (16, 4))]
+    ResourceManager.predecode(jobs)
+    assert len(ResourceManager.load_report) == len(jobs)
+    for path, size in jobs:
+        expected = pygame.image.load(path)
+        if size is not None:
+            expected = pygame.transform.scale(expected, size)
+        image = ResourceManager.decode(path, size)
+        assert image.get_size() == expected.get_size()
+        assert image.get_at((1, 1)) == expected.get_at((1, 1))
+    assert ResourceManager.decoded == {}  # Each result is handed out once
+
+
+def test_decode_errors_surface_on_the_main_thread(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResourceManager, 'decoded', {})
+    missing = str(tmp_path / 'missing.png')
+    ResourceManager.predecode([(missing, None)])
+    with pytest.raises((pygame.error, OSError)):
+        ResourceManager.decode(missing)
+
+
+def test_missing_stage_images_fall_back_instead_of_raising(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # No assets directory here
+    for name, value in (('decoded', {}), ('asset_pack', None), ('loaded_stages', set()),
+                        ('background_images', [None] * 4), ('whale_frames', None),
+                        ('transform_cache', ResourceManager.transform_cache.copy())):
+        monkeypatch.setattr(ResourceManager, name, value)
+    ResourceManager.install_stage(0, ResourceManager.decode_stage(0))
+    assert len(ResourceManager.whale_frames) == ResourceManager.ENEMY_FRAME_COUNTS['whale']
+    assert ResourceManager.whale_frames[0].get_at((25, 25))[:3] == (255, 0, 0)
+    assert ResourceManager.background_images[0] is not None
+    assert ResourceManager.load_image('missing.png').get_size() == (50, 50)
@@ -0,0 +1,49 @@
+from game.profile_store import ProfileStore, connect
+
+
+def test_flush_makes_queued_writes_readable(tmp_path):
+    store = ProfileStore(str(tmp_path / 'profiles.db'))
+    store.add_student('ana', '6th', 'girl')
+    session = store.start_session('ana')
+    store.end_session(session, 120, 3)
+    store.flush()
+    assert store.student('ana')['grade'] == '6th'
+    assert [row[2:] for row in store.sessions('ana')] == [(120, 3)]
+    store.close()
+
+
+def test_close_commits_writes_still_queued(tmp_path):
+    path = str(tmp_path / 'profiles.db')
+    store = ProfileStore(path)
+    for n in range(1000):
+        store.record_answer('ana', None, f"What is {n} + 1?", n % 2 == 0)
+    store.close()
+    assert not store.writer.is_alive()
+
+    connection = connect(path)
+    assert connection.execute("SELECT count(*) FROM outcomes").fetchone() == (1000,)
+    assert connection.execute("SELECT seen, correct FROM skill_stats").fetchone() == (1000, 500)
+    connection.close()
+
+
+def test_a_failing_statement_loses_only_itself(tmp_path):
+    store = ProfileStore(str(tmp_path / 'profiles.db'))
+    store.add_student('ana')
+    store.write("INSERT INTO missing_table VALUES (?)", (1,))
+    store.add_student('ben', '7th')
+    store.flush()
+    assert store.stats['failed'] == 1
+    assert store.student('ana') is not None
+    assert store.student('ben')['grade'] == '7th'
+    store.close()
+
+
+def test_weakest_skills_orders_by_accuracy(tmp_path):
+    store = ProfileStore(str(tmp_path / 'profiles.db'))
+    for skill, right in (('addition', 4), ('division', 1), ('fractions', 2)):
+        for n in range(4):
+            store.record_answer('ana', None, "question", n < right, skill)
+    store.record_answer('ana', None, "question", False, 'negatives')  # Too few answers to count
+    store.flush()
+    assert store.weakest_skills('ana') == [('division', 0.25, 4), ('fractions', 0.5, 4), ('addition', 1.0, 4)]
+    store.close()
@@ -0,0 +1,37 @@
+from game.question_bank import QuestionBank, SamplingPool, topic_of
+import random
+
+
+def test_topic_of_reads_the_first_operator():
+    assert topic_of("What is 12 × 2?") == 'multiplication'
+    assert topic_of("What is 9 - 4?") == 'subtraction'
+    assert topic_of("-3 + 4 = ?") == 'addition'
+    assert topic_of("Name a prime") == 'other'
+
+
+def test_pool_draws_every_id_once_per_cycle():
+    pool = SamplingPool(random.Random(1))
+    for item_id in range(20):
+        pool.add(item_id)
+    for _ in range(3):
+        assert sorted(pool.draw() for _ in range(20)) == list(range(20))
+
+
+def test_new_cycle_does_not_repeat_the_last_draw():
+    rng = random.Random(2)
+    for _ in range(50):
+        pool = SamplingPool(rng)
+        pool.add(0)
+        pool.add(1)
+        last = [pool.draw(), pool.draw()][-1]
+        assert pool.draw() != last
+
+
+def test_bank_skips_duplicates_and_filters_by_topic():
+    bank = QuestionBank(seed=3)
+    assert bank.add_many('5th', [("What is 1 + 1?", 2), ("What is 1 + 1?", 2), ("What is 3 × 3?", 9)]) == 2
+    assert bank.duplicates == 1
+    assert bank.count('5th') == 2
+    assert bank.topics('5th') == ['addition', 'multiplication']
+    assert bank.draw('5th', 'multiplication').answer == 9
+    assert bank.draw('6th') is None
@@ -0,0 +1,58 @@
+import random
+import pytest
+from game.question_batch import DISTRACTOR_RANGE, OPTION_COUNT, QuestionQueue, generate_batch_python
+
+
+def check_batch(batch):
+    for text, correct, options, skill in batch:
+        a, operator, b, _, _ = text.split()
+        assert skill == {'+': 'addition', '-': 'subtraction', '*': 'multiplication'}[operator]
+        assert correct == {'+': int(a) + int(b), '-': int(a) - int(b), '*': int(a) * int(b)}[operator]
+        assert len(options) == len(set(options)) == OPTION_COUNT
+        assert correct in options
+        assert all(option >= 0 or option == correct for option in options)
+        assert all(abs(option - correct) <= DISTRACTOR_RANGE for option in options)
+
+
+def test_python_batch():
+    check_batch(generate_batch_python(2000, random.Random(1)))
+
+
+def test_numpy_batch_matches_the_python_rules():
+    numpy = pytest.importorskip('numpy')
+    from game.question_batch import generate_batch_numpy
+    batch = generate_batch_numpy(2000, numpy.random.default_rng(1))
+    check_batch(batch)
+    assert all(isinstance(option, int) for _, _, options, _ in batch for option in options)
+
+
+def test_queue_refills_in_the_background():
+    queue = QuestionQueue(batch_size=8, low_water=4, source=lambda count: [("q", 1, [1, 2, 3, 4], "addition")] * count)
+    queue.update()
+    queue.pending.result()
+    queue.update()  # Collects the first batch
+    assert len(queue) == 8
+    for _ in range(20):
+        assert queue.take()[0] == "q"
+        if queue.pending is not None:
+            queue.pending.result()
+    assert queue.stats['served'] == 20
+    assert queue.stats['sync_batches'] == 0
+
+
+def test_taking_faster_than_the_worker_waits_for_its_batch():
+    queue = QuestionQueue(batch_size=4, low_water=2, source=lambda count: [("q", 1, [1, 2, 3, 4], "addition")] * count)
+    assert queue.take()[0] == "q"
+    assert queue.stats['sync_batches'] == 1
+
+
+def test_a_failing_source_falls_back_to_simple_questions():
+    def broken(count):
+        raise ValueError("bad record")
+
+    queue = QuestionQueue(batch_size=8, low_water=4, source=broken)
+    queue.update()
+    check_batch([queue.take()])
+    queue.set_source(lambda count: [])
+    assert queue.take() is not None
+    assert queue.stats['failed_batches'] == 2
@@ -0,0 +1,55 @@
+from fractions import Fraction
+import pytest
+from game.question_batch import GradeSource, QuestionQueue
+from game.question_generator import GRADE_SKILLS, QuestionGenerator, render, verify, ADD, DIV
+import questions
+
+
+def test_verify_rejects_ambiguous_slash():
+    assert verify("6 ÷ 1/2") is None
+    assert verify("6 ÷ (1/2)") == 12
+    assert verify("3 + 4 × 2") == 11
+    assert verify("1 ÷ 0") is None
+
+
+def test_render_adds_only_needed_parentheses():
+    assert render((ADD, Fraction(3), (ADD, Fraction(4), Fraction(5)))) == "3 + 4 + 5"
+    assert render((DIV, Fraction(6), Fraction(1, 2))) == "6 ÷ (1/2)"
+
+
+def test_options_always_has_four_distinct_values():
+    generator = QuestionGenerator('8th', seed=1)
+    options = generator.options("2 × 2 - 32 ÷ 8", Fraction(0))
+    assert len(options) == 4 and len(set(options)) == 4 and Fraction(0) in options
+    assert all(option >= 0 for option in options)
+
+
+@pytest.mark.parametrize('grade', sorted(GRADE_SKILLS))
+def test_generated_questions_are_verified_with_four_options(grade):
+    for text, answer, options, skill in QuestionGenerator(grade, seed=2).generate_many(500):
+        assert skill in GRADE_SKILLS[grade]
+        assert verify(text.removesuffix(" = ?")) == answer
+        assert len(options) == 4 and len(set(options)) == 4 and answer in options
+
+
+def test_grade_source_keeps_producing_after_running_out():
+    source = GradeSource('5th', seed=3)
+    source.generator.skills = ['multiplication_facts']  # Only 66 distinct questions
+    batch = source(100)
+    assert len(batch) == 100
+    assert all(question[3] == 'multiplication_facts' for question in batch)
+
+
+def test_queue_serves_questions_from_its_source():
+    queue = QuestionQueue(batch_size=8, low_water=2, source=GradeSource('6th', seed=4))
+    text, answer, options, skill = queue.take()
+    assert answer in options and text.endswith("= ?")
+    assert skill in GRADE_SKILLS['6th']
+
+
+@pytest.mark.parametrize('grade', sorted(questions.questions))
+def test_every_grade_works_with_multiple_choice(grade):
+    for _ in range(60):
+        text, answer = questions.random_question(grade)
+        options = questions.multiple_choice(answer)
+        assert len(options) == 4 and len(set(options)) == 4 and answer in options
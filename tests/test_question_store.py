@@ -0,0 +1,116 @@
+from fractions import Fraction
+from game import question_store
+from game.question_batch import GradeSource
+from game.question_store import GroupSampler, QuestionStore, compile_banks
+import pytest
+import random
+
+
+def write_csv(path, lines):
+    path.write_text("grade,topic,question,answer\n" + "".join(line + "\n" for line in lines), encoding='utf-8')
+    return str(path)
+
+
+def test_sampler_draws_every_index_once_per_cycle():
+    for count in (1, 2, 7, 64, 1000):
+        sampler = GroupSampler(10, count, random.Random(count))
+        for _ in range(3):
+            assert sorted(sampler.draw() for _ in range(count)) == list(range(10, 10 + count))
+
+
+def test_sampler_order_changes_every_cycle_and_has_no_fixed_stride():
+    sampler = GroupSampler(0, 500, random.Random(4))
+    first = [sampler.draw() for _ in range(500)]
+    second = [sampler.draw() for _ in range(500)]
+    assert first != second
+    assert len({(b - a) % 500 for a, b in zip(first, first[1:])}) > 50
+
+
+def test_compile_and_draw(tmp_path):
+    source = write_csv(tmp_path / 'bank.csv', [
+        "5th,,What is 2 + 3?,5",
+        "5th,,What is 2 + 3?,5",
+        "5th,,What is 4 × 4?,17",
+        "6th,fractions,1/2 + 1/4 = ?,3/4",
+    ])
+    output = str(tmp_path / 'bank.store')
+    stats = compile_banks([source], output)
+    assert (stats['imported'], stats['duplicates'], stats['wrong']) == (2, 1, 1)
+
+    store = QuestionStore(output, seed=1)
+    assert len(store) == 2
+    assert store.topics('6th') == ['fractions']
+    assert store.draw('5th') == ("What is 2 + 3?", 5)
+    assert store.draw('6th', 'fractions') == ("1/2 + 1/4 = ?", Fraction(3, 4))
+    assert store.draw('7th') is None
+    store.close()
+
+
+def test_rows_without_an_answer_are_skipped_and_reported(tmp_path):
+    source = write_csv(tmp_path / 'bank.csv', [
+        "5th,,What is 2 + 3?",
+        "5th,,What is 1 + 1?,",
+        "5th,,What is 6 - 1?,5",
+    ])
+    stats = compile_banks([source], str(tmp_path / 'bank.store'))
+    assert stats['imported'] == 1
+    assert stats['invalid'] == 2
+    assert [question for _, question, _, _ in stats['skipped']] == ["What is 2 + 3?", "What is 1 + 1?"]
+
+
+def test_open_rejects_other_files_and_closes_them(tmp_path, monkeypatch):
+    opened = []
+
+    def recording_open(*args, **kwargs):
+        opened.append(open(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(question_store, 'open', recording_open, raising=False)
+    path = tmp_path / 'bank.store'
+    path.write_bytes(b'NOTASTORE' + bytes(16))
+    with pytest.raises(ValueError):
+        QuestionStore(str(path))
+    path.write_bytes(question_store.MAGIC + (5).to_bytes(4, 'little') + b'{"cou')  # Damaged header
+    assert QuestionStore.open(str(path)) is None
+    assert len(opened) == 2 and all(file.closed for file in opened)
+    assert QuestionStore.open(str(tmp_path / 'missing.store')) is None
+
+
+def test_rows_that_would_break_the_store_are_skipped(tmp_path):
+    source = write_csv(tmp_path / 'bank.csv', [
+        "5th,,What is 2\t+ 3?,5",
+        ",,What is 1 + 1?,2",
+        "5|6th,,What is 1 + 2?,3",
+        "5th,,What is 6 - 1?,5",
+    ])
+    output = str(tmp_path / 'bank.store')
+    stats = compile_banks([source], output)
+    assert (stats['imported'], stats['invalid']) == (1, 3)
+    store = QuestionStore(output)
+    assert store.draw('5th') == ("What is 6 - 1?", 5)
+    store.close()
+
+
+def test_banks_without_a_grade_column_import_nothing(tmp_path):
+    path = tmp_path / 'bank.csv'
+    path.write_text("question,answer\nWhat is 1 + 1?,2\n", encoding='utf-8')
+    stats = compile_banks([str(path)], str(tmp_path / 'bank.store'))
+    assert (stats['imported'], stats['invalid']) == (0, 1)
+
+
+def test_grade_source_serves_the_store(tmp_path):
+    source = write_csv(tmp_path / 'bank.csv', [f"7th,,What is {n} + 1?,{n + 1}" for n in range(10)])
+    output = str(tmp_path / 'bank.store')
+    compile_banks([source], output)
+    store = QuestionStore(output, seed=2)
+
+    batch = GradeSource('7th', seed=3, open_store=lambda: store)(10)
+    assert sorted(text for text, _, _, _ in batch) == sorted(f"What is {n} + 1?" for n in range(10))
+    assert {skill for _, _, _, skill in batch} == {'addition'}
+    for text, answer, options, _ in batch:
+        assert len(set(options)) == 4
+        assert answer in options
+    # A store without the grade leaves the generator in charge
+    text, answer, options, skill = GradeSource('5th', seed=3, open_store=lambda: store)(1)[0]
+    assert not text.startswith("What is")
+    store.close()
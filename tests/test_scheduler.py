@@ -0,0 +1,47 @@
+from game.scheduler import Scheduler
+
+
+def test_after_runs_once_when_due():
+    scheduler = Scheduler()
+    calls = []
+    scheduler.after(0.5, lambda: calls.append(scheduler.time))
+    for _ in range(4):
+        scheduler.update(0.125)
+    assert calls == [0.5]
+    scheduler.update(1.0)
+    assert len(calls) == 1
+
+
+def test_every_repeats_until_callback_returns_false():
+    scheduler = Scheduler()
+    ticks = []
+
+    def tick():
+        ticks.append(scheduler.time)
+        return len(ticks) < 3
+
+    scheduler.every(0.1, tick)
+    for _ in range(10):
+        scheduler.update(0.1)
+    assert len(ticks) == 3
+
+
+def test_due_timers_run_in_due_order():
+    scheduler = Scheduler()
+    order = []
+    scheduler.after(0.3, lambda: order.append('late'))
+    scheduler.after(0.1, lambda: order.append('early'))
+    scheduler.after(0.1, lambda: order.append('early, added second'))
+    scheduler.update(1.0)
+    assert order == ['early', 'early, added second', 'late']
+
+
+def test_cancel_and_clear():
+    scheduler = Scheduler()
+    calls = []
+    timer = scheduler.after(0.1, lambda: calls.append('cancelled'))
+    timer.cancel()
+    scheduler.every(0.1, lambda: calls.append('cleared'))
+    scheduler.clear()
+    scheduler.update(1.0)
+    assert calls == []
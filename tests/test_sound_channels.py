@@ -0,0 +1,51 @@
+from game.sound_manager import SoundManager
+
+
+class FakeChannel:
+    def __init__(self):
+        self.busy = False
+
+    def get_busy(self):
+        return self.busy
+
+
+def manager_with(channels):
+    # Only the channel pool is needed, not the mixer or any sound files
+    manager = SoundManager.__new__(SoundManager)
+    manager.channels = [FakeChannel() for _ in range(channels)]
+    manager.voices = [None] * channels
+    manager.play_count = 0
+    manager.stats = {'played': 0, 'dropped': 0, 'stolen': 0}
+    return manager
+
+
+def start(manager, index, name, priority):
+    manager.play_count += 1
+    manager.channels[index].busy = True
+    manager.voices[index] = (name, priority, manager.play_count)
+
+
+def test_free_channels_are_used_first():
+    manager = manager_with(3)
+    start(manager, 0, 'jump', 1)
+    assert manager.pick_channel('click', 1, 2) == 1
+    manager.channels[0].busy = False  # Finished playing
+    assert manager.pick_channel('click', 1, 2) == 0
+
+
+def test_voice_limit_restarts_the_oldest_voice():
+    manager = manager_with(4)
+    start(manager, 2, 'jump', 1)
+    start(manager, 0, 'jump', 1)
+    assert manager.pick_channel('jump', 2, 1) == 2
+    assert manager.stats['stolen'] == 1
+
+
+def test_full_pool_steals_only_from_lower_or_equal_priority():
+    manager = manager_with(2)
+    start(manager, 0, 'game_over', 4)
+    start(manager, 1, 'jump', 1)
+    assert manager.pick_channel('correct', 1, 3) == 1
+    start(manager, 1, 'correct', 3)
+    assert manager.pick_channel('click', 1, 2) is None
+    assert manager.stats == {'played': 0, 'dropped': 1, 'stolen': 1}
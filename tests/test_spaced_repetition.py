@@ -0,0 +1,75 @@
+from fractions import Fraction
+from game.spaced_repetition import RELEARN_GAP, ReviewScheduler, StudentSchedule
+import json
+import random
+
+QUESTION = ("3 + 4 = ?", 7, [5, 7, 8, 9], 'addition')
+FRACTION_QUESTION = ("1/2 + 1/3 = ?", Fraction(5, 6), [Fraction(5, 6), Fraction(2, 5), 1, Fraction(1, 6)],
+                     'unlike_fractions')
+
+
+def fresh(counter):
+    def new_question():
+        counter.append(1)
+        return ("new = ?", 0, [0, 1, 2, 3], 'other')
+    return new_question
+
+
+def test_missed_question_comes_back_after_the_relearn_gap():
+    schedule = StudentSchedule(random.Random(1))
+    asked = []
+    assert schedule.next_question(fresh(asked))[0] == "new = ?"
+    schedule.record(QUESTION, False)
+    for _ in range(RELEARN_GAP - 1):
+        assert schedule.next_question(fresh(asked))[0] == "new = ?"
+    text, answer, options, skill = schedule.next_question(fresh(asked))
+    assert (text, answer, sorted(options), skill) == (QUESTION[0], 7, [5, 7, 8, 9], 'addition')
+    assert len(asked) == RELEARN_GAP
+
+
+def test_right_answers_push_the_review_further_out():
+    schedule = StudentSchedule(random.Random(2))
+    gaps = []
+    for _ in range(4):
+        schedule.next_question(fresh([]))
+        schedule.record(QUESTION, True)
+        gaps.append(schedule.items[QUESTION[0]].due - schedule.now)
+    assert gaps == sorted(gaps) and gaps[0] < gaps[-1]
+
+
+def test_save_and_load_keep_fraction_answers(tmp_path):
+    path = str(tmp_path / 'review.json')
+    review = ReviewScheduler(path, seed=3)
+    review.load()
+    review.record('ana', FRACTION_QUESTION, False)
+    review.record('ana', QUESTION, True)
+    review.save()
+
+    loaded = ReviewScheduler(path, seed=3)
+    loaded.load()
+    items = loaded.student('ana').items
+    assert items[FRACTION_QUESTION[0]].question == FRACTION_QUESTION
+    assert items[QUESTION[0]].question == QUESTION
+    assert items[QUESTION[0]].correct == 1
+
+
+def test_save_does_nothing_until_loaded(tmp_path):
+    path = tmp_path / 'review.json'
+    path.write_text(json.dumps({'ana': {'now': 5, 'items': {}}}))
+    review = ReviewScheduler(str(path))
+    review.record('ben', QUESTION, True)
+    review.save()
+    assert json.loads(path.read_text()) == {'ana': {'now': 5, 'items': {}}}
+
+    review.load()
+    assert review.student('ana').now == 5
+    assert len(review.student('ben')) == 1  # Recorded before the load and kept
+
+
+def test_progress_saved_without_skills_still_loads(tmp_path):
+    path = tmp_path / 'review.json'
+    path.write_text(json.dumps({'ana': {'now': 1, 'items': {
+        "6 × 7 = ?": [["6 × 7 = ?", 42, [40, 42, 48, 49]], 1, 0, 2.5, 1, 0]}}}))
+    review = ReviewScheduler(str(path))
+    review.load()
+    assert review.student('ana').items["6 × 7 = ?"].question == ("6 × 7 = ?", 42, [40, 42, 48, 49], 'multiplication')
@@ -0,0 +1,53 @@
+import pygame
+from game.spatial_hash import IndexedGroup, SpatialHash
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, x, y, w=50, h=12):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, w, h)
+
+    def update(self, scroll):
+        self.rect.y += scroll
+
+
+def test_query_finds_sprites_in_overlapping_rows_only():
+    index = SpatialHash(100)
+    near, far = Box(0, 10), Box(0, 450)
+    index.insert(near)
+    index.insert(far)
+    assert index.query(pygame.Rect(0, 0, 10, 50)) == [near]
+    assert index.query(pygame.Rect(0, 400, 10, 100)) == [far]
+
+
+def test_sprite_spanning_rows_is_returned_once():
+    index = SpatialHash(100)
+    tall = Box(0, 90, h=30)
+    index.insert(tall)
+    assert index.query(pygame.Rect(0, 0, 10, 200)) == [tall]
+    index.remove(tall)
+    assert index.query(pygame.Rect(0, 0, 10, 200)) == []
+    assert not index.buckets
+
+
+def test_scroll_moves_the_index_without_rebucketing():
+    group = IndexedGroup(100)
+    box = Box(0, 10)
+    group.add(box)
+    rows = dict(group.index.sprite_rows)
+    group.update(250)
+    assert box.rect.y == 260
+    assert group.index.sprite_rows == rows
+    assert group.collide(pygame.Rect(0, 255, 10, 10)) == [box]
+    assert not group.collide_any(pygame.Rect(0, 0, 10, 20))
+
+
+def test_topmost_follows_kills():
+    group = IndexedGroup(100)
+    boxes = [Box(0, y) for y in (300, -50, 120)]
+    group.add(*boxes)
+    assert group.topmost() is boxes[1]
+    boxes[1].kill()
+    assert group.topmost() is boxes[2]
+    group.empty()
+    assert group.topmost() is None
@@ -0,0 +1,71 @@
+import pygame
+from game.spatial_hash import IndexedGroup
+from game.sprite_pool import SpritePool
+
+
+class Falling(pygame.sprite.Sprite):
+    def __init__(self, y):
+        super().__init__()
+        self.reset(y)
+
+    def reset(self, y):
+        self.rect = pygame.Rect(0, y, 10, 10)
+
+    def update(self, scroll):
+        self.rect.y += scroll
+        if self.rect.top > 100:
+            self.kill()
+
+
+def make_group():
+    pool = SpritePool(Falling)
+    group = IndexedGroup(50)
+    group.pool = pool
+    return group, pool
+
+
+def test_culled_sprites_are_reused():
+    group, pool = make_group()
+    first = pool.acquire(90)
+    group.add(first)
+    group.update(20)
+    assert not first.alive()
+    assert pool.free == [first]
+    second = pool.acquire(0)
+    assert second is first and second.rect.y == 0
+    assert pool.stats()['reused'] == 1
+
+
+def test_remove_and_empty_do_not_release():
+    group, pool = make_group()
+    kept, other = pool.acquire(0), pool.acquire(10)
+    group.add(kept, other)
+    group.remove(kept)
+    group.empty()
+    assert pool.free == []
+
+
+def test_recycle_releases_every_member():
+    group, pool = make_group()
+    sprites = [pool.acquire(y) for y in (0, 10, 20)]
+    group.add(*sprites)
+    group.recycle()
+    assert len(group) == 0
+    assert sorted(map(id, pool.free)) == sorted(map(id, sprites))
+
+
+def test_release_images_only_touches_free_sprites():
+    class Animated(Falling):
+        def reset(self, y):
+            super().reset(y)
+            self.frames = ['frame']
+
+        def release_images(self):
+            self.frames = []
+
+    pool = SpritePool(Animated)
+    live, freed = pool.acquire(0), pool.acquire(0)
+    pool.release(freed)
+    pool.release_images()
+    assert freed.frames == [] and live.frames == ['frame']
+    assert pool.acquire(5).frames == ['frame']
@@ -0,0 +1,39 @@
+from game.startup_trace import TRACE_ENV, StartupTracer
+
+
+def test_disabled_tracer_records_nothing(monkeypatch, capsys):
+    monkeypatch.delenv(TRACE_ENV, raising=False)
+    tracer = StartupTracer()
+    with tracer.phase('fonts'):
+        pass
+    tracer.first_frame()
+    assert tracer.phases == []
+    assert capsys.readouterr().out == ""
+
+
+def test_phases_are_reported_once_at_the_first_frame(tmp_path, monkeypatch, capsys):
+    monkeypatch.delenv(TRACE_ENV, raising=False)
+    output = tmp_path / 'trace.txt'
+    tracer = StartupTracer()
+    tracer.enable(str(output))
+    tracer.since_start('imports')
+    with tracer.phase('fonts'):
+        pass
+    tracer.first_frame()
+    with tracer.phase('after the first frame'):
+        pass
+    tracer.first_frame()
+
+    assert [name for name, _ in tracer.phases] == ['imports', 'fonts']
+    printed = capsys.readouterr().out
+    assert printed.count("Startup trace") == 1
+    assert "fonts" in printed and "other" in printed
+    assert output.read_text() == printed
+
+
+def test_environment_variable_enables_tracing(tmp_path, monkeypatch):
+    monkeypatch.setenv(TRACE_ENV, '1')
+    tracer = StartupTracer()
+    assert tracer.enabled and tracer.output is None
+    monkeypatch.setenv(TRACE_ENV, str(tmp_path / 'trace.txt'))
+    assert StartupTracer().output == str(tmp_path / 'trace.txt')
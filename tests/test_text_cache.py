@@ -0,0 +1,37 @@
+import pygame
+import pytest
+from game.text_cache import DigitAtlas, TextCache
+
+
+@pytest.fixture(scope='module')
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 24)
+
+
+def test_repeated_text_is_rendered_once(font):
+    cache = TextCache()
+    first = cache.render(font, "Score", (255, 255, 255))
+    assert cache.render(font, "Score", [255, 255, 255]) is first
+    assert cache.render(font, "Score", (0, 0, 0)) is not first
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_text_is_dropped(font):
+    cache = TextCache(limit=2)
+    a = cache.render(font, "a", (0, 0, 0))
+    cache.render(font, "b", (0, 0, 0))
+    cache.render(font, "a", (0, 0, 0))
+    cache.render(font, "c", (0, 0, 0))  # Drops "b"
+    assert cache.render(font, "a", (0, 0, 0)) is a
+    assert len(cache.surfaces) == 2
+    cache.render(font, "b", (0, 0, 0))
+    assert cache.misses == 4
+
+
+def test_atlas_draws_numbers_glyph_by_glyph(font):
+    atlas = DigitAtlas(font, (255, 255, 255))
+    surface = pygame.Surface((200, 40))
+    widths = {char: glyph.get_width() for char, glyph in atlas.glyphs.items()}
+    assert atlas.draw(surface, -305, 10, 0) == 10 + widths['-'] + widths['3'] + widths['0'] + widths['5']
+    assert atlas.draw(surface, 7.9, 0, 0) == widths['7']
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+import pygame
+import pytest
+from game.resource_manager import ResourceManager
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(ResourceManager, 'transform_cache', OrderedDict())
+    for counter in ('transform_hits', 'transform_misses', 'transform_evictions'):
+        monkeypatch.setattr(ResourceManager, counter, 0)
+    return ResourceManager
+
+
+def test_identical_requests_share_one_surface(cache):
+    source = pygame.Surface((20, 10))
+    scaled = cache.get_transformed(source, (40, 20))
+    assert scaled.get_size() == (40, 20)
+    assert cache.get_transformed(source, (40, 20)) is scaled
+    assert cache.get_transformed(source, (40, 20), flip_x=True) is not scaled
+    assert cache.get_transformed(source) is source
+    stats = cache.transform_cache_stats()
+    assert (stats['hits'], stats['misses']) == (1, 3)
+
+
+def test_least_recently_used_entries_are_evicted(cache, monkeypatch):
+    monkeypatch.setattr(ResourceManager, 'transform_cache_limit', 2)
+    source = pygame.Surface((10, 10))
+    small = cache.get_transformed(source, (5, 5))
+    cache.get_transformed(source, (6, 6))
+    cache.get_transformed(source, (5, 5))   # Now the most recently used
+    cache.get_transformed(source, (7, 7))   # Evicts (6, 6)
+    assert cache.get_transformed(source, (5, 5)) is small
+    assert cache.transform_cache_stats()['evictions'] == 1
+    assert len(cache.transform_cache) == 2
+
+
+def test_purge_drops_variants_of_released_sources(cache):
+    kept, released = pygame.Surface((10, 10)), pygame.Surface((10, 10))
+    cache.get_transformed(kept, flip_x=True)
+    cache.get_transformed(released, flip_x=True)
+    cache.seed_transform(released, (10, 10), False, pygame.Surface((10, 10)))
+    cache.purge_transforms([released])
+    assert [key[0] for key in cache.transform_cache] == [id(kept)]